@@ -0,0 +1,65 @@
+"""Benchmark for tabulardf.rows.iter_row_dicts.
+
+Compares row dict construction via tabulardf.rows.iter_row_dicts
+against the DataFrame.iterrows/Series.to_dict approach.
+
+Run with 'python benchmarks/bench_rows.py [ROWS] [COLUMNS]'.
+"""
+
+import sys
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from tabulardf.rows import iter_row_dicts
+
+
+def get_dataframe(rows: int, columns: int) -> pd.DataFrame:
+    """Construct a mixed-dtype dataframe for benchmarking."""
+    rng = np.random.default_rng(0)
+
+    data = {}
+    for column in range(columns):
+        match column % 3:
+            case 0:
+                data[f"int_{column}"] = rng.integers(0, 1000, rows)
+            case 1:
+                data[f"float_{column}"] = rng.random(rows)
+            case 2:
+                data[f"str_{column}"] = rng.choice(["a", "b", "c"], rows)
+
+    return pd.DataFrame(data)
+
+
+def iterrows_dicts(dataframe: pd.DataFrame) -> None:
+    """Consume row dicts obtained via DataFrame.iterrows."""
+    for _, row in dataframe.iterrows():
+        row.to_dict()
+
+
+def row_source_dicts(dataframe: pd.DataFrame) -> None:
+    """Consume row dicts obtained via tabulardf.rows.iter_row_dicts."""
+    for _ in iter_row_dicts(dataframe):
+        pass
+
+
+def main(rows: int = 100_000, columns: int = 12) -> None:
+    """Run the benchmark and print timings."""
+    dataframe = get_dataframe(rows, columns)
+
+    iterrows_time = min(
+        timeit.repeat(lambda: iterrows_dicts(dataframe), number=1, repeat=3)
+    )
+    row_source_time = min(
+        timeit.repeat(lambda: row_source_dicts(dataframe), number=1, repeat=3)
+    )
+
+    print(f"{rows} rows x {columns} columns")
+    print(f"iterrows/to_dict: {iterrows_time:.3f}s ({rows / iterrows_time:,.0f} rows/s)")
+    print(f"iter_row_dicts:   {row_source_time:.3f}s ({rows / row_source_time:,.0f} rows/s)")
+    print(f"speedup:          {iterrows_time / row_source_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
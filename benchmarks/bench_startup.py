@@ -0,0 +1,76 @@
+"""Benchmark for tacl CLI startup time.
+
+Measures the wall time of fresh interpreter processes
+importing tabulardf.tacl and running 'tacl --help' / 'tacl graph --help',
+against a bare interpreter baseline.
+Exits with status 1 if heavy dependencies (pandas, rdflib, jinja2) are imported on startup
+or if a median exceeds MAX_SECONDS (optional).
+
+Run with 'python benchmarks/bench_startup.py [REPEAT] [MAX_SECONDS]'.
+"""
+
+import statistics
+import subprocess
+import sys
+import time
+
+
+HEAVY_MODULES = ("pandas", "rdflib", "jinja2")
+
+CASES = {
+    "python": "pass",
+    "import tabulardf.tacl": "import tabulardf.tacl",
+    "tacl --help": (
+        "from tabulardf.tacl import tacl; "
+        "tacl(['--help'], standalone_mode=False)"
+    ),
+    "tacl graph --help": (
+        "from tabulardf.tacl import tacl; "
+        "tacl(['graph', '--help'], standalone_mode=False)"
+    ),
+}
+
+_CHECK_MODULES = (
+    "; import sys; "
+    f"sys.exit(any(module in sys.modules for module in {HEAVY_MODULES!r}))"
+)
+
+
+def run(code: str) -> float:
+    """Run code in a fresh interpreter and get the wall time."""
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", code], check=True, capture_output=True)
+
+    return time.perf_counter() - start
+
+
+def main(repeat: int = 10, max_seconds: float | None = None) -> None:
+    """Run the benchmark and print median timings."""
+    failed = False
+
+    for name, code in CASES.items():
+        median = statistics.median(run(code) for _ in range(repeat))
+        print(f"{name:<24}{median * 1000:8.1f}ms")
+
+        if max_seconds is not None and name != "python" and median > max_seconds:
+            print(f"  exceeds {max_seconds * 1000:.1f}ms")
+            failed = True
+
+        heavy_imports = subprocess.run(
+            [sys.executable, "-c", code + _CHECK_MODULES],
+            capture_output=True
+        ).returncode
+        if heavy_imports:
+            print(f"  imports one of {', '.join(HEAVY_MODULES)}")
+            failed = True
+
+    sys.exit(failed)
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+
+    main(
+        repeat=int(args[0]) if args else 10,
+        max_seconds=float(args[1]) if len(args) > 1 else None
+    )
@@ -0,0 +1,339 @@
+"""Benchmark suite for TabulaRDF converters.
+
+Runs every converter against a synthetic table (see synthetic.py)
+and reports rows/s, triples/s and peak traced memory per case.
+Results can be stored as JSON and compared against a stored baseline;
+the suite exits with status 1 if a case is slower than the baseline by more than --tolerance.
+
+Run with e.g.
+  'python benchmarks/suite.py --rows 10000 --columns 8 --null-ratio 0.1 --json baseline.json'
+  'python benchmarks/suite.py --rows 10000 --columns 8 --null-ratio 0.1 --baseline baseline.json'
+"""
+
+import argparse
+import json
+import pathlib
+import sys
+import time
+import tracemalloc
+
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+
+import pandas as pd
+
+from jinja2 import Template
+from rdflib import Literal, Namespace, URIRef
+
+from synthetic import DTYPES, generate_table
+from tabulardf import (
+    FieldGraphConverter,
+    RowGraphConverter,
+    TemplateConverter,
+    TemplateGraphConverter
+)
+from tabulardf.rules import literal_rule
+
+
+EX = Namespace("http://example.org/")
+
+# a case gets passed a table and returns a run callable (timed);
+# run callables return the number of generated triples
+_Case = Callable[[pd.DataFrame], Callable[[], int]]
+
+
+@dataclass
+class CaseResult:
+    """Benchmark result of a single case."""
+
+    name: str
+    rows: int
+    triples: int
+    seconds: float
+    peak_memory: int
+
+    @property
+    def rows_per_second(self) -> float:
+        """Get the row throughput."""
+        return self.rows / self.seconds
+
+    @property
+    def triples_per_second(self) -> float:
+        """Get the triple throughput."""
+        return self.triples / self.seconds
+
+
+def _get_data_columns(dataframe: pd.DataFrame) -> list[str]:
+    """Get all columns except the id column."""
+    return [column for column in dataframe.columns if column != "id"]
+
+
+def _get_turtle_template(dataframe: pd.DataFrame, row: str = "row_data") -> str:
+    """Get a Turtle template source for a row variable; missing values (NaN != NaN) are skipped."""
+    statements = "\n".join(
+        f"{{% if {row}['{column}'] == {row}['{column}'] %}}"
+        f"ex:row{{{{ {row}['id'] }}}} ex:{column} \"{{{{ {row}['{column}'] }}}}\" ."
+        "{% endif %}"
+        for column in _get_data_columns(dataframe)
+    )
+
+    return f"@prefix ex: <{EX}> .\n{statements}\n"
+
+
+def render(dataframe: pd.DataFrame) -> Callable[[], int]:
+    """TemplateConverter.render (table strategy)."""
+    template = Template(
+        "{% for row in table_data %}"
+        + _get_turtle_template(dataframe, row="row")
+        + "{% endfor %}"
+    )
+    converter = TemplateConverter(dataframe=dataframe, template=template)
+
+    def _run() -> int:
+        converter.render()
+        return 0
+
+    return _run
+
+
+def render_by_row(dataframe: pd.DataFrame) -> Callable[[], int]:
+    """TemplateConverter.render_by_row (row strategy)."""
+    converter = TemplateConverter(
+        dataframe=dataframe,
+        template=Template(_get_turtle_template(dataframe))
+    )
+
+    def _run() -> int:
+        for _ in converter.render_by_row():
+            pass
+        return 0
+
+    return _run
+
+
+def _template_graph(parse_batch_size: int) -> _Case:
+    """TemplateGraphConverter.to_graph."""
+    def _case(dataframe: pd.DataFrame) -> Callable[[], int]:
+        template = Template(_get_turtle_template(dataframe))
+
+        return lambda: len(
+            TemplateGraphConverter(
+                dataframe=dataframe,
+                template=template,
+                parse_batch_size=parse_batch_size
+            ).to_graph()
+        )
+
+    return _case
+
+
+def _literal_triples(subject: URIRef, column: str, value) -> tuple:
+    """Get a literal triple for a field."""
+    return (subject, EX[column], Literal(value))
+
+
+def row_graph(dataframe: pd.DataFrame) -> Callable[[], int]:
+    """RowGraphConverter.to_graph."""
+    columns = _get_data_columns(dataframe)
+
+    def row_rule(row: dict):
+        subject = EX[f"row{row['id']}"]
+
+        for column in columns:
+            if pd.notna(row[column]):
+                yield _literal_triples(subject, column, row[column])
+
+    return lambda: len(RowGraphConverter(dataframe, row_rule=row_rule).to_graph())
+
+
+def field_graph(dataframe: pd.DataFrame) -> Callable[[], int]:
+    """FieldGraphConverter.to_graph with per-field rules."""
+    def _field_rule(column: str):
+        def _rule(subject, value, store):
+            if pd.notna(value):
+                return _literal_triples(subject, column, value)
+
+        return _rule
+
+    column_rules = {column: _field_rule(column) for column in _get_data_columns(dataframe)}
+
+    return lambda: len(
+        FieldGraphConverter(
+            dataframe,
+            subject_column="id",
+            subject_rule=lambda value: EX[f"row{value}"],
+            column_rules=column_rules
+        ).to_graph()
+    )
+
+
+def field_graph_column_rules(dataframe: pd.DataFrame) -> Callable[[], int]:
+    """FieldGraphConverter.to_graph with vectorized column rules."""
+    column_rules = {
+        column: literal_rule(EX[column])
+        for column in _get_data_columns(dataframe)
+    }
+
+    return lambda: len(
+        FieldGraphConverter(
+            dataframe,
+            subject_column="id",
+            subject_rule=lambda value: EX[f"row{value}"],
+            column_rules=column_rules
+        ).to_graph()
+    )
+
+
+def _serialize(format: str) -> _Case:
+    """_GraphConverter.serialize."""
+    def _case(dataframe: pd.DataFrame) -> Callable[[], int]:
+        converter = FieldGraphConverter(
+            dataframe,
+            subject_column="id",
+            subject_rule=lambda value: EX[f"row{value}"],
+            column_rules={
+                column: literal_rule(EX[column])
+                for column in _get_data_columns(dataframe)
+            }
+        )
+        graph = converter.to_graph()
+
+        def _run() -> int:
+            converter.serialize(format=format)
+            return len(graph)
+
+        return _run
+
+    return _case
+
+
+CASES: dict[str, _Case] = {
+    "render": render,
+    "render_by_row": render_by_row,
+    "template_graph": _template_graph(parse_batch_size=1),
+    "template_graph_batched": _template_graph(parse_batch_size=100),
+    "row_graph": row_graph,
+    "field_graph": field_graph,
+    "field_graph_column_rules": field_graph_column_rules,
+    "serialize_ttl": _serialize("ttl"),
+    "serialize_nt": _serialize("nt"),
+}
+
+
+def run_case(name: str, dataframe: pd.DataFrame, repeat: int) -> CaseResult:
+    """Run a case and get the best time of repeat runs.
+
+    Peak memory is measured in a separate (traced) run,
+    since tracemalloc slows down allocations.
+    """
+    run = CASES[name](dataframe)
+
+    seconds = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        triples = run()
+        seconds = min(seconds, time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        run()
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return CaseResult(
+        name=name,
+        rows=len(dataframe),
+        triples=triples,
+        seconds=seconds,
+        peak_memory=peak_memory
+    )
+
+
+def compare(results: list[CaseResult],
+            baseline: dict[str, dict],
+            tolerance: float) -> list[str]:
+    """Compare results against a baseline.
+
+    Returns the names of cases with a row throughput
+    below (1 - tolerance) times the baseline throughput.
+    """
+    regressions = []
+
+    for result in results:
+        if result.name not in baseline:
+            continue
+
+        baseline_result = CaseResult(**baseline[result.name])
+        ratio = result.rows_per_second / baseline_result.rows_per_second
+        memory_ratio = result.peak_memory / max(baseline_result.peak_memory, 1)
+
+        print(f"{result.name:<28}{ratio:8.2f}x speed {memory_ratio:8.2f}x memory")
+
+        if ratio < 1 - tolerance:
+            regressions.append(result.name)
+
+    return regressions
+
+
+def print_results(results: list[CaseResult]) -> None:
+    """Print a result table."""
+    print(f"{'case':<28}{'seconds':>10}{'rows/s':>14}{'triples/s':>14}{'peak MiB':>10}")
+
+    for result in results:
+        print(
+            f"{result.name:<28}"
+            f"{result.seconds:10.3f}"
+            f"{result.rows_per_second:14,.0f}"
+            f"{result.triples_per_second:14,.0f}"
+            f"{result.peak_memory / 2 ** 20:10.1f}"
+        )
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmark suite."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--columns", type=int, default=8)
+    parser.add_argument("--dtypes", nargs="+", choices=DTYPES, default=list(DTYPES))
+    parser.add_argument("--null-ratio", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--cases", nargs="+", choices=list(CASES), default=list(CASES))
+    parser.add_argument("--json", type=pathlib.Path, help="Write results to a JSON file.")
+    parser.add_argument("--baseline", type=pathlib.Path, help="Compare results to a JSON file.")
+    parser.add_argument("--tolerance", type=float, default=0.1,
+                        help="Accepted relative throughput loss against the baseline.")
+    args = parser.parse_args(argv)
+
+    dataframe = generate_table(
+        args.rows,
+        args.columns,
+        dtypes=args.dtypes,
+        null_ratio=args.null_ratio,
+        seed=args.seed
+    )
+
+    print(f"{args.rows} rows x {args.columns} columns ({', '.join(args.dtypes)}), "
+          f"null ratio {args.null_ratio}")
+
+    results = [run_case(name, dataframe, args.repeat) for name in args.cases]
+    print_results(results)
+
+    if args.json:
+        args.json.write_text(
+            json.dumps({result.name: asdict(result) for result in results}, indent=2)
+        )
+
+    if args.baseline:
+        regressions = compare(results, json.loads(args.baseline.read_text()), args.tolerance)
+
+        if regressions:
+            print(f"Regressions: {', '.join(regressions)}")
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
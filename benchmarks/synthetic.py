@@ -0,0 +1,64 @@
+"""Deterministic synthetic tables for TabulaRDF benchmarks.
+
+Tables have a unique integer 'id' column followed by data columns
+cycling through the requested dtypes; missing values are distributed
+according to null_ratio. Equal arguments always generate equal tables.
+"""
+
+from collections.abc import Sequence
+
+import numpy as np
+import pandas as pd
+
+
+DTYPES = ("int", "float", "str", "bool", "datetime")
+
+
+def _generate_column(rng: np.random.Generator, dtype: str, rows: int) -> pd.Series:
+    """Generate a column of a dtype."""
+    match dtype:
+        case "int":
+            return pd.Series(rng.integers(0, 10_000, rows))
+        case "float":
+            return pd.Series(rng.random(rows) * 1000)
+        case "str":
+            words = np.array([f"value{i}" for i in range(100)])
+            return pd.Series(rng.choice(words, rows), dtype=object)
+        case "bool":
+            return pd.Series(rng.random(rows) < 0.5)
+        case "datetime":
+            return pd.Series(
+                pd.Timestamp("2000-01-01") + pd.to_timedelta(rng.integers(0, 10_000, rows), unit="D")
+            )
+        case _:
+            raise ValueError(f"Unknown dtype '{dtype}'. Available dtypes: {', '.join(DTYPES)}.")
+
+
+def generate_table(rows: int,
+                   columns: int,
+                   *,
+                   dtypes: Sequence[str] = DTYPES,
+                   null_ratio: float = 0.0,
+                   seed: int = 0) -> pd.DataFrame:
+    """Generate a synthetic table.
+
+    Data columns are named '<dtype>_<position>', e.g. 'float_1'.
+    null_ratio is the fraction of missing values per data column;
+    note that missing values make int and bool columns object/float columns like in pandas.
+    """
+    if not 0 <= null_ratio <= 1:
+        raise ValueError(f"null_ratio must be between 0 and 1, got '{null_ratio}'.")
+
+    rng = np.random.default_rng(seed)
+    data = {"id": pd.Series(np.arange(rows))}
+
+    for position in range(columns):
+        dtype = dtypes[position % len(dtypes)]
+        column = _generate_column(rng, dtype, rows)
+
+        if null_ratio:
+            column = column.mask(rng.random(rows) < null_ratio)
+
+        data[f"{dtype}_{position}"] = column
+
+    return pd.DataFrame(data)
@@ -1,8 +1,49 @@
-"""Module level imports."""
-
-from tabulardf.converters import (
-    TemplateConverter,
-    TemplateGraphConverter,
-    FieldGraphConverter,
-    RowGraphConverter
-)
+"""Module level imports.
+
+Converters are imported lazily (PEP 562), so importing tabulardf
+(e.g. for the tacl CLI) does not import pandas, rdflib and jinja2 up front.
+"""
+
+import importlib
+
+from typing import TYPE_CHECKING, Any
+
+
+if TYPE_CHECKING:
+    from tabulardf.converters import (
+        TemplateConverter,
+        TemplateGraphConverter,
+        FieldGraphConverter,
+        RowGraphConverter,
+        RenderingParseError
+    )
+
+
+_lazy_imports: dict[str, str] = {
+    "TemplateConverter": "tabulardf.converters",
+    "TemplateGraphConverter": "tabulardf.converters",
+    "FieldGraphConverter": "tabulardf.converters",
+    "RowGraphConverter": "tabulardf.converters",
+    "RenderingParseError": "tabulardf.converters",
+}
+
+__all__ = list(_lazy_imports)
+
+
+def __getattr__(name: str) -> Any:
+    """Import public symbols on first access."""
+    try:
+        module_name = _lazy_imports[name]
+    except KeyError:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'") from None
+
+    value = getattr(importlib.import_module(module_name), name)
+    # cache, so __getattr__ is only called once per name
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module attributes including lazy imports."""
+    return sorted([*globals(), *_lazy_imports])
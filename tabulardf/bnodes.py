@@ -0,0 +1,89 @@
+"""Blank node handling for TabulaRDF graph converters.
+
+Functionality for merging subgraphs (e.g. row or field graphs)
+without blank node collisions.
+"""
+
+import itertools
+import os
+import uuid
+
+from typing import Any, Generator, Iterable, Optional
+
+from rdflib import BNode
+
+from tabulardf.tabulardf_types import _Triple
+
+
+class BNodeRenamer:
+    """Counter-based blank node renaming for subgraph merging.
+
+    Blank nodes are scoped to the subgraph they occur in,
+    so merging subgraphs that share blank node labels (e.g. BNode("x") in every row graph)
+    would conflate distinct blank nodes. BNodeRenamer.rename maps every blank node
+    of a subgraph to a fresh blank node labelled with a prefix and a counter;
+    unlike skolemization, terms are only constructed for blank nodes.
+
+    The prefix is unique per renamer and process,
+    so subgraphs renamed in parallel (e.g. in worker processes) do not collide either.
+    """
+
+    def __init__(self) -> None:
+        """Initialize a BNodeRenamer."""
+        self._pid = None
+        self._prefix = ""
+        self._counter = itertools.count()
+
+    def _get_prefix(self) -> str:
+        """Get the label prefix, renewed in forked processes."""
+        if self._pid != (pid := os.getpid()):
+            self._pid = pid
+            self._prefix = f"b{uuid.uuid4().hex[:16]}_"
+            self._counter = itertools.count()
+
+        return self._prefix
+
+    def rename_node(self, node: Any, scope: dict[BNode, BNode]) -> Any:
+        """Get the renamed blank node for node in a scope (a blank node mapping).
+
+        Terms other than blank nodes are returned as is.
+        """
+        if not isinstance(node, BNode):
+            return node
+
+        renamed = scope.get(node)
+
+        if renamed is None:
+            renamed = scope[node] = BNode(f"{self._get_prefix()}{next(self._counter)}")
+
+        return renamed
+
+    def rename(self,
+               triples: Iterable[_Triple],
+               scope: Optional[dict[BNode, BNode]] = None) -> Generator[_Triple, None, None]:
+        """Rename the blank nodes of a subgraph.
+
+        Every call is a blank node scope: equal blank nodes within the triples
+        get the same fresh blank node, blank nodes of different calls never collide.
+        If a scope is given, it is used (and updated) as blank node mapping instead,
+        so e.g. blank nodes can be shared by several subgraphs.
+        """
+        prefix = self._get_prefix()
+        counter = self._counter
+        mapping: dict[BNode, BNode] = {} if scope is None else scope
+
+        def _rename(bnode: BNode) -> BNode:
+            renamed = mapping.get(bnode)
+
+            if renamed is None:
+                renamed = mapping[bnode] = BNode(f"{prefix}{next(counter)}")
+
+            return renamed
+
+        for s, p, o in triples:
+            if isinstance(s, BNode):
+                s = _rename(s)
+            if isinstance(o, BNode):
+                o = _rename(o)
+
+            yield s, p, o
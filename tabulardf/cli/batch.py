@@ -0,0 +1,220 @@
+"""Multi-partition batch conversions for the TabulaRDF CLI.
+
+Functionality for converting every group of rows sharing a value in a column
+to its own output file in a single run.
+"""
+
+import itertools
+import pathlib
+import re
+
+from typing import Any, Callable, Iterator, Optional
+
+import pandas as pd
+
+from tabulardf import TemplateConverter, TemplateGraphConverter
+from tabulardf.cli.converter_setup import (
+    _get_context_data,
+    get_template_dataframe,
+    initialize_group_converters
+)
+from tabulardf.cli.dataframe_utils import group_dataframe
+from tabulardf.cli.table_cache import TableCache
+from tabulardf.parallel import imap_ordered
+from tabulardf.profiling import NULL_PROFILER, Profiler
+
+
+_WriteOutput = Callable[[TemplateConverter, pathlib.Path], None]
+
+_UNSAFE_FILENAME_CHARACTERS = re.compile(r"[^\w.-]+")
+
+
+class OutputPatternError(Exception):  # noqa: D204
+    """Exception type for invalid output patterns."""
+    pass
+
+
+def _sanitize(value: Any) -> str:
+    """Get a filename-safe representation of a value."""
+    return _UNSAFE_FILENAME_CHARACTERS.sub("_", str(value)).strip("_") or "_"
+
+
+def get_output_path(output_pattern: str,
+                    column: str,
+                    value: Any,
+                    index: int) -> pathlib.Path:
+    """Get the output path for a group.
+
+    The output pattern is a str.format pattern with the placeholders
+    {value} (the group value), {column} (the group_by column) and {index} (the group number);
+    values are sanitized for use in file names.
+    """
+    try:
+        return pathlib.Path(
+            output_pattern.format(value=_sanitize(value), column=_sanitize(column), index=index)
+        )
+    except (KeyError, IndexError, ValueError) as e:
+        raise OutputPatternError(
+            f"Invalid output pattern '{output_pattern}': {e!r}. "
+            "Available placeholders: {value}, {column}, {index}."
+        ) from None
+
+
+def write_rendering(converter: TemplateConverter,
+                    path: pathlib.Path,
+                    render_by_row: bool = False) -> None:
+    """Write the rendering(s) of a TemplateConverter to path."""
+    with open(path, mode="w", encoding="utf-8") as f:
+        if render_by_row:
+            f.writelines(f"{rendering}\n" for rendering in converter.render_by_row())
+        else:
+            f.write(f"{converter.render()}\n")
+
+
+def write_graph(converter: TemplateGraphConverter,
+                path: pathlib.Path,
+                format: str = "ttl",
+                stream: bool = False) -> None:
+    """Write the graph of a TemplateGraphConverter to path.
+
+    If stream is True, triples are written as they are generated (see serialize_to_stream).
+    """
+    if stream:
+        converter.serialize_to_stream(path, format=format)
+    else:
+        converter.to_graph()
+        converter.serialize(destination=path, format=format, encoding="utf-8")
+
+
+def _get_output_path_factory(output_pattern: str,
+                             column: str) -> Callable[[Any], pathlib.Path]:
+    """Get a function returning the output path for the next group value.
+
+    Groups are numbered in call order; output paths must be unique
+    and their parent directories are created.
+    """
+    indices = itertools.count()
+    paths: set[pathlib.Path] = set()
+
+    def _get_output_path(value: Any) -> pathlib.Path:
+        path = get_output_path(output_pattern, column, value, next(indices))
+
+        if path in paths:
+            raise OutputPatternError(
+                f"Output pattern '{output_pattern}' maps multiple groups to '{path}'; "
+                "use the {value} or {index} placeholder."
+            )
+
+        paths.add(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return path
+
+    return _get_output_path
+
+
+# process pool state, see _initialize_group_worker
+_worker_state: dict[str, Any] = {}
+
+
+def _initialize_group_worker(converter_type: type[TemplateConverter],
+                             template: pathlib.Path,
+                             context_module: pathlib.Path | None,
+                             write_output: _WriteOutput,
+                             converter_kwargs: dict) -> None:
+    """Compile the template and load the module context once per worker process."""
+    _worker_state.update(
+        converter_type=converter_type,
+        template=TemplateConverter._get_jinja_template_from_path(template),
+        data=_get_context_data(context_module),
+        write_output=write_output,
+        converter_kwargs=converter_kwargs
+    )
+
+
+def _convert_group(task: tuple[pd.DataFrame, pathlib.Path]) -> pathlib.Path:
+    """Convert a group in a worker process and write the output."""
+    dataframe, path = task
+
+    converter = _worker_state["converter_type"](
+        dataframe=dataframe,
+        template=_worker_state["template"],
+        data=_worker_state["data"],
+        **_worker_state["converter_kwargs"]
+    )
+    _worker_state["write_output"](converter, path)
+
+    return path
+
+
+def convert_groups(converter_type: type[TemplateConverter],
+                   table: pathlib.Path,
+                   template: pathlib.Path,
+                   group_by: str,
+                   output_pattern: str,
+                   write_output: _WriteOutput,
+                   column: Optional[str] = None,
+                   rows: Optional[tuple[Any, ...]] = None,
+                   context_module: pathlib.Path | None = None,
+                   table_cache: Optional[TableCache] = None,
+                   workers: Optional[int] = None,
+                   profiler: Profiler = NULL_PROFILER,
+                   **converter_kwargs
+                   ) -> Iterator[pathlib.Path]:
+    """Convert every group of rows sharing a value in the group_by column to its own output.
+
+    The table is read (and optionally partitioned by column/rows) only once;
+    every group is converted with converter_type and written by write_output
+    to a path according to output_pattern (see get_output_path).
+    Generates the output paths in order of group appearance.
+
+    If workers is given, groups are converted in a process pool;
+    workers compile the template and load the module context once.
+    Conversions are profiled with profiler (see tabulardf.profiling);
+    with workers, only reading the table is profiled.
+    Additional keyword arguments are passed to every converter.
+    """
+    next_output_path = _get_output_path_factory(output_pattern, group_by)
+
+    if workers is None:
+        group_converters = initialize_group_converters(
+            converter_type=converter_type,
+            table=table,
+            template=template,
+            group_by=group_by,
+            column=column,
+            rows=rows,
+            context_module=context_module,
+            table_cache=table_cache,
+            profiler=profiler,
+            **converter_kwargs
+        )
+
+        for value, converter in group_converters:
+            path = next_output_path(value)
+            write_output(converter, path)
+            yield path
+
+        return
+
+    with profiler.stage("read"):
+        dataframe = get_template_dataframe(
+            table,
+            TemplateConverter._get_jinja_template_from_path(template),
+            column=column,
+            rows=rows,
+            table_cache=table_cache,
+            group_by=group_by
+        )
+
+    tasks = (
+        (group, next_output_path(value))
+        for value, group in group_dataframe(dataframe, group_by)
+    )
+
+    yield from imap_ordered(
+        _convert_group,
+        tasks,
+        workers=workers,
+        initializer=_initialize_group_worker,
+        initargs=(converter_type, template, context_module, write_output, converter_kwargs)
+    )
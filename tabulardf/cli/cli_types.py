@@ -0,0 +1,77 @@
+"""Click types for the TabulaRDF CLI.
+
+Note: this module is imported on CLI startup and must not import rdflib, pandas or jinja2.
+"""
+
+import pathlib
+
+from collections.abc import Callable, Sequence
+
+import click
+
+
+_ClickPath = click.Path(
+    exists=True,
+    file_okay=True,
+    dir_okay=False,
+    readable=True,
+    resolve_path=True,
+    path_type=pathlib.Path
+)
+
+
+class LazyChoice(click.Choice):
+    """click.Choice with choices computed on first use.
+
+    The choices property calls get_choices on first access;
+    all other click.Choice attributes are set by click.Choice.__init__ as usual.
+    Pass an explicit metavar to options of this type,
+    else computing the help text computes the choices.
+    """
+
+    def __init__(self,
+                 get_choices: Callable[[], Sequence[str]],
+                 case_sensitive: bool = True) -> None:
+        """Initialize a LazyChoice."""
+        self._get_choices = get_choices
+        super().__init__((), case_sensitive=case_sensitive)
+        # discard the placeholder choices set by click.Choice.__init__
+        self._choices: tuple[str, ...] | None = None
+
+    @property
+    def choices(self) -> tuple[str, ...]:
+        """Get the choices, computing them on first access."""
+        if self._choices is None:
+            self._choices = tuple(self._get_choices())
+
+        return self._choices
+
+    @choices.setter
+    def choices(self, choices: Sequence[str]) -> None:
+        """Set the choices."""
+        self._choices = tuple(choices)
+
+
+def get_graph_format_options() -> list[str]:
+    """Get the names of all registered rdflib serializer plugins.
+
+    This includes the tabulardf serializers, see tabulardf.serializers.
+    """
+    from rdflib.plugin import plugins
+    from rdflib.serializer import Serializer
+
+    import tabulardf.serializers  # noqa: F401
+
+    return [plugin.name for plugin in plugins(kind=Serializer)]
+
+
+def get_graph_input_format_options() -> list[str]:
+    """Get the names of all registered rdflib parser plugins."""
+    from rdflib.parser import Parser
+    from rdflib.plugin import plugins
+
+    return [plugin.name for plugin in plugins(kind=Parser)]
+
+
+_GraphFormatOptionsChoice = LazyChoice(get_graph_format_options)
+_GraphInputFormatOptionsChoice = LazyChoice(get_graph_input_format_options)
@@ -0,0 +1,206 @@
+"""Columnar table input for the TabulaRDF CLI.
+
+Functionality for reading Parquet, Feather and Arrow IPC files
+with column projection and partition predicate pushdown.
+
+Requires pyarrow.
+"""
+
+import logging
+import pathlib
+
+from typing import Any, Callable, Iterable, Iterator, Literal as PyLiteral, Optional
+
+import pandas as pd
+
+
+logger = logging.getLogger(__name__)
+
+# pyarrow.dataset format names; Feather (v2) is the Arrow IPC file format
+_ColumnarFormat = PyLiteral["parquet", "feather"]
+
+# a partition is defined by a column and a set of row values, see partition_dataframe
+_Partition = tuple[str, Iterable]
+
+
+def _get_dataset(file: pathlib.Path, format: _ColumnarFormat):
+    """Get a pyarrow.dataset.Dataset for a file."""
+    try:
+        import pyarrow.dataset as ds
+    except ImportError:
+        raise ImportError(
+            f"Reading {format} files requires pyarrow; "
+            "install it with 'pip install tabulardf[arrow]'."
+        ) from None
+
+    return ds.dataset(file, format=format)
+
+
+def _get_columns(schema,
+                 usecols: Optional[Callable[[Any], bool]] = None) -> Optional[list[str]]:
+    """Get the column names of a schema satisfying a usecols predicate."""
+    if usecols is None:
+        return None
+
+    return [name for name in schema.names if usecols(name)]
+
+
+def _cast_values(values: Iterable, type) -> Optional[list]:
+    """Cast partition row values to a pyarrow.DataType.
+
+    CLI row values are strings (or ints), so e.g. '14' is cast to 14 for integer columns.
+    Returns None if any value cannot be cast.
+    """
+    import pyarrow as pa
+
+    try:
+        return [pa.scalar(value).cast(type).as_py() for value in values]
+    except (pa.ArrowException, ValueError, TypeError):
+        return None
+
+
+def _get_partition_filter(schema, partition: Optional[_Partition] = None):
+    """Get a pyarrow.dataset filter expression for a partition.
+
+    The filter is a prefilter only: it selects a superset of the rows
+    selected by partition_dataframe, which must still be applied.
+    Returns None if the partition cannot be pushed down.
+    """
+    import pyarrow.dataset as ds
+
+    if partition is None:
+        return None
+
+    column, rows = partition
+
+    if column not in schema.names:
+        return None
+
+    values = _cast_values(rows, schema.field(column).type)
+
+    if values is None:
+        logger.info(f"Unable to cast rows to the type of column '{column}'; "
+                    "partition is not pushed down.")
+        return None
+
+    return ds.field(column).isin(values)
+
+
+def _scan(file: pathlib.Path,
+          format: _ColumnarFormat,
+          usecols: Optional[Callable[[Any], bool]] = None,
+          partition: Optional[_Partition] = None,
+          **scan_kwargs):
+    """Get a pyarrow.dataset.Scanner for a file.
+
+    For Parquet, row groups whose statistics rule out the partition are not decoded.
+    """
+    dataset = _get_dataset(file, format)
+
+    return dataset.scanner(
+        columns=_get_columns(dataset.schema, usecols),
+        filter=_get_partition_filter(dataset.schema, partition),
+        **scan_kwargs
+    )
+
+
+def _read_columnar(file: pathlib.Path,
+                   format: _ColumnarFormat,
+                   usecols: Optional[Callable[[Any], bool]] = None,
+                   partition: Optional[_Partition] = None) -> pd.DataFrame:
+    """Read a columnar file into a dataframe."""
+    table = _scan(file, format, usecols=usecols, partition=partition).to_table()
+    dataframe = table.to_pandas()
+
+    # the stored index does not apply to filtered tables
+    if partition is not None:
+        dataframe = dataframe.reset_index(drop=True)
+
+    return dataframe
+
+
+def _iter_columnar_chunks(file: pathlib.Path,
+                          format: _ColumnarFormat,
+                          chunksize: int,
+                          usecols: Optional[Callable[[Any], bool]] = None,
+                          partition: Optional[_Partition] = None
+                          ) -> Iterator[pd.DataFrame]:
+    """Read a columnar file in chunks of chunksize rows.
+
+    Record batches (at most one row group each for Parquet) are coalesced to chunks,
+    so only about one chunk is decoded at a time.
+    """
+    import pyarrow as pa
+
+    batches = _scan(
+        file, format, usecols=usecols, partition=partition, batch_size=chunksize
+    ).to_batches()
+
+    pending: list = []
+    pending_rows = 0
+    start = 0
+
+    def _to_dataframe(table) -> pd.DataFrame:
+        dataframe = table.to_pandas()
+        dataframe.index = pd.RangeIndex(start, start + len(dataframe))
+        return dataframe
+
+    for batch in batches:
+        pending.append(batch)
+        pending_rows += batch.num_rows
+
+        while pending_rows >= chunksize:
+            table = pa.Table.from_batches(pending)
+            yield _to_dataframe(table.slice(0, chunksize))
+            start += chunksize
+
+            remainder = table.slice(chunksize)
+            pending = remainder.to_batches()
+            pending_rows = remainder.num_rows
+
+    if pending_rows:
+        yield _to_dataframe(pa.Table.from_batches(pending))
+
+
+def read_parquet(file: pathlib.Path,
+                 usecols: Optional[Callable[[Any], bool]] = None,
+                 partition: Optional[_Partition] = None) -> pd.DataFrame:
+    """Read a Parquet file into a dataframe.
+
+    Only columns satisfying the usecols predicate are decoded;
+    if a partition is given, row groups and rows outside the partition are skipped.
+    """
+    return _read_columnar(file, "parquet", usecols=usecols, partition=partition)
+
+
+def read_feather(file: pathlib.Path,
+                 usecols: Optional[Callable[[Any], bool]] = None,
+                 partition: Optional[_Partition] = None) -> pd.DataFrame:
+    """Read a Feather (v2) / Arrow IPC file into a dataframe, see read_parquet."""
+    return _read_columnar(file, "feather", usecols=usecols, partition=partition)
+
+
+def read_parquet_chunks(file: pathlib.Path,
+                        chunksize: int,
+                        usecols: Optional[Callable[[Any], bool]] = None,
+                        partition: Optional[_Partition] = None
+                        ) -> Iterator[pd.DataFrame]:
+    """Read a Parquet file in chunks of chunksize rows, see read_parquet."""
+    return _iter_columnar_chunks(file, "parquet", chunksize, usecols=usecols, partition=partition)
+
+
+def read_feather_chunks(file: pathlib.Path,
+                        chunksize: int,
+                        usecols: Optional[Callable[[Any], bool]] = None,
+                        partition: Optional[_Partition] = None
+                        ) -> Iterator[pd.DataFrame]:
+    """Read a Feather (v2) / Arrow IPC file in chunks of chunksize rows, see read_parquet."""
+    return _iter_columnar_chunks(file, "feather", chunksize, usecols=usecols, partition=partition)
+
+
+PARTITION_READ_METHODS = frozenset({
+    read_parquet,
+    read_feather,
+    read_parquet_chunks,
+    read_feather_chunks,
+})
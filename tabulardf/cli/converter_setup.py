@@ -2,14 +2,86 @@
 
 import pathlib
 
-from typing import Any, Optional
+from typing import Any, Callable, Generator, Optional
+
+import pandas as pd
+
+from jinja2 import Template
 
 from tabulardf import TemplateConverter
 from tabulardf.cli.dataframe_utils import (
+    get_dataframe_chunks_from_file,
     get_dataframe_from_file,
+    group_dataframe,
     partition_dataframe
 )
 from tabulardf.cli.context_module import load_module, get_namespace_mapping
+from tabulardf.cli.table_cache import TableCache
+from tabulardf.incremental import IncrementalCache
+from tabulardf.profiling import NULL_PROFILER, Profiler
+from tabulardf.template_analysis import get_referenced_columns
+
+
+def _get_context_data(context_module: pathlib.Path | None) -> dict | None:
+    """Get the template data context for a --context-module file."""
+    if context_module is None:
+        return None
+
+    module_name = context_module.stem
+    # load the module
+    module = load_module(context_module, module_name)
+    # get a module dict
+    namespace_mapping = get_namespace_mapping(module)
+
+    return {module_name: namespace_mapping}
+
+
+def _get_usecols(template: Template,
+                 *columns: Optional[str]) -> Optional[Callable[[Any], bool]]:
+    """Get a usecols predicate for the columns referenced in a template.
+
+    Additional columns (e.g. the partition column) are always included.
+    If the referenced columns cannot be determined statically, None is returned.
+    """
+    referenced_columns = get_referenced_columns(template)
+
+    if not referenced_columns:
+        # note: reading no columns at all would also drop the rows
+        return None
+
+    referenced_columns = referenced_columns | {column for column in columns if column}
+
+    return lambda name: name in referenced_columns
+
+
+def get_template_dataframe(table: pathlib.Path,
+                           template: Template,
+                           column: Optional[str] = None,
+                           rows: Optional[tuple[Any, ...]] = None,
+                           table_cache: Optional[TableCache] = None,
+                           group_by: Optional[str] = None,
+                           key_column: Optional[str] = None
+                           ) -> pd.DataFrame:
+    """Get and optionally partition a dataframe for a template.
+
+    Only the columns referenced in the template (plus the partition, group_by and key columns)
+    are read from the table; if a TableCache is given, the parsed table is cached.
+    """
+    dataframe = get_dataframe_from_file(
+        table,
+        usecols=_get_usecols(template, column, group_by, key_column),
+        table_cache=table_cache,
+        partition=(column, rows) if column else None
+    )
+
+    if column:  # column and rows are mutually dependent in the CLI
+        dataframe = partition_dataframe(
+            dataframe=dataframe,
+            column=column,
+            rows=rows
+        )
+
+    return dataframe
 
 
 # add data parameter for TemplateConverter!!! -> --context-module flag
@@ -19,40 +91,141 @@ def initialize_converter(converter_type: type[TemplateConverter],
                          column: Optional[str] = None,
                          rows: Optional[tuple[Any, ...]] = None,
                          context_module: pathlib.Path | None = None,
+                         table_cache: Optional[TableCache] = None,
+                         profiler: Profiler = NULL_PROFILER,
+                         incremental: Optional[IncrementalCache] = None,
+                         **converter_kwargs
                          ) -> TemplateConverter:
     """Initialize a TemplateConverter.
 
     Get and optionally partition a dataframe and initialze a
     TemplateConverter according to converter_type.
+    Only the columns referenced in the template are read from the table;
+    if a TableCache is given, the parsed table is cached.
+    Reading the table is profiled as "read"; the profiler is passed to the converter.
+    If an IncrementalCache is given, its key column is always read
+    and the cache is passed to the converter.
+    Additional keyword arguments are passed to the converter.
     """
-    # 1. get a dataframe
-    dataframe = get_dataframe_from_file(table)
+    # 0. get a template
+    jinja_template = TemplateConverter._get_jinja_template_from_path(template)
 
-    # 1.1 optional: partition a dataframe
-    if column:  # column and rows are mutually dependent in the CLI
-        dataframe = partition_dataframe(
-            dataframe=dataframe,
+    # 1. get and optionally partition a dataframe
+    with profiler.stage("read"):
+        dataframe = get_template_dataframe(
+            table,
+            jinja_template,
             column=column,
-            rows=rows
+            rows=rows,
+            table_cache=table_cache,
+            key_column=incremental.key_column if incremental else None
         )
 
-    # 1.2 optional: provide a module context
-    if context_module:
-        module_name = context_module.stem
-        # load the module
-        module = load_module(context_module, module_name)
-        # get a module dict
-        namespace_mapping = get_namespace_mapping(module)
-
-        data = {module_name: namespace_mapping}
-    else:
-        data = None
+    # 1.1 optional: provide a module context
+    data = _get_context_data(context_module)
 
     # 2. get a TemplateConverter
     converter = converter_type(
         dataframe=dataframe,
-        template=template,
-        data=data
+        template=jinja_template,
+        data=data,
+        profiler=profiler,
+        incremental=incremental,
+        **converter_kwargs
     )
 
     return converter
+
+
+def initialize_chunked_converters(converter_type: type[TemplateConverter],
+                                  table: pathlib.Path,
+                                  template: pathlib.Path,
+                                  chunksize: int,
+                                  column: Optional[str] = None,
+                                  rows: Optional[tuple[Any, ...]] = None,
+                                  context_module: pathlib.Path | None = None,
+                                  table_cache: Optional[TableCache] = None,
+                                  profiler: Profiler = NULL_PROFILER,
+                                  **converter_kwargs
+                                  ) -> Generator[TemplateConverter, None, None]:
+    """Initialize a TemplateConverter per dataframe chunk.
+
+    The table is read in chunks of chunksize rows and every chunk is
+    optionally partitioned; so peak memory depends on chunksize, not on table size.
+    The template and the module context are loaded once and shared between converters.
+    Only the columns referenced in the template are read from the table;
+    if a TableCache is given, chunks are read from the cached table.
+    Reading every chunk is profiled as "read"; the profiler is passed to every converter.
+    Additional keyword arguments are passed to every converter.
+    """
+    data = _get_context_data(context_module)
+    jinja_template = TemplateConverter._get_jinja_template_from_path(template)
+
+    chunks = get_dataframe_chunks_from_file(
+        table,
+        chunksize,
+        usecols=_get_usecols(jinja_template, column),
+        table_cache=table_cache,
+        partition=(column, rows) if column else None
+    )
+
+    for dataframe in profiler.iterate("read", chunks):
+        if column:
+            dataframe = partition_dataframe(
+                dataframe=dataframe,
+                column=column,
+                rows=rows
+            )
+
+        if dataframe.empty:
+            continue
+
+        yield converter_type(
+            dataframe=dataframe,
+            template=jinja_template,
+            data=data,
+            profiler=profiler,
+            **converter_kwargs
+        )
+
+
+def initialize_group_converters(converter_type: type[TemplateConverter],
+                                table: pathlib.Path,
+                                template: pathlib.Path,
+                                group_by: str,
+                                column: Optional[str] = None,
+                                rows: Optional[tuple[Any, ...]] = None,
+                                context_module: pathlib.Path | None = None,
+                                table_cache: Optional[TableCache] = None,
+                                profiler: Profiler = NULL_PROFILER,
+                                **converter_kwargs
+                                ) -> Generator[tuple[Any, TemplateConverter], None, None]:
+    """Initialize a TemplateConverter per group of rows sharing a value in the group_by column.
+
+    Generates (value, converter) pairs.
+    The table is read (and optionally partitioned), the template compiled
+    and the module context loaded once for all groups.
+    Reading the table is profiled as "read"; the profiler is passed to every converter.
+    Additional keyword arguments are passed to every converter.
+    """
+    jinja_template = TemplateConverter._get_jinja_template_from_path(template)
+    data = _get_context_data(context_module)
+
+    with profiler.stage("read"):
+        dataframe = get_template_dataframe(
+            table,
+            jinja_template,
+            column=column,
+            rows=rows,
+            table_cache=table_cache,
+            group_by=group_by
+        )
+
+    for value, group in group_dataframe(dataframe, group_by):
+        yield value, converter_type(
+            dataframe=group,
+            template=jinja_template,
+            data=data,
+            profiler=profiler,
+            **converter_kwargs
+        )
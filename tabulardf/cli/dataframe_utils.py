@@ -1,14 +1,24 @@
 """DataFrame utilites for the TabulaRDF CLI."""
 
-import inspect
+import itertools
 import logging
 import pathlib
 
-from typing import Callable, Generator, Iterable, Mapping
-from types import FunctionType
+from typing import Any, Callable, Generator, Iterable, Iterator, Mapping, Optional
 
 import pandas as pd
 
+from tabulardf.cli.columnar import (
+    PARTITION_READ_METHODS,
+    read_feather,
+    read_feather_chunks,
+    read_parquet,
+    read_parquet_chunks
+)
+from tabulardf.cli.format_detection import detect_table_format
+from tabulardf.cli.table_cache import TableCache
+from tabulardf.rows import iter_batches
+
 
 # call basicConfig manually to create handlers
 logging.basicConfig()
@@ -19,7 +29,9 @@ logger.setLevel(logging.CRITICAL)
 
 EXTENSION_READ_METHODS: Mapping[tuple, Callable] = {
     ("csv", ): pd.read_csv,
-    ("xls", "xlsx", "xlsm", "xlsb", "odf", "ods", "odt"): pd.read_excel
+    ("xls", "xlsx", "xlsm", "xlsb", "odf", "ods", "odt"): pd.read_excel,
+    ("parquet", "pq"): read_parquet,
+    ("feather", "arrow", "ipc"): read_feather
 }
 
 
@@ -35,7 +47,7 @@ def _get_read_method_by_extension(extension: str,
     """Try to get a pandas read method given a file extension."""
     extension = extension.lstrip(".")
 
-    for key, value in EXTENSION_READ_METHODS.items():
+    for key, value in method_mapping.items():
         if extension in key:
             read_method = value
             return read_method
@@ -43,66 +55,237 @@ def _get_read_method_by_extension(extension: str,
     raise UnknownExtensionError(f"Unknown extension '{extension}'.")
 
 
-# FunctionType vs. Callable:
-# actually dict+FunctionType is more precise here than e.g. Mapping+Callable
-def _get_pandas_read_methods() -> dict[str, FunctionType]:
-    """Get all pandas methods starting with 'read_'.
+def _get_read_kwargs(usecols: Optional[Callable[[Any], bool]],
+                     read_method: Optional[Callable] = None,
+                     partition: Optional[tuple[str, Iterable]] = None) -> dict:
+    """Get keyword arguments for a pandas read method.
 
-    For every match a mapping of method name and function object is returned.
+    A partition is only passed to read methods supporting predicate pushdown.
     """
-    pd_members = inspect.getmembers(pd)
-    pandas_read_methods = {
-        name: member for name, member
-        in pd_members
-        if name.startswith("read_") and inspect.isfunction(member)
-    }
+    read_kwargs: dict[str, Any] = {} if usecols is None else {"usecols": usecols}
+
+    if partition is not None and read_method in PARTITION_READ_METHODS:
+        read_kwargs["partition"] = partition
 
-    return pandas_read_methods
+    return read_kwargs
 
 
-def _get_dataframe_try_hard(file: pathlib.Path) -> pd.DataFrame:
-    """Try hard to get a dataframe from a pathlib.Path.
+def _get_dataframe_by_detection(file: pathlib.Path,
+                                usecols: Optional[Callable[[Any], bool]] = None,
+                                partition: Optional[tuple[str, Iterable]] = None
+                                ) -> pd.DataFrame:
+    """Get a dataframe from a pathlib.Path with an unknown extension.
 
-    Every pandas read method is tried, the result from the first method
-    able to produce a dataframe is returned.
+    The table format is detected from the file content (see detect_table_format)
+    and the file is read once with the read method for that format.
+    usecols is ignored for formats whose read method does not support it.
     """
-    for read_method in _get_pandas_read_methods().values():
-        try:
-            logger.info(f"Trying '{read_method.__name__}' to obtain dataframe from {file.name}.")
-            dataframe = read_method(file)
+    table_format = detect_table_format(file)
+    logger.info(f"Reading '{file.name}' as '{table_format.name}' "
+                f"with '{table_format.read_method.__name__}'.")
 
-            logger.info(f"Successfully obtained dataframe with '{read_method.__name__}'.")
-            return dataframe
-        except Exception as e:
-            logger.warning(f"Unable to obtain dataframe with '{read_method.__name__}': {e}")
-            pass
+    read_kwargs = (
+        _get_read_kwargs(usecols, table_format.read_method, partition)
+        if table_format.supports_usecols
+        else {}
+    )
 
-    logging.critical("Unable to obtain dataframe. Exiting.")
-    raise Exception("Could not find applicable read method.")
+    return table_format.read_method(file, **table_format.read_kwargs, **read_kwargs)
 
 
-def get_dataframe_from_file(file: pathlib.Path):
+def get_dataframe_from_file(file: pathlib.Path,
+                            usecols: Optional[Callable[[Any], bool]] = None,
+                            table_cache: Optional[TableCache] = None,
+                            partition: Optional[tuple[str, Iterable]] = None):
     """Get a dataframe from a pathlib.Path.
 
     First check against a mapping of extensions to determine a read method;
-    if that fails try hard to get a dataframe anyway by calling one read method
-    after another and going with the first that applies.
+    if that fails detect the table format from the file content.
+
+    usecols is a column name predicate passed to the read method.
+    If a TableCache is given, the entire table is parsed once and cached;
+    later calls read the cached table.
+
+    partition is a (column, rows) pair; for columnar formats (Parquet, Feather)
+    it is pushed down to the reader, so non-matching row groups are skipped.
+    This only prefilters rows, partition_dataframe must still be applied.
     """
-    # note: if the extension mapping fails, there must extensive logging!
+    if table_cache is not None:
+        return table_cache.read(
+            file,
+            read_method=lambda: get_dataframe_from_file(file),
+            usecols=usecols
+        )
+
     extension = file.suffix.lstrip(".")
 
     try:
         read_method = _get_read_method_by_extension(extension)
-        dataframe = read_method(file)
     except UnknownExtensionError:
-        # try harder
-        logger.info(f"No known pandas read method for '{extension}'.\n"
-                    "Trying to determine read method by trial.")
-        dataframe = _get_dataframe_try_hard(file)
+        logger.info(f"No known pandas read method for '{extension}'. "
+                    "Detecting table format from content.")
+        dataframe = _get_dataframe_by_detection(file, usecols=usecols, partition=partition)
+    else:
+        dataframe = read_method(file, **_get_read_kwargs(usecols, read_method, partition))
 
     return dataframe
 
 
+def _read_csv_chunks(file: pathlib.Path,
+                     chunksize: int,
+                     usecols: Optional[Callable[[Any], bool]] = None
+                     ) -> Iterator[pd.DataFrame]:
+    """Read a csv file in chunks of chunksize rows."""
+    with pd.read_csv(file, chunksize=chunksize, **_get_read_kwargs(usecols)) as reader:
+        yield from reader
+
+
+def _iter_excel_rows(worksheet: Any) -> Iterator[list]:
+    """Generate the rows of an openpyxl worksheet converted like pd.read_excel does.
+
+    Empty cells are converted to "" (i.e. NA for TextParser), error cells to NaN
+    and integral numbers to int; trailing empty cells and trailing blank rows are trimmed.
+    """
+    from openpyxl.cell.cell import TYPE_ERROR, TYPE_NUMERIC
+
+    def _convert_cell(cell: Any) -> Any:
+        if cell.value is None:
+            return ""
+        if cell.data_type == TYPE_ERROR:
+            return float("nan")
+        if cell.data_type == TYPE_NUMERIC:
+            value = int(cell.value)
+            return value if value == cell.value else float(cell.value)
+
+        return cell.value
+
+    blank_rows = 0
+
+    for row in worksheet.rows:
+        converted_row = [_convert_cell(cell) for cell in row]
+
+        while converted_row and converted_row[-1] == "":
+            converted_row.pop()
+
+        # blank rows are only yielded once a row with data follows
+        if not converted_row:
+            blank_rows += 1
+            continue
+
+        yield from itertools.repeat([], blank_rows)
+        blank_rows = 0
+
+        yield converted_row
+
+
+def _read_excel_chunks(file: pathlib.Path,
+                       chunksize: int,
+                       usecols: Optional[Callable[[Any], bool]] = None
+                       ) -> Iterator[pd.DataFrame]:
+    """Read the first worksheet of an Office Open XML workbook in chunks of chunksize rows.
+
+    Rows are streamed with openpyxl's read-only mode, so the workbook is never loaded entirely.
+    Every chunk is parsed with pandas' TextParser like with pd.read_excel,
+    i.e. the first row is used as header, duplicate column names are mangled (e.g. 'a.1'),
+    blank rows are kept as NaN rows and the default NA strings (e.g. 'N/A') are converted to NaN.
+
+    Unlike pd.read_excel, dtypes are inferred per chunk (like with pd.read_csv chunks)
+    and 'Unnamed' columns for cells beyond the last header cell
+    are only added to the chunks holding such cells.
+    """
+    from pandas.io.parsers import TextParser
+
+    import openpyxl
+
+    workbook = openpyxl.load_workbook(file, read_only=True, data_only=True)
+
+    try:
+        worksheet = workbook.worksheets[0]
+        worksheet.reset_dimensions()
+
+        rows = _iter_excel_rows(worksheet)
+        header = next(rows, None)
+
+        if header is None:
+            return
+
+        for start in itertools.count(0, chunksize):
+            chunk_rows = list(itertools.islice(rows, chunksize))
+
+            if not chunk_rows:
+                break
+
+            # rows are extended to the chunk width like pd.read_excel extends them to the sheet width
+            width = max(len(header), *map(len, chunk_rows))
+
+            dataframe = TextParser(
+                [
+                    row + [""] * (width - len(row))
+                    for row in (header, *chunk_rows)
+                ],
+                header=0,
+                skip_blank_lines=False,
+                **_get_read_kwargs(usecols)
+            ).read()
+            dataframe.index = pd.RangeIndex(start, start + len(chunk_rows))
+
+            yield dataframe
+    finally:
+        workbook.close()
+
+
+EXTENSION_CHUNKED_READ_METHODS: Mapping[tuple, Callable] = {
+    ("csv", ): _read_csv_chunks,
+    ("xlsx", "xlsm"): _read_excel_chunks,
+    ("parquet", "pq"): read_parquet_chunks,
+    ("feather", "arrow", "ipc"): read_feather_chunks
+}
+
+
+def get_dataframe_chunks_from_file(file: pathlib.Path,
+                                   chunksize: int,
+                                   usecols: Optional[Callable[[Any], bool]] = None,
+                                   table_cache: Optional[TableCache] = None,
+                                   partition: Optional[tuple[str, Iterable]] = None
+                                   ) -> Iterator[pd.DataFrame]:
+    """Get a generator of dataframe chunks from a pathlib.Path.
+
+    Every chunk holds at most chunksize rows.
+    For formats without chunked read support
+    the entire dataframe is read first and then sliced into chunks.
+    usecols is a column name predicate and partition a (column, rows) pair,
+    see get_dataframe_from_file.
+    If a TableCache is given, chunks are sliced from the cached table.
+    """
+    if table_cache is not None:
+        yield from table_cache.read_chunks(
+            file,
+            read_method=lambda: get_dataframe_from_file(file),
+            chunksize=chunksize,
+            usecols=usecols
+        )
+        return
+
+    extension = file.suffix.lstrip(".")
+
+    try:
+        read_method = _get_read_method_by_extension(
+            extension,
+            method_mapping=EXTENSION_CHUNKED_READ_METHODS
+        )
+    except UnknownExtensionError:
+        logger.warning(f"No chunked read method for '{extension}'. "
+                       "Reading the entire dataframe before chunking.")
+        dataframe = get_dataframe_from_file(file, usecols=usecols, partition=partition)
+        yield from iter_batches(dataframe, chunksize)
+    else:
+        yield from read_method(
+            file,
+            chunksize,
+            **_get_read_kwargs(usecols, read_method, partition)
+        )
+
+
 def partition_dataframe(dataframe: pd.DataFrame,
                         column: str,
                         rows: Iterable
@@ -131,3 +314,17 @@ def partition_dataframe(dataframe: pd.DataFrame,
     ]
 
     return table_partition
+
+
+def group_dataframe(dataframe: pd.DataFrame,
+                    column: str
+                    ) -> Iterator[tuple[Any, pd.DataFrame]]:
+    """Generate (value, partition) pairs for every distinct value of a column.
+
+    Every partition holds the rows sharing a value in column,
+    i.e. it equals partition_dataframe(dataframe, column, [value]);
+    the dataframe is grouped in a single pass.
+    Partitions are generated in order of first appearance, rows with missing values are skipped.
+    """
+    for value, group in dataframe.groupby(column, sort=False, dropna=True):
+        yield value, group
@@ -12,6 +12,21 @@ class CLIDocs:
     render_by_row: str
     format: str
     context_module: str
+    parse_batch_size: str
+    input_format: str
+    stream: str
+    store: str
+    chunksize: str
+    cache_dir: str
+    cache_max_size: str
+    group_by: str
+    output: str
+    workers: str
+    profile: str
+    profile_json: str
+    incremental: str
+    incremental_key: str
+    deduplicate_rows: str
 
 
 docs = CLIDocs(
@@ -36,12 +51,110 @@ docs = CLIDocs(
 
     format=(
         "Specifies a format for RDF serialization. "
-        "This is a proxy for rdflib.Graph serialize."
+        "This is a proxy for rdflib.Graph serialize, "
+        "so any registered rdflib serializer plugin is available, "
+        "e.g. ttl, nt, xml, json-ld, n3, trig, nquads, tabulardf-nt and tabulardf-ttl; "
+        "an invalid FORMAT lists all available formats. "
+        "For large graphs, tabulardf-nt and tabulardf-ttl (flat Turtle) are considerably faster."
     ),
 
     context_module=(
         "Load all public symbols of a Python module into the template context. "
         "Symbols will be available in a dictionary named after the module. "
         "E.g. this allows to define a set of functions for use in a template."
+    ),
+
+    parse_batch_size=(
+        "Number of row renderings to join and parse in a single rdflib parse call. "
+        "Prefix declarations are deduplicated across a batch; "
+        "if a batch fails to parse, its renderings are parsed row by row."
+    ),
+
+    input_format=(
+        "Declares the rdflib parser format of row renderings, "
+        "i.e. any registered rdflib parser plugin (e.g. ttl, nt, xml, json-ld, n3 or trig); "
+        "an invalid FORMAT lists all available formats. "
+        "By default, the format is guessed by rdflib. "
+        "N-Triples renderings are parsed with a fast line parser "
+        "and, with --stream and an N-Triples --format, written to the output without parsing."
+    ),
+
+    stream=(
+        "Boolean flag. If active, triples are written to stdout as rows are processed "
+        "instead of building the entire graph in memory first. "
+        "Requires a line-based format (nt or nquads); duplicate triples are not eliminated."
+    ),
+
+    store=(
+        "Back the graph with an SQLite database at STORE instead of memory, "
+        "so memory consumption stays flat as the number of triples grows. "
+        "Triples are inserted in batched transactions and serialized straight from the database; "
+        "use an N-Triples or tabulardf-ttl --format to avoid in-memory pretty-printing. "
+        "An existing database is extended. Not available with --stream or --group-by."
+    ),
+
+    chunksize=(
+        "Read the table in chunks of CHUNKSIZE rows and convert one chunk at a time. "
+        "Partitioning applies to every chunk; column dtypes are inferred per chunk. "
+        "For noparse, --render-by-row is required; "
+        "for graph, combine with --stream to keep memory bounded by the chunk size."
+    ),
+
+    cache_dir=(
+        "Cache parsed tables in CACHE_DIR (requires pyarrow). "
+        "Tables are cached in Feather format keyed by path, size, mtime and content hash, "
+        "so repeated runs against an unchanged table skip parsing."
+    ),
+
+    cache_max_size=(
+        "Maximum size of the table cache in MiB. "
+        "Least recently used tables are evicted if the cache grows beyond that size."
+    ),
+
+    group_by=(
+        "Group the table by a column and convert every group to its own output file "
+        "(according to --output) in a single run. "
+        "Combine with --column/--rows to restrict the table before grouping. "
+        "--group-by is mandatory if --output is given and vice versa."
+    ),
+
+    output=(
+        "Output file pattern for --group-by, e.g. 'out/{value}.ttl'. "
+        "Available placeholders: {value} (the group value), {column} (the --group-by column) "
+        "and {index} (the group number). Paths of written files are echoed."
+    ),
+
+    workers=(
+        "Number of worker processes for converting --group-by groups in parallel "
+        "or, for noparse --render-by-row, for rendering chunks of rows in parallel. "
+        "With --deduplicate-rows, rows are then deduplicated per group or chunk only."
+    ),
+
+    profile=(
+        "Boolean flag. If active, a summary table of per-stage wall times, call counts "
+        "and slowest calls (e.g. reading, rendering, parsing, serializing) is written to stderr."
+    ),
+
+    profile_json=(
+        "Write per-stage profiling statistics (see --profile) to a JSON file."
+    ),
+
+    incremental=(
+        "Cache per-row renderings (noparse, requires --render-by-row) or triples (graph) "
+        "in an SQLite database at INCREMENTAL. "
+        "Only rows that are new or changed (or all rows if the template or context module changed) "
+        "are rendered again; rows deleted from the table are dropped from the output. "
+        "Not available with --chunksize, --group-by or (for graph) --stream."
+    ),
+
+    incremental_key=(
+        "Column identifying rows for --incremental; defaults to the row position, "
+        "so inserting or deleting rows marks all subsequent rows as changed."
+    ),
+
+    deduplicate_rows=(
+        "Boolean flag. If active, rows with equal values (in the columns referenced by the template) "
+        "are rendered only once and, for graph, their rendering is parsed only once. "
+        "Applies to row renderings only."
     )
 )
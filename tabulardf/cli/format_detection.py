@@ -0,0 +1,153 @@
+"""Table format detection for the TabulaRDF CLI.
+
+Functionality for determining a pandas read method for files with unknown extensions
+by inspecting magic bytes and a small head sample of the file content.
+"""
+
+import csv
+import json
+import logging
+import pathlib
+import zipfile
+
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+import pandas as pd
+
+from tabulardf.cli.columnar import read_feather, read_parquet
+
+
+logger = logging.getLogger(__name__)
+
+HEAD_SAMPLE_SIZE = 64 * 1024
+SNIFF_DELIMITERS = ",;\t|"
+
+_ZIP_MAGIC = b"PK\x03\x04"
+_OLE_MAGIC = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+_PARQUET_MAGIC = b"PAR1"
+_ARROW_MAGIC = b"ARROW1"
+_FEATHER_V1_MAGIC = b"FEA1"
+
+_ODS_MIMETYPE = b"application/vnd.oasis.opendocument.spreadsheet"
+
+
+class UnknownTableFormatError(Exception):  # noqa: D204
+    """Exception type for table formats that cannot be detected."""
+    pass
+
+
+@dataclass(frozen=True)
+class TableFormat:
+    """Detected table format.
+
+    read_method is the pandas read method for the format,
+    read_kwargs are additional keyword arguments for read_method (e.g. a csv delimiter).
+    supports_usecols indicates whether read_method accepts a usecols predicate
+    (and possibly a partition, see dataframe_utils.get_dataframe_from_file).
+    """
+
+    name: str
+    read_method: Callable[..., pd.DataFrame]
+    read_kwargs: dict = field(default_factory=dict)
+    supports_usecols: bool = True
+
+
+def _detect_zip_format(file: pathlib.Path) -> TableFormat:
+    """Detect spreadsheet formats in zip containers (OOXML and OpenDocument)."""
+    with zipfile.ZipFile(file) as archive:
+        names = set(archive.namelist())
+
+        if "mimetype" in names and archive.read("mimetype").startswith(_ODS_MIMETYPE):
+            return TableFormat("ods", pd.read_excel, {"engine": "odf"})
+
+    if "xl/workbook.bin" in names:
+        return TableFormat("xlsb", pd.read_excel, {"engine": "pyxlsb"})
+
+    if "xl/workbook.xml" in names:
+        return TableFormat("xlsx", pd.read_excel, {"engine": "openpyxl"})
+
+    raise UnknownTableFormatError(f"'{file.name}' is a zip archive but no spreadsheet.")
+
+
+def _decode_sample(head: bytes) -> str:
+    """Decode a head sample, dropping a (possibly truncated) last line."""
+    if len(head) == HEAD_SAMPLE_SIZE and b"\n" in head:
+        head = head[:head.rindex(b"\n")]
+
+    return head.decode("utf-8-sig")
+
+
+def _detect_json_format(sample: str) -> TableFormat:
+    """Detect JSON and JSON Lines in a text sample starting with '{' or '['."""
+    if sample.startswith("{"):
+        first_line = sample.split("\n", 1)[0]
+
+        try:
+            json.loads(first_line)
+        except ValueError:
+            pass
+        else:
+            return TableFormat("jsonl", pd.read_json, {"lines": True}, supports_usecols=False)
+
+    return TableFormat("json", pd.read_json, supports_usecols=False)
+
+
+def _detect_delimited_format(sample: str) -> TableFormat:
+    """Detect the dialect of delimited text in a text sample."""
+    try:
+        dialect = csv.Sniffer().sniff(sample, delimiters=SNIFF_DELIMITERS)
+    except csv.Error:
+        # e.g. a single column; go with the read_csv defaults
+        return TableFormat("csv", pd.read_csv)
+
+    return TableFormat(
+        "csv",
+        pd.read_csv,
+        {"sep": dialect.delimiter, "quotechar": dialect.quotechar}
+    )
+
+
+def detect_table_format(file: pathlib.Path) -> TableFormat:
+    """Detect the table format of a file.
+
+    Binary formats (xlsx/xlsb/ods, xls, Parquet, Feather) are detected by magic bytes,
+    text formats (JSON, JSON Lines, delimited text) by a head sample of the file;
+    for delimited text the dialect is determined with csv.Sniffer.
+    Only the head of the file is read.
+    """
+    with open(file, "rb") as f:
+        head = f.read(HEAD_SAMPLE_SIZE)
+
+    if head.startswith(_ZIP_MAGIC):
+        table_format = _detect_zip_format(file)
+    elif head.startswith(_OLE_MAGIC):
+        table_format = TableFormat("xls", pd.read_excel, {"engine": "xlrd"})
+    elif head.startswith(_PARQUET_MAGIC):
+        table_format = TableFormat("parquet", read_parquet)
+    elif head.startswith(_ARROW_MAGIC):
+        table_format = TableFormat("feather", read_feather)
+    elif head.startswith(_FEATHER_V1_MAGIC):
+        table_format = TableFormat("feather", pd.read_feather, supports_usecols=False)
+    else:
+        if b"\x00" in head:
+            raise UnknownTableFormatError(f"Unable to detect table format of '{file.name}'.")
+
+        try:
+            sample = _decode_sample(head).lstrip()
+        except UnicodeDecodeError:
+            raise UnknownTableFormatError(
+                f"Unable to detect table format of '{file.name}': not UTF-8 text."
+            ) from None
+
+        if not sample:
+            raise UnknownTableFormatError(f"'{file.name}' is empty.")
+
+        table_format = (
+            _detect_json_format(sample)
+            if sample.startswith(("{", "["))
+            else _detect_delimited_format(sample)
+        )
+
+    logger.info(f"Detected table format '{table_format.name}' for '{file.name}'.")
+    return table_format
@@ -0,0 +1,339 @@
+"""On-disk cache of parsed tables for the TabulaRDF CLI.
+
+Functionality for caching parsed dataframes in a columnar format (Feather or Parquet),
+so repeated conversions of the same table skip parsing (e.g. of Excel workbooks).
+
+Requires pyarrow.
+"""
+
+import datetime
+import hashlib
+import json
+import logging
+import os
+import pathlib
+import uuid
+
+from typing import Any, Callable, Iterator, Literal as PyLiteral, Optional
+
+import pandas as pd
+
+from tabulardf.rows import iter_batches
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CACHE_SIZE = 2 ** 30
+
+_CacheFormat = PyLiteral["feather", "parquet"]
+
+# schema metadata key for columns stored as type-tagged strings
+_TAGGED_COLUMNS_KEY = b"tabulardf.tagged_columns"
+
+# type tags and decoders for values of mixed-type columns (e.g. from Excel), keyed by exact type;
+# values are encoded as '<tag>:<str or isoformat>'
+_VALUE_TAGS: dict[type, str] = {
+    str: "s",
+    int: "i",
+    float: "f",
+    bool: "b",
+    datetime.datetime: "dt",
+    datetime.date: "d",
+    datetime.time: "t",
+    pd.Timestamp: "ts",
+}
+
+_VALUE_DECODERS: dict[str, Callable[[str], Any]] = {
+    "s": str,
+    "i": int,
+    "f": float,
+    "b": lambda value: value == "True",
+    "dt": datetime.datetime.fromisoformat,
+    "d": datetime.date.fromisoformat,
+    "t": datetime.time.fromisoformat,
+    "ts": pd.Timestamp,
+}
+
+
+def _encode_value(value: Any) -> Optional[str]:
+    """Encode a value of a mixed-type column as type-tagged string.
+
+    Missing values are kept as None; values of other than the supported types raise a TypeError.
+    """
+    if value is None or (isinstance(value, float) and value != value):
+        return None
+
+    try:
+        tag = _VALUE_TAGS[type(value)]
+    except KeyError:
+        raise TypeError(f"Values of type '{type(value).__name__}' cannot be cached.") from None
+
+    encoded = value.isoformat() if isinstance(value, (datetime.date, datetime.time)) else value
+
+    return f"{tag}:{encoded!r}" if tag == "f" else f"{tag}:{encoded}"
+
+
+def _decode_value(value: str) -> Any:
+    """Decode a type-tagged string, see _encode_value."""
+    tag, _, encoded = value.partition(":")
+    return _VALUE_DECODERS[tag](encoded)
+
+
+def _to_arrow(dataframe: pd.DataFrame):
+    """Convert a dataframe to a pyarrow.Table.
+
+    Object columns that Arrow cannot represent (e.g. mixed ints and strings from Excel)
+    are stored as type-tagged strings and restored by _to_pandas;
+    values of other types (and non-string column names, which Arrow would turn into strings)
+    raise a TypeError, i.e. such dataframes are not cached.
+    """
+    import pyarrow as pa
+
+    if not all(isinstance(name, str) for name in dataframe.columns):
+        raise TypeError("Tables with non-string column names cannot be cached.")
+
+    tagged_columns = []
+    dataframe = dataframe.copy(deep=False)
+
+    for position, dtype in enumerate(dataframe.dtypes):
+        if dtype != object:
+            continue
+
+        column = dataframe.iloc[:, position]
+
+        try:
+            pa.array(column, from_pandas=True)
+        except (pa.ArrowException, ValueError, TypeError):
+            dataframe[column.name] = column.map(_encode_value).astype(object)
+            tagged_columns.append(column.name)
+
+    table = pa.Table.from_pandas(dataframe, preserve_index=False)
+
+    return table.replace_schema_metadata({
+        **table.schema.metadata,
+        _TAGGED_COLUMNS_KEY: json.dumps(tagged_columns).encode("utf-8")
+    })
+
+
+def _to_pandas(table) -> pd.DataFrame:
+    """Convert a pyarrow.Table written by _to_arrow to a dataframe.
+
+    Like with the pandas read methods, missing values in object columns are NaN (not None).
+    """
+    dataframe = table.to_pandas()
+    metadata = table.schema.metadata or {}
+    tagged_columns = json.loads(metadata.get(_TAGGED_COLUMNS_KEY, b"[]"))
+
+    for position, dtype in enumerate(dataframe.dtypes):
+        if dtype != object:
+            continue
+
+        column = dataframe.iloc[:, position]
+
+        if column.name in tagged_columns:
+            column = column.map(_decode_value, na_action="ignore")
+
+        dataframe[column.name] = column.where(column.notna(), float("nan")).astype(object)
+
+    return dataframe
+
+
+def _get_content_digest(file: pathlib.Path) -> str:
+    """Get a hash digest of the file content."""
+    with open(file, "rb") as f:
+        return hashlib.file_digest(f, "blake2b").hexdigest()
+
+
+class TableCache:
+    """Size-bounded on-disk cache of parsed tables.
+
+    Cache entries are keyed by the resolved file path, file size, mtime and a content hash,
+    so changed tables are parsed (and cached) anew.
+    Entries are read memory-mapped and only the requested columns are converted to pandas.
+
+    If the total size of all entries exceeds max_size bytes,
+    least recently used entries are evicted.
+    Columns of mixed types are stored as type-tagged strings (entries never hold pickled objects);
+    dataframes with values of other types or non-string column names are not cached.
+    """
+
+    def __init__(self,
+                 directory: os.PathLike,
+                 max_size: int = DEFAULT_MAX_CACHE_SIZE,
+                 format: _CacheFormat = "feather") -> None:
+        """Initialize a TableCache."""
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise ImportError(
+                "TableCache requires pyarrow; install it with 'pip install tabulardf[arrow]'."
+            ) from None
+
+        if format not in ("feather", "parquet"):
+            raise ValueError(f"Unknown cache format '{format}'.")
+
+        self.directory = pathlib.Path(directory)
+        self.max_size = max_size
+        self.format = format
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def get_key(self, file: pathlib.Path) -> str:
+        """Get the cache key for a file."""
+        stat = file.stat()
+        key_data = "\0".join(
+            map(str, (file.resolve(), stat.st_size, stat.st_mtime_ns, _get_content_digest(file)))
+        )
+
+        return hashlib.blake2b(key_data.encode("utf-8"), digest_size=16).hexdigest()
+
+    def get_path(self, key: str) -> pathlib.Path:
+        """Get the path of a cache entry."""
+        return self.directory / f"{key}.{self.format}"
+
+    def _write(self, path: pathlib.Path, dataframe: pd.DataFrame) -> bool:
+        """Write a dataframe to a cache entry.
+
+        The entry is written to a temporary file first and then moved into place,
+        so concurrent runs never read partial entries.
+        """
+        import pyarrow as pa
+
+        try:
+            table = _to_arrow(dataframe)
+        except (pa.ArrowException, ValueError, TypeError) as e:
+            logger.warning(f"Unable to cache table: {e}")
+            return False
+
+        temp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+
+        try:
+            if self.format == "feather":
+                import pyarrow.feather as feather
+                feather.write_feather(table, temp_path, compression="uncompressed")
+            else:
+                import pyarrow.parquet as parquet
+                parquet.write_table(table, temp_path)
+
+            os.replace(temp_path, path)
+        finally:
+            temp_path.unlink(missing_ok=True)
+
+        self.evict(keep=path)
+        return True
+
+    def _read_table(self,
+                    path: pathlib.Path,
+                    usecols: Optional[Callable[[Any], bool]] = None):
+        """Read a cache entry memory-mapped as pyarrow.Table.
+
+        Only columns satisfying the usecols predicate are read.
+        """
+        def _get_columns(names: list[str]) -> Optional[list[str]]:
+            return None if usecols is None else [name for name in names if usecols(name)]
+
+        if self.format == "feather":
+            import pyarrow.feather as feather
+
+            # memory-mapped, so unselected columns are never read
+            table = feather.read_table(path, memory_map=True)
+            columns = _get_columns(table.schema.names)
+
+            return table if columns is None else table.select(columns)
+
+        import pyarrow.parquet as parquet
+
+        columns = _get_columns(parquet.read_schema(path, memory_map=True).names)
+        return parquet.read_table(path, columns=columns, memory_map=True)
+
+    def _get_entry(self,
+                   file: pathlib.Path,
+                   read_method: Callable[[], pd.DataFrame]
+                   ) -> tuple[Optional[pathlib.Path], Optional[pd.DataFrame]]:
+        """Get the cache entry for a file, parsing and caching the table on a miss.
+
+        Returns the entry path or, if the table could not be cached, the parsed dataframe.
+        """
+        path = self.get_path(self.get_key(file))
+
+        if path.is_file():
+            logger.info(f"Table cache hit for '{file.name}'.")
+            # mark as recently used for eviction
+            os.utime(path)
+            return path, None
+
+        logger.info(f"Table cache miss for '{file.name}'.")
+        dataframe = read_method()
+
+        if self._write(path, dataframe):
+            return path, None
+
+        return None, dataframe
+
+    def read(self,
+             file: pathlib.Path,
+             read_method: Callable[[], pd.DataFrame],
+             usecols: Optional[Callable[[Any], bool]] = None) -> pd.DataFrame:
+        """Get a dataframe for a file from the cache.
+
+        On a cache miss, read_method is called to parse the entire table.
+        usecols is a column name predicate.
+        """
+        path, dataframe = self._get_entry(file, read_method)
+
+        if path is None:
+            if usecols is None:
+                return dataframe
+            return dataframe.loc[:, [usecols(column) for column in dataframe.columns]]
+
+        return _to_pandas(self._read_table(path, usecols=usecols))
+
+    def read_chunks(self,
+                    file: pathlib.Path,
+                    read_method: Callable[[], pd.DataFrame],
+                    chunksize: int,
+                    usecols: Optional[Callable[[Any], bool]] = None
+                    ) -> Iterator[pd.DataFrame]:
+        """Get a generator of dataframe chunks for a file from the cache.
+
+        Every chunk holds at most chunksize rows;
+        chunks are converted from the memory-mapped entry one at a time.
+        See read.
+        """
+        path, dataframe = self._get_entry(file, read_method)
+
+        if path is None:
+            if usecols is not None:
+                dataframe = dataframe.loc[:, [usecols(column) for column in dataframe.columns]]
+            yield from iter_batches(dataframe, chunksize)
+            return
+
+        table = self._read_table(path, usecols=usecols)
+
+        for start in range(0, table.num_rows, chunksize):
+            chunk = _to_pandas(table.slice(start, chunksize))
+            chunk.index = pd.RangeIndex(start, start + len(chunk))
+            yield chunk
+
+    def evict(self, keep: Optional[pathlib.Path] = None) -> None:
+        """Evict least recently used entries until the cache size is within max_size.
+
+        The entry at keep is never evicted.
+        """
+        entries = [
+            (path, path.stat())
+            for path in self.directory.glob(f"*.{self.format}")
+            if path != keep
+        ]
+
+        total_size = sum(stat.st_size for _, stat in entries)
+        if keep is not None and keep.is_file():
+            total_size += keep.stat().st_size
+
+        for path, stat in sorted(entries, key=lambda entry: entry[1].st_mtime):
+            if total_size <= self.max_size:
+                break
+
+            logger.info(f"Evicting table cache entry '{path.name}'.")
+            path.unlink(missing_ok=True)
+            total_size -= stat.st_size
@@ -3,36 +3,156 @@
 Functionality for DataFrame to RDF Graph conversions.
 """
 
+import contextlib
 import functools
+import itertools
+import os
 import pathlib
+import re
 
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
 from typing import (
     Any,
+    BinaryIO,
     Callable,
     Generator,
     Iterable,
     Optional,
     Self,
+    TextIO,
 )
 
 import pandas as pd
-from pandas.core.series import Series
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape, Template
+from jinja2 import Template
 # from lxml.etree import XMLParser, _Element
 from rdflib import Graph, URIRef, Namespace
-
+from rdflib.namespace import DefinedNamespaceMeta
+from rdflib.term import Node
+
+from tabulardf.bnodes import BNodeRenamer
+from tabulardf.incremental import (
+    IncrementalCache,
+    IncrementalStats,
+    IncrementalUpdate,
+    get_fingerprint,
+    get_row_hashes,
+    get_row_keys
+)
+from tabulardf.ntriples import is_ntriples_format, parse_ntriples
+from tabulardf.parallel import imap_ordered
+from tabulardf.profiling import NULL_PROFILER, Profiler
+from tabulardf.rows import iter_batches, iter_row_dicts
+from tabulardf.rules import ColumnRule, TermCache
+from tabulardf.serializers import serialize_graph
+from tabulardf.streaming import TripleWriter, get_streaming_format, open_destination
+from tabulardf.template_analysis import get_referenced_columns
+from tabulardf.template_environment import get_environment
+from tabulardf.template_triples import TRIPLE_FUNCTION_NAME, TRIPLE_SINK_NAME, TripleSink
+from tabulardf.triple_buffer import TripleBuffer
 from tabulardf.tabulardf_types import (
+    _RowRule,
+    _RuleResult,
     _RulesMapping,
     _RenderStrategy,
-    _TemplateReference
+    _TemplateReference,
+    _Triple
 )
+from tabulardf.turtle_utils import (
+    get_prefixes,
+    join_turtle_renderings,
+    remove_prefix_declarations
+)
+
+
+class RenderingParseError(Exception):  # noqa: D204
+    """Exception type for row renderings that cannot be parsed."""
+    pass
+
+
+# triples per Graph.addN call
+DEFAULT_ADD_BATCH_SIZE = 10_000
+
+# subject terms cached per FieldGraphConverter; caching is opt-in,
+# since it is only correct for pure subject rules (e.g. not for minting BNodes)
+DEFAULT_SUBJECT_CACHE_SIZE = 0
+
+# cached row documents per parse call for incremental conversions
+DEFAULT_INCREMENTAL_PARSE_BATCH_SIZE = 1_000
+
+# rendering formats that can be joined into a single Turtle document, see join_turtle_renderings
+_JOINABLE_FORMATS = {None, "turtle", "ttl", "text/turtle"}
+
+# IRIs the Turtle parser accepts but the N-Triples parser does not
+# (i.e. relative IRIs or IRIs with whitespace); may also match literals
+_NTRIPLES_UNSAFE_IRI = re.compile(r"<(?:[^:>]*|[^>]*\s[^>]*)>")
+
+# first line of cached row documents that must be parsed as Turtle
+_TURTLE_DOCUMENT_MARKER = "# turtle\n"
+
+
+def _get_triples(rule_result: _RuleResult, rule_name: str = "rule") -> Iterable[_Triple]:
+    """Get an iterable of triples from a rule result.
+
+    Rules may return an rdflib.Graph, a single triple,
+    an iterable (e.g. a generator) of triples or None;
+    other results (e.g. strings or terms) raise a TypeError naming the rule.
+    """
+    if rule_result is None:
+        return ()
+
+    if isinstance(rule_result, Graph):
+        return rule_result
+
+    if (isinstance(rule_result, tuple)
+            and len(rule_result) == 3
+            and isinstance(rule_result[0], Node)):
+        return (rule_result, )
+
+    if isinstance(rule_result, (str, bytes, Node)) or not isinstance(rule_result, Iterable):
+        raise TypeError(
+            f"{rule_name} must return an rdflib.Graph, a triple, "
+            f"an iterable of triples or None, not {type(rule_result).__name__}."
+        )
+
+    return rule_result
+
+
+def _get_bnode_renamer(bnode_safe: bool
+                       ) -> Optional[Callable[[Iterable[_Triple]], Iterable[_Triple]]]:
+    """Get a function that renames the blank nodes of a subgraph or None if bnode_safe is False.
+
+    See tabulardf.bnodes.BNodeRenamer.
+    """
+    return BNodeRenamer().rename if bnode_safe else None
+
+
+def _add_triples(graph: Graph,
+                 triples: Iterable[_Triple],
+                 batch_size: int = DEFAULT_ADD_BATCH_SIZE,
+                 profiler: Profiler = NULL_PROFILER) -> Graph:
+    """Bulk-insert triples into a graph with Graph.addN.
+
+    Triples are passed to the store in batches of batch_size;
+    every Graph.addN call is profiled as "merge".
+    """
+    quads = ((s, p, o, graph) for s, p, o in triples)
+    add_n = profiler.timed("merge", graph.addN)
+
+    while batch := list(itertools.islice(quads, batch_size)):
+        add_n(batch)
+
+    return graph
 
 
 class _GraphConverter(ABC):
     """ABC for GraphConverter classes."""
 
+    # subclasses may set a Profiler in __init__
+    _profiler: Profiler = NULL_PROFILER
+
     @property
     def graph(self) -> Graph:
         """Getter for the internal graph component."""
@@ -52,7 +172,118 @@ class _GraphConverter(ABC):
         if not self._graph:
             self._graph = self.to_graph()
 
-        return self._graph.serialize(*args, **kwargs)
+        with self._profiler.stage("serialize"):
+            return self._graph.serialize(*args, **kwargs)
+
+    def dump(self,
+             destination: str | os.PathLike | BinaryIO,
+             format: str = "nt",
+             compress: Optional[bool] = None) -> None:
+        """Serialize triples from graph component with a tabulardf serializer.
+
+        Unlike serialize, this uses the high-throughput N-Triples and flat Turtle serializers
+        of tabulardf.serializers; if compress is True (or None and destination ends with '.gz'),
+        output is gzip-compressed.
+        """
+        if not self._graph:
+            self._graph = self.to_graph()
+
+        with self._profiler.stage("serialize"):
+            serialize_graph(self._graph, destination, format=format, compress=compress)
+
+    @abstractmethod
+    def _generate_triples(self) -> Iterable[_Triple]:
+        """Construct a generator of triples.
+
+        Triples are generated lazily, e.g. row by row;
+        see the serialize_to_stream and to_buffer methods.
+        """
+        raise NotImplementedError
+
+    def to_buffer(self, buffer: Optional[TripleBuffer] = None) -> TripleBuffer:
+        """Accumulate triples into a dictionary-encoded TripleBuffer instead of the graph component.
+
+        Triples from _generate_triples are interned as integer IDs,
+        so e.g. the output of several converters can be accumulated, deduplicated and sorted
+        at a fraction of the memory of a graph before it is flushed (see tabulardf.triple_buffer).
+        Accumulating is profiled as "to_buffer"; the graph component is not modified.
+        """
+        buffer = TripleBuffer() if buffer is None else buffer
+
+        with self._profiler.stage("to_buffer"):
+            return buffer.extend(self._generate_triples())
+
+    def serialize_to_stream(self,
+                            destination: str | os.PathLike | TextIO,
+                            format: str = "nt") -> None:
+        """Serialize triples to a file or text stream as they are generated.
+
+        Unlike serialize, this never materializes the graph component;
+        triples are written as they are generated (e.g. row by row),
+        so memory consumption is bounded by the size of a single subgraph.
+
+        Only line-based formats are supported (N-Triples and N-Quads).
+        Note that triples generated more than once (e.g. for multiple rows)
+        are also written more than once.
+        """
+        with (self._profiler.stage("serialize_to_stream"),
+              open_destination(destination) as stream):
+            writer = TripleWriter(
+                stream,
+                format=format,
+                graph_identifier=self._graph.identifier
+            )
+
+            writer.write(self._generate_triples())
+
+
+# rows per chunk for process pool rendering
+DEFAULT_RENDER_CHUNKSIZE = 1_000
+
+# distinct row renderings kept for deduplication
+DEFAULT_DEDUPLICATION_CACHE_SIZE = 2 ** 16
+
+
+@dataclass
+class DeduplicationStats:
+    """Statistics of duplicate row deduplication, see TemplateConverter."""
+
+    rows: int = 0
+    renders: int = 0
+
+    @property
+    def saved(self) -> int:
+        """Get the number of renders saved."""
+        return self.rows - self.renders
+
+
+def _get_row_key(row: dict) -> str:
+    """Get a deduplication key for a row data dictionary.
+
+    Rows are compared by the repr of their values,
+    so values of different types (e.g. 1, 1.0 and '1') are not considered equal
+    while missing values (NaN) are.
+    """
+    return repr(tuple(row.values()))
+
+
+# worker process state for process pool rendering
+_worker_converter: Optional["TemplateConverter"] = None
+
+
+def _initialize_render_worker(converter_type: type["TemplateConverter"],
+                              converter_kwargs: dict) -> None:
+    """Build a converter (i.e. template and data context) once per worker process."""
+    global _worker_converter
+    _worker_converter = converter_type(
+        dataframe=pd.DataFrame(),
+        **converter_kwargs
+    )
+
+
+def _render_dataframe_chunk(dataframe: pd.DataFrame) -> list[str]:
+    """Render a dataframe chunk by row in a worker process."""
+    return list(_worker_converter._apply_template_to_dataframe(dataframe))
 
 
 class TemplateConverter:
@@ -72,26 +303,66 @@ class TemplateConverter:
       so iteration is done at the Python level, not in the template.
       Row data is available as 'row_data' dictionary within the template.
       See the render_by_row method.
+      Row renderings can be distributed over a process pool
+      with the workers parameter.
+
+    Conversion stages can be timed with a tabulardf.profiling.Profiler
+    passed as profiler parameter.
+
+    With a tabulardf.incremental.IncrementalCache passed as incremental parameter,
+    row renderings are cached and only new or changed rows are rendered again;
+    this applies to the "row" render strategy only.
+
+    If deduplicate_rows is True, rows with equal (projected) values are rendered only once
+    for the "row" render strategy and the rendering is reused for duplicate rows;
+    statistics are available from deduplication_stats after rendering.
+    Note that deduplication assumes that renderings only depend on row data,
+    not on state (e.g. counters in the data context).
+    With workers (see render_by_row), rows are deduplicated per chunk in the worker processes only
+    and deduplication_stats are not available (i.e. None).
     """
 
     def __init__(self,
                  *,
                  dataframe: pd.DataFrame,
                  template: _TemplateReference,
-                 data: Optional[dict] = None
+                 data: Optional[dict] = None,
+                 project_columns: bool = True,
+                 profiler: Optional[Profiler] = None,
+                 incremental: Optional[IncrementalCache] = None,
+                 deduplicate_rows: bool = False
                  ) -> None:
-        """Initialize a TemplateConverter."""
+        """Initialize a TemplateConverter.
+
+        If project_columns is True, the template is analyzed statically
+        and only the columns it references are converted to row data;
+        see tabulardf.template_analysis.get_referenced_columns.
+        """
         self.dataframe = dataframe
         # I want kwargs only, so no *templates
+        self._template_reference = template
         self.template = self._get_jinja_template(template)
         self.data = data or {}
+        self._project_columns = project_columns
+        self._columns = (
+            get_referenced_columns(self.template)
+            if project_columns
+            else None
+        )
+        self._profiler = NULL_PROFILER if profiler is None else profiler
+        self._incremental = incremental
+        self.incremental_stats: Optional[IncrementalStats] = None
+        self._deduplicate_rows = deduplicate_rows
+        self.deduplication_stats: Optional[DeduplicationStats] = None
 
     @staticmethod
     def _get_jinja_template_from_path(template_path: pathlib.Path) -> Template:
         """Get a jinja2.Template from a pathlib.Path.
 
-        Creates a jinja2.Environment using a FileSystemLoader
-        and generates a jinja2.Template from that loader instance.
+        Gets the shared jinja2.Environment for the template directory
+        (see tabulardf.template_environment.get_environment)
+        and generates a jinja2.Template from that environment;
+        compiled templates are cached in memory and on disk.
 
         Helper for _get_jinja_template.
         """
@@ -102,10 +373,7 @@ class TemplateConverter:
         template_folder_path = template_path.parent.absolute()
         template_file_name = template_path.name
 
-        environment = Environment(
-            loader=FileSystemLoader(template_folder_path),
-            autoescape=select_autoescape()
-        )
+        environment = get_environment(template_folder_path)
 
         template = environment.get_template(template_file_name)
 
@@ -129,48 +397,208 @@ class TemplateConverter:
         """Build a jinja2.Environment and init."""
         ...
 
-    # maybe make this a staticmethod = reuse in RowGraphConverter?
     def _get_table_data(self) -> Generator[dict, None, None]:
         """Construct a generator of row data dictionaries.
 
         This is intended to provide the template data for the render method.
         """
-        return (
-            row.to_dict()
-            for _, row
-            in self.dataframe.iterrows()
+        return self._profiler.iterate(
+            "rows",
+            iter_row_dicts(self._project_dataframe(self.dataframe))
         )
 
-    def _apply_template_to_row(self, row: Series) -> str:
-        """Generate a dict from a Series and pass it to Template.render."""
-        _row_dict = row.to_dict()
-        _data = {"row_data": _row_dict}
+    def _project_dataframe(self, dataframe: pd.DataFrame) -> pd.DataFrame:
+        """Project a dataframe to the columns referenced in the template.
+
+        If the referenced columns could not be determined, the dataframe is returned as is.
+        """
+        if self._columns is None:
+            return dataframe
+
+        return dataframe[
+            [column for column in dataframe.columns if column in self._columns]
+        ]
+
+    def _apply_template_to_row(self, row: dict) -> str:
+        """Pass a row data dictionary to Template.render."""
+        _data = {"row_data": row}
         self.data.update(_data)
 
         return self.template.render(self.data)
 
+    def _apply_template_to_rows_deduplicated(self,
+                                             rows: Iterable[dict],
+                                             apply_template: Callable[[dict], str],
+                                             skip_duplicates: bool = False
+                                             ) -> Generator[str, None, None]:
+        """Apply jinja renderings to distinct rows only.
+
+        Renderings of the last DEFAULT_DEDUPLICATION_CACHE_SIZE distinct rows are kept;
+        for duplicate rows, the kept rendering (or if skip_duplicates is True, an empty string)
+        is yielded. Helper for _apply_template_to_dataframe.
+        """
+        renderings: OrderedDict[str, str] = OrderedDict()
+        stats = self.deduplication_stats = DeduplicationStats()
+
+        for row in rows:
+            key = _get_row_key(row)
+            stats.rows += 1
+
+            rendering = renderings.get(key)
+
+            if rendering is None:
+                rendering = renderings[key] = apply_template(row)
+                stats.renders += 1
+
+                if len(renderings) > DEFAULT_DEDUPLICATION_CACHE_SIZE:
+                    renderings.popitem(last=False)
+
+                yield rendering
+            else:
+                renderings.move_to_end(key)
+                yield "" if skip_duplicates else rendering
+
     def _apply_template_to_dataframe(self,
-                                     dataframe: Optional[pd.DataFrame] = None
+                                     dataframe: Optional[pd.DataFrame] = None,
+                                     workers: Optional[int] = None,
+                                     chunksize: int = DEFAULT_RENDER_CHUNKSIZE,
+                                     skip_duplicates: bool = False
                                      ) -> Generator[str, None, None]:
-        """Apply jinja renderings to every row in a dataframe."""
-        dataframe = (
+        """Apply jinja renderings to every row in a dataframe.
+
+        If workers is given, the dataframe is split into chunks of chunksize rows
+        which get rendered in a process pool; renderings are yielded in row order.
+        If rows are deduplicated, skip_duplicates yields empty renderings for duplicate rows,
+        see _apply_template_to_rows_deduplicated.
+        """
+        dataframe = self._project_dataframe(
             self.dataframe
             if dataframe is None
             else dataframe
         )
 
-        for _, row in dataframe.iterrows():
-            yield self._apply_template_to_row(row)
+        if workers is None:
+            rows = self._profiler.iterate("rows", iter_row_dicts(dataframe))
+            apply_template = self._profiler.timed("render", self._apply_template_to_row)
+
+            if self._deduplicate_rows:
+                yield from self._apply_template_to_rows_deduplicated(
+                    rows, apply_template, skip_duplicates
+                )
+                return
+
+            for row in rows:
+                yield apply_template(row)
+        else:
+            yield from self._apply_template_to_dataframe_parallel(
+                dataframe, workers, chunksize
+            )
+
+    def _get_worker_kwargs(self) -> dict:
+        """Get the keyword arguments for initializing a converter in a worker process.
+
+        Note that with a non-fork multiprocessing start method
+        both the template reference and the data context must be picklable;
+        so a template path rather than a jinja2.Template object should be passed.
+        """
+        return {
+            "template": self._template_reference,
+            "data": self.data,
+            "project_columns": self._project_columns,
+            "deduplicate_rows": self._deduplicate_rows
+        }
+
+    def _apply_template_to_dataframe_parallel(self,
+                                              dataframe: pd.DataFrame,
+                                              workers: int,
+                                              chunksize: int
+                                              ) -> Generator[str, None, None]:
+        """Apply jinja renderings to dataframe chunks in a process pool.
+
+        Template and data context are built once per worker, not once per row.
+        Rows are deduplicated per chunk; deduplication_stats are not available.
+        Workers are not profiled; waiting for a chunk is profiled as "render_chunk".
+        Helper for _apply_template_to_dataframe.
+        """
+        renderings_chunks = imap_ordered(
+            _render_dataframe_chunk,
+            iter_batches(dataframe, chunksize),
+            workers=workers,
+            initializer=_initialize_render_worker,
+            initargs=(type(self), self._get_worker_kwargs())
+        )
+
+        for renderings in self._profiler.iterate("render_chunk", renderings_chunks):
+            yield from renderings
+
+    def _update_incremental(self,
+                            kind: str,
+                            convert_rows: Callable[[pd.DataFrame, list[int]], Iterable[str]]
+                            ) -> IncrementalUpdate:
+        """Convert the new and changed rows of the dataframe component.
+
+        Rows are identified and hashed (together with a fingerprint of template and data context)
+        according to the IncrementalCache; convert_rows gets passed a dataframe
+        of the new and changed rows and their positions and must return an output per row.
+        Outputs are stored per kind, see tabulardf.incremental.IncrementalCache.
+        """
+        data = {key: value for key, value in self.data.items() if key != "row_data"}
+
+        update = self._incremental.plan(
+            kind,
+            get_row_keys(self.dataframe, self._incremental.key_column),
+            get_row_hashes(
+                iter_row_dicts(self._project_dataframe(self.dataframe)),
+                get_fingerprint(self.template, data)
+            )
+        )
+
+        update.set_outputs(
+            convert_rows(self.dataframe.iloc[update.positions], update.positions)
+        )
+
+        self._incremental.commit(update)
+        self.incremental_stats = update.stats
+
+        return update
+
+    def _render_rows(self,
+                     workers: Optional[int] = None,
+                     chunksize: int = DEFAULT_RENDER_CHUNKSIZE
+                     ) -> Iterable[str]:
+        """Get the row renderings of the dataframe component.
+
+        In incremental mode, only new and changed rows are rendered
+        and cached renderings are reused for all other rows.
+        """
+        if self._incremental is None:
+            return self._apply_template_to_dataframe(
+                self.dataframe,
+                workers=workers,
+                chunksize=chunksize
+            )
+
+        update = self._update_incremental(
+            "rendering",
+            lambda dataframe, _: self._apply_template_to_dataframe(
+                dataframe,
+                workers=workers,
+                chunksize=chunksize
+            )
+        )
+
+        return iter(update.outputs)
 
     def _apply_to_renderings(self,
-                             call: Callable[[str], Any] = lambda x: x
+                             call: Callable[[str], Any] = lambda x: x,
+                             workers: Optional[int] = None
                              ) -> None:
         """Pass every row rendering to a callable.
 
         Auxiliary method for side-effect-only operations.
         For an application see e.g. the render_to_file method.
         """
-        for rendering in self._apply_template_to_dataframe(self.dataframe):
+        for rendering in self._render_rows(workers=workers):
             call(rendering)
 
     def render(self) -> str | Generator[str, None, None]:
@@ -186,34 +614,47 @@ class TemplateConverter:
         # bug fix: update data also for render
         table_data.update(self.data)
 
-        return self.template.render(table_data)
+        with self._profiler.stage("render"):
+            return self.template.render(table_data)
 
     # note: should this even be a a public method?
     # maybe run this with a strategy="row" paramter from render?
-    def render_by_row(self) -> Generator[str, None, None]:
+    def render_by_row(self,
+                      workers: Optional[int] = None,
+                      chunksize: int = DEFAULT_RENDER_CHUNKSIZE
+                      ) -> Generator[str, None, None]:
         """Render a jinja template by row.
 
         For every row iteration the template gets passed the current row data only;
         so iteration is done at the Python level, not in the template.
         The data passed to the template is a dictionary representing a table row
         and is accessible as 'row_data' in the template.
+
+        If workers is given, chunks of chunksize rows are rendered
+        in a process pool of that many worker processes.
+
+        In incremental mode, only new and changed rows are rendered
+        (when render_by_row is called, not lazily); see tabulardf.incremental.
         """
-        return self._apply_template_to_dataframe(self.dataframe)
+        return self._render_rows(workers=workers, chunksize=chunksize)
 
     @functools.wraps(open)
     def render_to_file(self,
                        *args,
                        render_strategy: _RenderStrategy = "table",
                        mode="w",
+                       workers: Optional[int] = None,
                        **kwargs) -> None:
         """Write renderings to a file.
 
         Signature proxied from builtins.open.
+        The workers parameter applies to the "row" render strategy only,
+        see render_by_row.
         """
         with open(*args, mode=mode, **kwargs) as f:
             match render_strategy:
                 case "row":
-                    self._apply_to_renderings(f.write)
+                    self._apply_to_renderings(f.write, workers=workers)
                 case "table":
                     f.write(self.render())
                 case _:
@@ -237,21 +678,312 @@ class TemplateGraphConverter(_GraphConverter, TemplateConverter):
 
     'to_graph' parses renderings with rdflib.Graph.parse
     and so merges row renderings to an rdflib.Graph component.
+
+    With parse_batch_size > 1, parse_batch_size row renderings are joined
+    (with deduplicated prefix declarations) and parsed in a single call;
+    if a batch fails to parse, its renderings are parsed one by one
+    so that a RenderingParseError names the offending row.
+
+    In incremental mode (see TemplateConverter), the triples of every row are cached
+    as N-Triples; only new or changed rows are rendered and parsed again
+    and triples of changed or deleted rows are retracted from the graph component
+    (unless other rows still generate them). Note that triples with blank nodes
+    cannot be retracted from a graph component populated by a previous run.
+
+    With deduplicate_rows (see TemplateConverter), renderings of duplicate rows
+    are not parsed again; so blank nodes are not repeated per duplicate row.
+
+    Templates can also emit triples directly with the triple tag or function
+    (see tabulardf.template_triples); such triples are added to the graph component
+    without parsing, while remaining non-whitespace rendering text is parsed as usual.
+
+    input_format declares the rdflib parser format of renderings;
+    by default, the format is guessed by rdflib (i.e. Turtle).
+    N-Triples renderings (input_format="nt") are parsed with a line parser
+    (see tabulardf.ntriples) and, for serialize_to_stream to N-Triples,
+    passed through to the output verbatim.
     """
 
-    def __init__(self, *args, graph: Optional[Graph] = None, **kwargs):
+    def __init__(self,
+                 *args,
+                 graph: Optional[Graph] = None,
+                 parse_batch_size: int = 1,
+                 input_format: Optional[str] = None,
+                 **kwargs):
         """Initialize a TemplateGraphConverter."""
         super().__init__(*args, **kwargs)
         self._graph = Graph() if graph is None else graph
+        self._parse_batch_size = parse_batch_size
+        self._input_format = input_format
+        self._ntriples_input = input_format is not None and is_ntriples_format(input_format)
 
-    def to_graph(self) -> Graph:
-        """Parse template row renderings and return the graph component."""
-        self._apply_to_renderings(
-            lambda data: self._graph.parse(data=data)
+    def _parse_rendering(self,
+                         rendering: str,
+                         position: int,
+                         graph: Graph) -> None:
+        """Parse a single row rendering into a graph.
+
+        Parse errors are re-raised as RenderingParseError naming the row.
+        """
+        if not rendering or rendering.isspace():
+            # e.g. skipped duplicate rows or templates that only emit triples
+            return
+
+        try:
+            if self._ntriples_input:
+                _add_triples(graph, parse_ntriples(rendering))
+            else:
+                graph.parse(data=rendering, format=self._input_format)
+        except Exception as e:
+            row = self.dataframe.index[position]
+            raise RenderingParseError(
+                f"Unable to parse rendering of row '{row}' (position {position}): {e}"
+            ) from e
+
+    def _parse_renderings_batch(self,
+                                renderings: list[str],
+                                start: int,
+                                graph: Graph) -> None:
+        """Parse a batch of row renderings into a graph.
+
+        The batch is parsed into a temporary graph first,
+        so a failing batch leaves no partial triples in the target graph.
+        Renderings of other formats than Turtle (e.g. N-Triples) are parsed one by one.
+        """
+        if len(renderings) == 1:
+            self._parse_rendering(renderings[0], start, graph)
+            return
+
+        if all(not rendering or rendering.isspace() for rendering in renderings):
+            return
+
+        joined = (
+            join_turtle_renderings(renderings)
+            if self._input_format in _JOINABLE_FORMATS
+            else None
         )
 
+        if joined is not None:
+            data, prefixes = joined
+
+            try:
+                batch_graph = Graph().parse(data=data, format="turtle")
+            except Exception:
+                pass
+            else:
+                for label, iri in prefixes.items():
+                    graph.bind(label, iri)
+
+                graph += batch_graph
+                return
+
+        # fallback: parse per row
+        for position, rendering in enumerate(renderings, start=start):
+            self._parse_rendering(rendering, position, graph)
+
+    @contextlib.contextmanager
+    def _collect_triples(self) -> Generator[TripleSink, None, None]:
+        """Provide a TripleSink in the data context while rendering.
+
+        The sink is provided under a reserved name for the triple tag
+        and as 'triple' function, unless the data context defines 'triple' itself;
+        the data context is restored afterwards. See tabulardf.template_triples.
+        """
+        if TRIPLE_SINK_NAME in self.data:
+            raise ValueError(
+                f"'{TRIPLE_SINK_NAME}' is reserved for the triple sink "
+                "and must not be defined in the data context."
+            )
+
+        sink = TripleSink()
+        names = [TRIPLE_SINK_NAME]
+        self.data[TRIPLE_SINK_NAME] = sink.triple
+
+        if TRIPLE_FUNCTION_NAME not in self.data:
+            names.append(TRIPLE_FUNCTION_NAME)
+            self.data[TRIPLE_FUNCTION_NAME] = sink.triple
+
+        try:
+            yield sink
+        finally:
+            for name in names:
+                self.data.pop(name, None)
+
+    def _generate_rendering_batches(self
+                                    ) -> Generator[tuple[int, list[str], list[_Triple]], None, None]:
+        """Construct a generator of row rendering batches.
+
+        Every batch holds at most parse_batch_size renderings
+        and is yielded together with the row position of its first rendering
+        and the triples emitted directly by the templates of the batch.
+        Renderings of duplicate rows are empty, so they are not parsed again.
+        """
+        with self._collect_triples() as sink:
+            renderings = self._apply_template_to_dataframe(self.dataframe, skip_duplicates=True)
+            batch_size = max(self._parse_batch_size, 1)
+
+            for start in itertools.count(0, batch_size):
+                batch = list(itertools.islice(renderings, batch_size))
+
+                if not batch:
+                    break
+
+                yield start, batch, sink.take()
+
+    def _convert_rows_to_ntriples(self,
+                                  dataframe: pd.DataFrame,
+                                  positions: list[int]) -> Generator[str, None, None]:
+        """Parse row renderings and generate a document per row for the incremental cache.
+
+        Documents hold the prefix declarations of the rendering
+        followed by the parsed triples as N-Triples; see _parse_documents.
+        Documents with IRIs that are not valid in N-Triples are marked for the Turtle parser.
+        Rows are not deduplicated, so every document holds the triples emitted by its row.
+        """
+        rows = iter_row_dicts(self._project_dataframe(dataframe))
+        apply_template = self._profiler.timed("render", self._apply_template_to_row)
+        parse = self._profiler.timed("parse", self._parse_rendering)
+
+        with self._collect_triples() as sink:
+            for position, row in zip(positions, rows):
+                rendering = apply_template(row)
+
+                graph = Graph()
+                _add_triples(graph, sink.take())
+                parse(rendering, position, graph)
+
+                prefixes = "".join(
+                    f"@prefix {label}: <{iri}> .\n"
+                    for label, iri in get_prefixes(rendering).items()
+                )
+
+                ntriples = graph.serialize(format="nt")
+                marker = (
+                    _TURTLE_DOCUMENT_MARKER
+                    if _NTRIPLES_UNSAFE_IRI.search(ntriples)
+                    else ""
+                )
+
+                yield marker + prefixes + ntriples
+
+    @staticmethod
+    def _parse_documents(documents: list[str], graph: Graph) -> Graph:
+        """Parse cached row documents into a graph.
+
+        Documents are joined in batches and parsed with the (faster) N-Triples parser;
+        prefix declarations are bound to the graph.
+        Blank node labels are unique across documents, see _convert_rows_to_ntriples.
+        Documents marked for the Turtle parser are parsed one by one.
+        """
+        batch_size = DEFAULT_INCREMENTAL_PARSE_BATCH_SIZE
+        ntriples_documents = []
+
+        for document in documents:
+            if document.startswith(_TURTLE_DOCUMENT_MARKER):
+                graph.parse(data=document, format="turtle")
+            else:
+                ntriples_documents.append(document)
+
+        for start in range(0, len(ntriples_documents), batch_size):
+            data = "".join(ntriples_documents[start:start + batch_size])
+
+            for label, iri in get_prefixes(data).items():
+                graph.bind(label, iri)
+
+            graph.parse(data=remove_prefix_declarations(data), format="nt")
+
+        return graph
+
+    def _to_graph_incremental(self) -> Graph:
+        """Retract stale triples from the graph component and add the triples of all rows.
+
+        Only new and changed rows are rendered and parsed, see _update_incremental.
+        Stale triples (i.e. triples of changed and deleted rows) are retracted first,
+        so triples still generated by another row are added again.
+        """
+        update = self._update_incremental("ntriples", self._convert_rows_to_ntriples)
+
+        if update.stale:
+            for triple in self._parse_documents(update.stale, Graph()):
+                self._graph.remove(triple)
+
+        return self._parse_documents(update.outputs, self._graph)
+
+    def _generate_triples(self) -> Generator[_Triple, None, None]:
+        """Construct a generator of triples parsed from rendering batches.
+
+        In incremental mode, triples are parsed from the cached row documents.
+        """
+        if self._incremental is not None:
+            update = self._update_incremental("ntriples", self._convert_rows_to_ntriples)
+            yield from self._parse_documents(update.outputs, Graph())
+            return
+
+        parse = self._profiler.timed("parse", self._parse_renderings_batch)
+
+        for start, batch, triples in self._generate_rendering_batches():
+            graph = Graph()
+            _add_triples(graph, triples)
+            parse(batch, start, graph)
+
+            yield from graph
+
+    def to_graph(self) -> Graph:
+        """Parse template row renderings and return the graph component.
+
+        Every parsed batch is profiled as "parse";
+        with a parse_batch_size of 1, the call number is the row position.
+        """
+        parse = self._profiler.timed("parse", self._parse_renderings_batch)
+
+        with self._profiler.stage("to_graph"):
+            if self._incremental is not None:
+                return self._to_graph_incremental()
+
+            for start, batch, triples in self._generate_rendering_batches():
+                _add_triples(self._graph, triples, profiler=self._profiler)
+                parse(batch, start, self._graph)
+
         return self._graph
 
+    def _write_ntriples_renderings(self, stream: TextIO) -> None:
+        """Write N-Triples renderings to a text stream verbatim.
+
+        Renderings with blank node labels are parsed and written as triples,
+        since labels are scoped to a rendering; note that other renderings are not validated.
+        """
+        writer = TripleWriter(stream, format="nt")
+        parse = self._profiler.timed("parse", self._parse_rendering)
+
+        for start, batch, triples in self._generate_rendering_batches():
+            writer.write(triples)
+
+            for position, rendering in enumerate(batch, start=start):
+                if "_:" in rendering:
+                    graph = Graph()
+                    parse(rendering, position, graph)
+                    writer.write(graph)
+                elif rendering and not rendering.isspace():
+                    stream.write(rendering if rendering.endswith("\n") else f"{rendering}\n")
+
+    def serialize_to_stream(self,
+                            destination: str | os.PathLike | TextIO,
+                            format: str = "nt") -> None:
+        """Serialize triples to a file or text stream as they are generated.
+
+        See _GraphConverter.serialize_to_stream.
+        If both input_format and format are N-Triples, renderings are passed through
+        without parsing (except in incremental mode), see _write_ntriples_renderings.
+        """
+        if (not self._ntriples_input
+                or self._incremental is not None
+                or get_streaming_format(format) != "nt"):
+            return super().serialize_to_stream(destination, format=format)
+
+        with (self._profiler.stage("serialize_to_stream"),
+              open_destination(destination) as stream):
+            self._write_ntriples_renderings(stream)
+
 
 class RowGraphConverter(_GraphConverter):
     """Callable-based pandas.DataFrame to rdflib.Graph converter.
@@ -259,40 +991,54 @@ class RowGraphConverter(_GraphConverter):
     Iterates over a dataframe and applies row_rule for every row.
 
     For every row the row_rule gets passed the row_data as dictionry
-    and is responsible for returning an rdflib.Graph instance (a 'row graph');
-    thus generated subgraphs are then merged into a graph component.
+    and is responsible for returning an rdflib.Graph instance (a 'row graph'),
+    a single triple or an iterable of triples (e.g. by yielding triples);
+    thus generated triples are then bulk-inserted into a graph component.
+
+    If bnode_safe is True, blank nodes are scoped to the row graph they occur in
+    and renamed while merging (see tabulardf.bnodes.BNodeRenamer);
+    so e.g. a BNode("x") minted for every row yields a distinct blank node per row.
     """
 
     def __init__(self,
                  dataframe: pd.DataFrame,
                  *,
-                 row_rule: Callable[[dict], Graph],
-                 graph: Optional[Graph] = None) -> None:
+                 row_rule: _RowRule,
+                 graph: Optional[Graph] = None,
+                 profiler: Optional[Profiler] = None,
+                 bnode_safe: bool = False) -> None:
         """Initialize a RowGraphConverter instance."""
         self._df = dataframe
         self._row_rule = row_rule
         self._graph = Graph() if graph is None else graph
+        self._profiler = NULL_PROFILER if profiler is None else profiler
+        self._rename_bnodes = _get_bnode_renamer(bnode_safe)
 
-    def _generate_graphs(self) -> Generator[Graph, None, None]:
-        """Construct a generator of subgraphs for merging.
+    def _generate_triples(self) -> Generator[_Triple, None, None]:
+        """Construct a generator of triples for merging.
 
         Iterates over the dataframe component and passes row data
         as a dictionary to a callable which is responsible for
-        generating an instance of rdflib.Graph.
+        generating an rdflib.Graph instance or triples.
+        Note that if row_rule generates triples lazily,
+        generating is profiled as "merge", not as "rule".
         """
-        for _, row in self._df.iterrows():
-            row_dict = row.to_dict()
-            yield self._row_rule(row_dict)
+        rows = self._profiler.iterate("rows", iter_row_dicts(self._df))
+        row_rule = self._profiler.timed("rule", self._row_rule)
+        rename_bnodes = self._rename_bnodes
 
-    def to_graph(self):
-        """Merge triples from _generate_graphs and return graph component."""
-        # generate subgraphs
-        _graphs_generator = self._generate_graphs()
-
-        for graph in _graphs_generator:
-            self._graph += graph
+        for row_dict in rows:
+            triples = _get_triples(row_rule(row_dict), "row_rule")
+            yield from rename_bnodes(triples) if rename_bnodes else triples
 
-        return self._graph
+    def to_graph(self):
+        """Merge triples from _generate_triples and return graph component."""
+        with self._profiler.stage("to_graph"):
+            return _add_triples(
+                self._graph,
+                self._generate_triples(),
+                profiler=self._profiler
+            )
 
 
 class FieldGraphConverter(_GraphConverter):
@@ -311,8 +1057,24 @@ class FieldGraphConverter(_GraphConverter):
          (state can thus be shared between callables and also FieldGraphConverters).
 
     Callables of column_rules are responsible for
-    returning an rdflib.Graph instance (a 'field graph');
-    thus generated subgraphs are then merged into a graph component.
+    returning an rdflib.Graph instance (a 'field graph'),
+    a single triple or an iterable of triples (e.g. by yielding triples);
+    thus generated triples are then bulk-inserted into a graph component.
+
+    Alternatively, tabulardf.rules.ColumnRule instances in column_rules
+    are applied once per column batch (instead of once per field)
+    and get passed a Series of subjects and the Series of the column;
+    see tabulardf.rules for vectorized helpers.
+
+    For pure subject rules, subject terms can be memoized in a bounded LRU cache
+    by passing a subject_cache_size greater than 0;
+    cache statistics are available from cache_info.
+
+    If bnode_safe is True, blank nodes are scoped to the field graph
+    (or ColumnRule result) they occur in and renamed while merging,
+    see tabulardf.bnodes.BNodeRenamer; blank node subjects are scoped to their row,
+    i.e. a row's subject is renamed once and shared by all its field graphs
+    (and ColumnRule results).
     """
 
     store: dict = dict()
@@ -325,75 +1087,183 @@ class FieldGraphConverter(_GraphConverter):
                      Callable[[Any], URIRef] | Namespace
                  ] = None,
                  column_rules: _RulesMapping,
-                 graph: Optional[Graph] = None) -> None:
+                 graph: Optional[Graph] = None,
+                 subject_cache_size: int = DEFAULT_SUBJECT_CACHE_SIZE,
+                 profiler: Optional[Profiler] = None,
+                 bnode_safe: bool = False) -> None:
         """Initialize a DFGraphConverter instance."""
         self._df = dataframe
         self._subject_column = subject_column
         self._subject_rule = subject_rule
+        self._subject_cache = self._get_subject_cache(subject_rule, subject_cache_size)
         self._column_rules = column_rules
         # bug fix: this allows also empty but namespaced graphs
         self._graph = Graph() if graph is None else graph
+        self._profiler = NULL_PROFILER if profiler is None else profiler
+        self._bnode_renamer = BNodeRenamer() if bnode_safe else None
+
+    @staticmethod
+    def _get_subject_cache(subject_rule: Optional[Callable[[Any], URIRef] | Namespace],
+                           maxsize: int) -> Optional[Callable[[Any], URIRef]]:
+        """Get a memoized subject_rule.
+
+        The subject_rule kind is determined once:
+        rdflib namespaces (including DefinedNamespaces such as rdflib.RDF,
+        which are callable classes) and other non-callables (e.g. Sequence types)
+        get subscripted, other callables get called.
+        Subject terms are cached in a bounded LRU TermCache
+        if maxsize is greater than 0.
+        """
+        if not subject_rule:
+            return None
+
+        subject_factory = (
+            subject_rule
+            if callable(subject_rule)
+            and not isinstance(subject_rule, (Namespace, DefinedNamespaceMeta))
+            else subject_rule.__getitem__
+        )
 
-    def _apply_subject_rule(self, row: pd.Series) -> URIRef:
-        """Apply subject_rule to the subject_column of a pd.Series row.
+        if maxsize == 0:
+            return subject_factory
+
+        return TermCache(subject_factory, maxsize=maxsize)
+
+    def _apply_subject_rule(self, row: dict) -> URIRef:
+        """Apply subject_rule to the subject_column of a row dictionary.
 
         Conveniently allows to also pass an rdflib.Namespace
         (or generally Sequence types) as subject_rule.
         """
-        try:
-            # call
-            _sub_uri = self._subject_rule(row[self._subject_column])
-        except TypeError:
-            # getitem
-            _sub_uri = self._subject_rule[row[self._subject_column]]
+        return self._subject_cache(row[self._subject_column])
 
-        return _sub_uri
+    def cache_info(self) -> dict[str, Any]:
+        """Get hit and miss statistics of the subject and term caches.
 
-    def _generate_graphs(self) -> Generator[Graph, None, None]:
-        """Loop over table rows of the provided DataFrame.
-
-        Generates and returns a Generator of graph objects for merging.
+        Returns a mapping of "subjects" and column names to functools.lru_cache statistics
+        for the subject cache and the TermCaches of ColumnRules respectively.
         """
-        for _, row in self._df.iterrows():
-
-            _subject = (
-                self._apply_subject_rule(row)
-                if self._subject_rule
-                else row[self._subject_column]
+        cache_info = {
+            "subjects": (
+                self._subject_cache.cache_info()
+                if isinstance(self._subject_cache, TermCache)
+                else None
             )
+        }
 
-            for field, rule in self._column_rules.items():
-                _object = row[field]
+        for field, rule in self._column_rules.items():
+            if isinstance(rule, ColumnRule) and rule.term_cache is not None:
+                cache_info[field] = rule.cache_info()
 
-                field_rule_result = rule(
-                    _subject,
-                    _object,
-                    self.store
-                )
+        return cache_info
 
-                # yield only rdflib.Graph instances
-                if isinstance(field_rule_result, Graph):
-                    yield field_rule_result
-                continue
-
-    def _merge_to_graph_component(self, graphs: Iterable[Graph]) -> Graph:
-        """Merge subgraphs to main graph.
+    def _generate_triples(self) -> Generator[_Triple, None, None]:
+        """Loop over table rows of the provided DataFrame.
 
-        Loops over a graphs generator and merges every field_graph with the
-        self._graph component. Returns the modified self._graph component.
+        Generates and returns a Generator of triples for merging.
+        Field rules are applied per field; ColumnRules are applied per batch.
+        Field rules are profiled as "rule" (per field), ColumnRules as "column_rule" (per batch).
         """
-        # warning: this is not BNode-safe (yet)!!!
-        # todo: how to do BNode-safe graph merging?
-        for graph in graphs:
-            self._graph += graph
-
-        return self._graph
+        profiler = self._profiler
+        renamer = self._bnode_renamer
+
+        field_rules = {
+            field: profiler.timed("rule", rule)
+            for field, rule in self._column_rules.items()
+            if not isinstance(rule, ColumnRule)
+        }
+        column_rules = {
+            field: profiler.timed("column_rule", rule)
+            for field, rule in self._column_rules.items()
+            if isinstance(rule, ColumnRule)
+        }
+
+        for batch in iter_batches(self._df):
+            with profiler.stage("rows"):
+                rows = list(iter_row_dicts(batch, batch_size=max(len(batch), 1)))
+
+            with profiler.stage("subjects"):
+                subjects = [
+                    self._apply_subject_rule(row)
+                    if self._subject_rule
+                    else row[self._subject_column]
+                    for row in rows
+                ]
+
+            # blank node subjects renamed once per row
+            subject_scopes: list[dict] = []
+            renamed_subjects = subjects
+
+            if renamer:
+                renamed_subjects = []
+
+                for _subject in subjects:
+                    subject_scope: dict = {}
+                    renamed_subjects.append(renamer.rename_node(_subject, subject_scope))
+                    subject_scopes.append(subject_scope)
+
+            for index, (row, _subject) in enumerate(zip(rows, subjects)):
+                for field, rule in field_rules.items():
+                    _object = row[field]
+
+                    field_rule_result = rule(
+                        _subject,
+                        _object,
+                        self.store
+                    )
+
+                    triples = _get_triples(field_rule_result, f"Rule for column '{field}'")
+                    yield from (
+                        renamer.rename(triples, dict(subject_scopes[index]))
+                        if renamer
+                        else triples
+                    )
+
+            if column_rules:
+                # ColumnRules get the renamed subjects of their rows
+                subjects_series = pd.Series(
+                    renamed_subjects,
+                    index=batch.index,
+                    dtype=object
+                )
+                # renamed subjects are kept as is
+                renamed_subject_scope = {
+                    renamed: renamed
+                    for subject_scope in subject_scopes
+                    for renamed in subject_scope.values()
+                }
+
+                for field, rule in column_rules.items():
+                    column_rule_result = rule(
+                        subjects_series,
+                        batch[field],
+                        self.store
+                    )
+
+                    triples = _get_triples(column_rule_result, f"ColumnRule for column '{field}'")
+                    yield from (
+                        renamer.rename(triples, dict(renamed_subject_scope))
+                        if renamer
+                        else triples
+                    )
+
+    def _merge_to_graph_component(self, triples: Iterable[_Triple]) -> Graph:
+        """Merge triples to main graph.
+
+        Bulk-inserts triples into the self._graph component.
+        Returns the modified self._graph component.
+
+        Note: blank nodes are only merged safely if bnode_safe is True,
+        in which case they are renamed per field graph (and subjects per row) in _generate_triples.
+        """
+        return _add_triples(self._graph, triples, profiler=self._profiler)
 
     def to_graph(self) -> Graph:
-        """Merge triples from _generate_graphs and return the graph component."""
-        # generate subgraphs
-        _graphs_generator = self._generate_graphs()
-        # merge subgraphs to graph component
-        self._merge_to_graph_component(_graphs_generator)
+        """Merge triples from _generate_triples and return the graph component."""
+        with self._profiler.stage("to_graph"):
+            # generate triples
+            _triples_generator = self._generate_triples()
+            # merge triples to graph component
+            self._merge_to_graph_component(_triples_generator)
 
         return self._graph
@@ -0,0 +1,271 @@
+"""Incremental conversions for TabulaRDF template converters.
+
+Functionality for caching per-row outputs (renderings or triples)
+keyed by content hashes in a local SQLite database,
+so repeated conversions only render rows that are new or changed.
+"""
+
+import contextlib
+import dataclasses
+import hashlib
+import os
+import sqlite3
+import types
+
+from collections.abc import Mapping
+from typing import Any, Generator, Iterable, Optional
+
+import pandas as pd
+
+from jinja2 import Template
+
+from tabulardf.template_analysis import get_template_source
+
+
+class IncrementalKeyError(Exception):  # noqa: D204
+    """Exception type for row keys that do not identify rows uniquely."""
+    pass
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS rows (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    hash TEXT NOT NULL,
+    output TEXT NOT NULL,
+    PRIMARY KEY (namespace, key)
+)
+"""
+
+
+def _update_code_hash(hasher: "hashlib._Hash", code: types.CodeType) -> None:
+    """Update a hash with a code object, including nested code objects.
+
+    Unlike marshal.dumps, this is deterministic across interpreter runs.
+    """
+    hasher.update(code.co_code)
+    hasher.update(repr(code.co_names).encode("utf-8"))
+
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            _update_code_hash(hasher, const)
+        else:
+            hasher.update(repr(const).encode("utf-8"))
+
+
+def _update_value_hash(hasher: "hashlib._Hash", value: Any) -> None:
+    """Update a hash with a template data context value.
+
+    Mappings are hashed recursively and functions by their code;
+    other values are hashed by their repr.
+    """
+    if isinstance(value, Mapping):
+        for key in sorted(value, key=repr):
+            hasher.update(repr(key).encode("utf-8"))
+            _update_value_hash(hasher, value[key])
+    elif isinstance(code := getattr(value, "__code__", None), types.CodeType):
+        _update_code_hash(hasher, code)
+    else:
+        hasher.update(repr(value).encode("utf-8"))
+
+
+def get_fingerprint(template: Template, data: Optional[dict] = None) -> str:
+    """Get a fingerprint of a template and a template data context.
+
+    Templates are fingerprinted by their source if available,
+    else by their compiled code. Note that changes in included or extended templates
+    and in data context values with an unstable repr (e.g. '<object at 0x...>')
+    are not detected or always detected respectively.
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    source = get_template_source(template)
+
+    if source is not None:
+        hasher.update(source.encode("utf-8"))
+    else:
+        _update_code_hash(hasher, template.root_render_func.__code__)
+
+        for name, block in sorted(template.blocks.items()):
+            hasher.update(name.encode("utf-8"))
+            _update_code_hash(hasher, block.__code__)
+
+    _update_value_hash(hasher, data or {})
+
+    return hasher.hexdigest()
+
+
+def get_row_hashes(rows: Iterable[dict], fingerprint: str) -> list[str]:
+    """Get content hashes of row data dictionaries combined with a fingerprint."""
+    base = hashlib.blake2b(fingerprint.encode("utf-8"), digest_size=16)
+    hashes = []
+
+    for row in rows:
+        hasher = base.copy()
+        hasher.update(repr(tuple(row.items())).encode("utf-8"))
+        hashes.append(hasher.hexdigest())
+
+    return hashes
+
+
+def get_row_keys(dataframe: pd.DataFrame, key_column: Optional[Any] = None) -> list[str]:
+    """Get unique row keys from the key column or (if None) the index of a dataframe."""
+    if key_column is not None and key_column not in dataframe.columns:
+        raise IncrementalKeyError(f"Key column '{key_column}' not in table.")
+
+    values = (
+        dataframe.index
+        if key_column is None
+        else dataframe[key_column]
+    ).tolist()
+
+    keys = [repr(value) for value in values]
+
+    if len(set(keys)) != len(keys):
+        raise IncrementalKeyError(
+            f"Row keys of {'the index' if key_column is None else repr(key_column)} "
+            "are not unique; use a key column that identifies rows."
+        )
+
+    return keys
+
+
+@dataclasses.dataclass
+class IncrementalStats:
+    """Row statistics of an incremental conversion."""
+
+    unchanged: int = 0
+    changed: int = 0
+    added: int = 0
+    deleted: int = 0
+
+    @property
+    def rendered(self) -> int:
+        """Get the number of rendered (i.e. changed or added) rows."""
+        return self.changed + self.added
+
+
+@dataclasses.dataclass
+class IncrementalUpdate:
+    """An incremental update of the outputs of a table.
+
+    outputs holds an output per row in row order; cached outputs are set,
+    outputs of rows in positions (new or changed rows) are None until set_outputs.
+    stale holds the cached outputs of changed and deleted rows.
+    """
+
+    kind: str
+    keys: list[str]
+    hashes: list[str]
+    outputs: list[Optional[str]]
+    positions: list[int]
+    stale: list[str]
+    deleted: list[str]
+    stats: IncrementalStats
+
+    def set_outputs(self, outputs: Iterable[str]) -> None:
+        """Set the outputs for the rows in positions."""
+        for position, output in zip(self.positions, outputs, strict=True):
+            self.outputs[position] = output
+
+
+class IncrementalCache:
+    """SQLite-backed cache of per-row conversion outputs.
+
+    Rows are identified by the key column or (if key_column is None) by the dataframe index;
+    a row is rendered again if the hash of its (projected) values,
+    the template and the template data context changed.
+    Outputs of deleted rows are removed from the cache.
+
+    Multiple tables can share a database file with distinct namespaces.
+    """
+
+    def __init__(self,
+                 path: str | os.PathLike,
+                 namespace: str = "default",
+                 key_column: Optional[Any] = None) -> None:
+        """Initialize an IncrementalCache."""
+        self.path = path
+        self.namespace = namespace
+        self.key_column = key_column
+
+        with self._connect() as connection:
+            connection.execute(_SCHEMA)
+
+    @contextlib.contextmanager
+    def _connect(self) -> Generator[sqlite3.Connection, None, None]:
+        """Get a connection; changes are committed on success."""
+        with contextlib.closing(sqlite3.connect(self.path)) as connection:
+            with connection:
+                yield connection
+
+    def _get_namespace(self, kind: str) -> str:
+        """Get the namespace for an output kind (e.g. renderings or triples)."""
+        return f"{self.namespace}/{kind}"
+
+    def plan(self, kind: str, keys: list[str], hashes: list[str]) -> IncrementalUpdate:
+        """Compare row keys and hashes against the cache.
+
+        Returns an IncrementalUpdate holding the cached outputs of unchanged rows
+        and the positions of rows that must be converted.
+        """
+        with self._connect() as connection:
+            entries = {
+                key: (row_hash, output)
+                for key, row_hash, output in connection.execute(
+                    "SELECT key, hash, output FROM rows WHERE namespace = ?",
+                    (self._get_namespace(kind), )
+                )
+            }
+
+        stats = IncrementalStats()
+        outputs: list[Optional[str]] = []
+        positions, stale = [], []
+
+        for position, (key, row_hash) in enumerate(zip(keys, hashes)):
+            entry = entries.pop(key, None)
+
+            if entry is not None and entry[0] == row_hash:
+                stats.unchanged += 1
+                outputs.append(entry[1])
+                continue
+
+            if entry is None:
+                stats.added += 1
+            else:
+                stats.changed += 1
+                stale.append(entry[1])
+
+            outputs.append(None)
+            positions.append(position)
+
+        # remaining entries belong to deleted rows
+        stats.deleted = len(entries)
+        stale.extend(output for _, output in entries.values())
+
+        return IncrementalUpdate(
+            kind=kind,
+            keys=keys,
+            hashes=hashes,
+            outputs=outputs,
+            positions=positions,
+            stale=stale,
+            deleted=list(entries),
+            stats=stats
+        )
+
+    def commit(self, update: IncrementalUpdate) -> None:
+        """Store the outputs of converted rows and remove deleted rows."""
+        namespace = self._get_namespace(update.kind)
+
+        with self._connect() as connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO rows VALUES (?, ?, ?, ?)",
+                (
+                    (namespace, update.keys[position], update.hashes[position], update.outputs[position])
+                    for position in update.positions
+                )
+            )
+            connection.executemany(
+                "DELETE FROM rows WHERE namespace = ? AND key = ?",
+                ((namespace, key) for key in update.deleted)
+            )
@@ -0,0 +1,139 @@
+"""N-Triples parsing for TabulaRDF template conversions.
+
+Functionality for parsing N-Triples renderings line by line into triples,
+without rdflib's parser plugin machinery and format guessing.
+
+The grammar mirrors rdflib.plugins.parsers.ntriples (with validation disabled),
+so the parsed triples equal those of Graph.parse(format="nt").
+"""
+
+import functools
+import re
+
+from rdflib import BNode, Literal, URIRef
+
+from tabulardf.streaming import STREAMING_FORMATS
+from tabulardf.tabulardf_types import _Triple
+
+
+class NTriplesParseError(Exception):  # noqa: D204
+    """Exception type for invalid N-Triples lines."""
+    pass
+
+
+# IRI cache entries; predicates and types typically repeat for every row
+DEFAULT_IRI_CACHE_SIZE = 2 ** 14
+
+_IRI = r'<([^:]+:[^\s"<>]*)>'
+_NODE_ID = r"_:([A-Za-z0-9_:](?:[-A-Za-z0-9_:\.]*[-A-Za-z0-9_:])?)"
+_LITERAL = (
+    r'"([^"\\]*(?:\\.[^"\\]*)*)"'
+    r'(?:@([a-zA-Z]+(?:-[a-zA-Z0-9]+)*)|\^\^' + _IRI + r")?"
+)
+
+_TRIPLE_PATTERN = re.compile(
+    rf"[ \t]*(?:{_IRI}|{_NODE_ID})"
+    rf"[ \t]+{_IRI}"
+    rf"[ \t]+(?:{_IRI}|{_NODE_ID}|{_LITERAL})"
+    r"[ \t]*\.[ \t]*(?:#.*)?"
+)
+
+_EMPTY_LINE_PATTERN = re.compile(r"[ \t]*(?:#.*)?")
+_NEWLINE_PATTERN = re.compile(r"\r\n|\r|\n")
+_ESCAPE_PATTERN = re.compile(r"\\(?:u([0-9A-Fa-f]{4})|U([0-9A-Fa-f]{8})|(.))")
+
+_ESCAPES = {
+    "t": "\t",
+    "b": "\b",
+    "n": "\n",
+    "r": "\r",
+    "f": "\f",
+    '"': '"',
+    "'": "'",
+    "\\": "\\",
+}
+
+
+def is_ntriples_format(format: str) -> bool:
+    """Check if a format name denotes N-Triples (e.g. "nt" or "application/n-triples")."""
+    return STREAMING_FORMATS.get(format) == "nt"
+
+
+def _replace_escape(match: re.Match) -> str:
+    """Get the character for an escape sequence match."""
+    code = match.group(1) or match.group(2)
+
+    if code is not None:
+        return chr(int(code, 16))
+
+    try:
+        return _ESCAPES[match.group(3)]
+    except KeyError:
+        raise NTriplesParseError(f"Illegal escape: {match.group(0)!r}") from None
+
+
+def _unescape(value: str) -> str:
+    """Resolve the escape sequences of an IRI or literal."""
+    if "\\" not in value:
+        return value
+
+    return _ESCAPE_PATTERN.sub(_replace_escape, value)
+
+
+@functools.lru_cache(maxsize=DEFAULT_IRI_CACHE_SIZE)
+def _get_iri(value: str) -> URIRef:
+    """Get a (cached) URIRef for an escaped IRI."""
+    return URIRef(_unescape(value))
+
+
+def parse_ntriples(data: str) -> list[_Triple]:
+    """Parse an N-Triples document into a list of triples.
+
+    Blank node labels are scoped to the document,
+    i.e. every call mints fresh blank nodes.
+    Empty lines and comments are skipped; other invalid lines
+    raise an NTriplesParseError naming the line.
+    """
+    triples: list[_Triple] = []
+    bnodes: dict[str, BNode] = {}
+
+    def _get_bnode(label: str) -> BNode:
+        bnode = bnodes.get(label)
+
+        if bnode is None:
+            bnode = bnodes[label] = BNode()
+
+        return bnode
+
+    match_triple = _TRIPLE_PATTERN.fullmatch
+
+    for line_number, line in enumerate(_NEWLINE_PATTERN.split(data), start=1):
+        match = match_triple(line)
+
+        if match is None:
+            if _EMPTY_LINE_PATTERN.fullmatch(line):
+                continue
+
+            raise NTriplesParseError(f"Invalid N-Triples line {line_number}: {line!r}")
+
+        (subject_iri, subject_id, predicate_iri,
+         object_iri, object_id, lexical, language, datatype) = match.groups()
+
+        if object_iri is not None:
+            object_ = _get_iri(object_iri)
+        elif object_id is not None:
+            object_ = _get_bnode(object_id)
+        else:
+            object_ = Literal(
+                _unescape(lexical),
+                lang=language,
+                datatype=None if datatype is None else _get_iri(datatype)
+            )
+
+        triples.append((
+            _get_iri(subject_iri) if subject_iri is not None else _get_bnode(subject_id),
+            _get_iri(predicate_iri),
+            object_
+        ))
+
+    return triples
@@ -0,0 +1,45 @@
+"""Process pool functionality for TabulaRDF converters."""
+
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Generator, Iterable, Optional
+
+
+def imap_ordered(function: Callable[[Any], Any],
+                 iterable: Iterable,
+                 *,
+                 workers: int,
+                 initializer: Optional[Callable[..., None]] = None,
+                 initargs: tuple = (),
+                 window: Optional[int] = None
+                 ) -> Generator[Any, None, None]:
+    """Map a function over an iterable in a process pool.
+
+    Results are yielded in input order.
+    At most window items are in flight at any time,
+    so the iterable is consumed lazily (unlike ProcessPoolExecutor.map).
+    """
+    if workers < 1:
+        raise ValueError(
+            f"workers must be a positive integer, got '{workers}'."
+        )
+
+    window = 2 * workers if window is None else window
+    pending: deque[Future] = deque()
+
+    with ProcessPoolExecutor(max_workers=workers,
+                             initializer=initializer,
+                             initargs=initargs) as executor:
+        try:
+            for item in iterable:
+                pending.append(executor.submit(function, item))
+
+                if len(pending) >= window:
+                    yield pending.popleft().result()
+
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            # early generator close: don't wait for obsolete results
+            for future in pending:
+                future.cancel()
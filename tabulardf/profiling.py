@@ -0,0 +1,188 @@
+"""Profiling for TabulaRDF converters.
+
+Functionality for recording per-stage wall times, call counts
+and slowest calls of conversions (e.g. reading, rendering, parsing, serializing).
+"""
+
+import contextlib
+import functools
+import heapq
+import time
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, ContextManager, Generator, Iterable, TypeVar
+
+
+_T = TypeVar("_T")
+
+# slowest calls recorded per stage
+DEFAULT_SLOWEST = 5
+
+
+@dataclass
+class StageStats:
+    """Timing statistics of a conversion stage.
+
+    slowest is a min-heap of (seconds, call) pairs.
+    """
+
+    calls: int = 0
+    seconds: float = 0.0
+    slowest: list[tuple[float, int]] = field(default_factory=list)
+
+    @property
+    def mean(self) -> float:
+        """Get the mean wall time per call."""
+        return self.seconds / self.calls if self.calls else 0.0
+
+    def get_slowest(self) -> list[tuple[float, int]]:
+        """Get the slowest (seconds, call) pairs in descending order."""
+        return sorted(self.slowest, reverse=True)
+
+
+class Profiler:
+    """Recorder for per-stage wall times of conversions.
+
+    Stages are timed with the stage context manager
+    or by wrapping callables (see timed) and iterables (see iterate).
+    For every stage, the number of calls, the total wall time
+    and the slowest calls are recorded.
+
+    Calls are numbered from 0 in call order; for stages called once per row
+    of a single (unchunked) converter, e.g. "render" or RowGraphConverter's "rule",
+    the call number is the row position (FieldGraphConverter's "rule" is called per field).
+    Note that stages may nest, e.g. "to_graph" includes "render" and "parse".
+
+    Converters accept a Profiler with the profiler parameter;
+    by default they use NULL_PROFILER, which records nothing.
+    """
+
+    enabled = True
+
+    def __init__(self, slowest: int = DEFAULT_SLOWEST) -> None:
+        """Initialize a Profiler."""
+        self.stages: dict[str, StageStats] = {}
+        self._slowest = slowest
+
+    def record(self, stage: str, seconds: float) -> None:
+        """Record a call of a stage."""
+        stats = self.stages.get(stage)
+
+        if stats is None:
+            stats = self.stages[stage] = StageStats()
+
+        entry = (seconds, stats.calls)
+        stats.calls += 1
+        stats.seconds += seconds
+
+        if len(stats.slowest) < self._slowest:
+            heapq.heappush(stats.slowest, entry)
+        elif self._slowest:
+            heapq.heappushpop(stats.slowest, entry)
+
+    @contextlib.contextmanager
+    def stage(self, stage: str) -> Generator[None, None, None]:
+        """Time a block as a call of a stage."""
+        start = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - start)
+
+    def timed(self, stage: str, function: Callable[..., _T]) -> Callable[..., _T]:
+        """Wrap a callable; every call is timed as a call of a stage."""
+        perf_counter = time.perf_counter
+
+        @functools.wraps(function)
+        def _timed(*args, **kwargs) -> _T:
+            start = perf_counter()
+
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self.record(stage, perf_counter() - start)
+
+        return _timed
+
+    def iterate(self, stage: str, iterable: Iterable[_T]) -> Iterable[_T]:
+        """Wrap an iterable; getting every item is timed as a call of a stage.
+
+        Time spent by the consumer of the items is not included.
+        """
+        perf_counter = time.perf_counter
+        iterator = iter(iterable)
+
+        while True:
+            start = perf_counter()
+
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+
+            self.record(stage, perf_counter() - start)
+            yield item
+
+    def to_dict(self) -> dict[str, dict[str, Any]]:
+        """Get the recorded statistics as a JSON-serializable dictionary."""
+        return {
+            stage: {
+                "calls": stats.calls,
+                "seconds": stats.seconds,
+                "mean": stats.mean,
+                "slowest": [
+                    {"call": call, "seconds": seconds}
+                    for seconds, call in stats.get_slowest()
+                ]
+            }
+            for stage, stats in self.stages.items()
+        }
+
+    def report(self) -> str:
+        """Get a summary table of the recorded statistics.
+
+        Slowest calls are given as call:milliseconds.
+        """
+        lines = [f"{'stage':<20}{'calls':>10}{'total s':>12}{'mean ms':>12}  slowest (call:ms)"]
+
+        for stage, stats in self.stages.items():
+            slowest = " ".join(
+                f"{call}:{seconds * 1000:.2f}"
+                for seconds, call in stats.get_slowest()
+            )
+            lines.append(
+                f"{stage:<20}{stats.calls:>10}{stats.seconds:>12.3f}"
+                f"{stats.mean * 1000:>12.3f}  {slowest}"
+            )
+
+        return "\n".join(lines)
+
+
+class NullProfiler(Profiler):
+    """Profiler that records nothing.
+
+    Wrapped callables and iterables are returned as is,
+    so a disabled profiler adds no per-row overhead.
+    """
+
+    enabled = False
+
+    def record(self, stage: str, seconds: float) -> None:
+        """Do nothing."""
+        pass
+
+    def stage(self, stage: str) -> ContextManager[None]:
+        """Get a no-op context manager."""
+        return contextlib.nullcontext()
+
+    def timed(self, stage: str, function: Callable[..., _T]) -> Callable[..., _T]:
+        """Return function as is."""
+        return function
+
+    def iterate(self, stage: str, iterable: Iterable[_T]) -> Iterable[_T]:
+        """Return iterable as is."""
+        return iterable
+
+
+NULL_PROFILER = NullProfiler()
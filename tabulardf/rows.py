@@ -0,0 +1,68 @@
+"""Row iteration for TabulaRDF converters.
+
+Functionality for iterating over pandas.DataFrame rows
+without constructing a pandas.Series for every row.
+"""
+
+from typing import Any, Generator
+
+import pandas as pd
+
+
+DEFAULT_BATCH_SIZE = 10_000
+
+
+def iter_batches(dataframe: pd.DataFrame,
+                 batch_size: int = DEFAULT_BATCH_SIZE
+                 ) -> Generator[pd.DataFrame, None, None]:
+    """Construct a generator of consecutive dataframe slices.
+
+    Every slice holds at most batch_size rows.
+    """
+    if batch_size < 1:
+        raise ValueError(
+            f"batch_size must be a positive integer, got '{batch_size}'."
+        )
+
+    for start in range(0, len(dataframe), batch_size):
+        yield dataframe.iloc[start:start + batch_size]
+
+
+def iter_row_batches(dataframe: pd.DataFrame,
+                     batch_size: int = DEFAULT_BATCH_SIZE
+                     ) -> Generator[list[dict[Any, Any]], None, None]:
+    """Construct a generator of lists of row data dictionaries.
+
+    Row dictionaries are built directly from column arrays,
+    so unlike DataFrame.iterrows no Series is created per row
+    and column dtypes are not coerced to a common row dtype.
+    """
+    columns = list(dataframe.columns)
+
+    for batch in iter_batches(dataframe, batch_size):
+        # Series.tolist boxes to Python/pandas scalars just like Series.to_dict
+        column_values = [
+            batch.iloc[:, position].tolist()
+            for position in range(len(columns))
+        ]
+
+        if not columns:
+            yield [{} for _ in range(len(batch))]
+            continue
+
+        yield [
+            dict(zip(columns, values))
+            for values in zip(*column_values)
+        ]
+
+
+def iter_row_dicts(dataframe: pd.DataFrame,
+                   batch_size: int = DEFAULT_BATCH_SIZE
+                   ) -> Generator[dict[Any, Any], None, None]:
+    """Construct a generator of row data dictionaries.
+
+    Drop-in replacement for
+    (row.to_dict() for _, row in dataframe.iterrows()).
+    """
+    for row_batch in iter_row_batches(dataframe, batch_size):
+        yield from row_batch
@@ -0,0 +1,203 @@
+"""Vectorized column rules for FieldGraphConverter.
+
+Column rules are applied once per column (batch) instead of once per field:
+they get passed the entire subject Series and object Series
+and return triples in bulk.
+"""
+
+import functools
+
+from collections.abc import Callable, MutableMapping
+from typing import Any, Generator, Optional
+
+import pandas as pd
+
+from rdflib import Literal, URIRef
+from rdflib.term import Node
+
+from tabulardf.tabulardf_types import _RuleResult, _Triple
+
+
+_ColumnRuleCallable = Callable[[pd.Series, pd.Series, MutableMapping], _RuleResult]
+
+DEFAULT_TERM_CACHE_SIZE = 2 ** 16
+
+
+class TermCache:
+    """Bounded LRU cache for term construction.
+
+    Wraps a term factory (e.g. a subject_rule or rdflib.Literal)
+    with functools.lru_cache; values are cached by type,
+    so e.g. 1 and 1.0 (and True) map to different terms.
+    Unhashable values are passed to the factory uncached.
+
+    Hit and miss statistics are available from cache_info.
+    """
+
+    def __init__(self,
+                 factory: Callable[[Any], Any],
+                 maxsize: int = DEFAULT_TERM_CACHE_SIZE) -> None:
+        """Initialize a TermCache."""
+        self._factory = factory
+        self._cached_factory = functools.lru_cache(maxsize=maxsize, typed=True)(factory)
+
+    def __call__(self, value: Any) -> Any:
+        """Get a term for value."""
+        try:
+            hash(value)
+        except TypeError:
+            # unhashable value
+            return self._factory(value)
+
+        return self._cached_factory(value)
+
+    def cache_info(self) -> functools._CacheInfo:
+        """Get hit and miss statistics, see functools.lru_cache."""
+        return self._cached_factory.cache_info()
+
+    def cache_clear(self) -> None:
+        """Clear the cache and its statistics."""
+        self._cached_factory.cache_clear()
+
+
+class ColumnRule:
+    """Wrapper for vectorized column rules.
+
+    FieldGraphConverter applies ColumnRule instances of a column_rules mapping
+    once per column batch, passing
+      1. a Series of subjects (according to subject_column and subject_rule),
+      2. the Series of the current column (the triple objects) and
+      3. the FieldGraphConverter.store dictionary.
+
+    Both Series share the index of the dataframe.
+
+    If the rule constructs terms through a TermCache,
+    pass it as term_cache to expose its statistics from cache_info.
+    """
+
+    def __init__(self,
+                 rule: _ColumnRuleCallable,
+                 term_cache: Optional[TermCache] = None) -> None:
+        """Initialize a ColumnRule."""
+        self._rule = rule
+        self.term_cache = term_cache
+
+    def __call__(self,
+                 subjects: pd.Series,
+                 objects: pd.Series,
+                 store: MutableMapping) -> _RuleResult:
+        """Apply the column rule."""
+        return self._rule(subjects, objects, store)
+
+    def cache_info(self) -> Optional[functools._CacheInfo]:
+        """Get hit and miss statistics of the term cache (if any)."""
+        if self.term_cache is None:
+            return None
+
+        return self.term_cache.cache_info()
+
+
+def column_rule(rule: _ColumnRuleCallable) -> ColumnRule:
+    """Mark a callable as vectorized column rule.
+
+    Decorator for ColumnRule.
+    """
+    return ColumnRule(rule)
+
+
+def _drop_na(subjects: pd.Series,
+             objects: pd.Series) -> tuple[pd.Series, pd.Series]:
+    """Drop subject/object pairs with missing objects."""
+    mask = objects.notna().to_numpy()
+    return subjects[mask], objects[mask]
+
+
+def _factorized_triples(subjects: pd.Series,
+                        predicate: URIRef,
+                        objects: pd.Series,
+                        term_factory: Callable[[Any], Node]
+                        ) -> Generator[_Triple, None, None]:
+    """Generate triples, looking up object terms only once per distinct value.
+
+    Distinct values are determined per batch with pd.factorize;
+    term_factory is typically a TermCache, so terms are also reused across batches.
+    """
+    codes, uniques = pd.factorize(objects, use_na_sentinel=False)
+    terms = [term_factory(value) for value in uniques.tolist()]
+
+    for subject, code in zip(subjects.tolist(), codes.tolist()):
+        yield (subject, predicate, terms[code])
+
+
+def literal_rule(predicate: URIRef,
+                 *,
+                 datatype: Optional[URIRef] = None,
+                 lang: Optional[str] = None,
+                 skip_na: bool = True,
+                 cache_size: int = DEFAULT_TERM_CACHE_SIZE) -> ColumnRule:
+    """Get a column rule generating a literal object per field.
+
+    Generates (subject, predicate, Literal(value, datatype=datatype, lang=lang)) triples;
+    if skip_na is True, missing values are skipped.
+    Literals are cached in a TermCache of cache_size.
+    """
+    def _literal(value: Any) -> Literal:
+        return Literal(value, datatype=datatype, lang=lang)
+
+    term_cache = TermCache(_literal, maxsize=cache_size)
+
+    def _rule(subjects: pd.Series,
+              objects: pd.Series,
+              store: MutableMapping) -> Generator[_Triple, None, None]:
+        if skip_na:
+            subjects, objects = _drop_na(subjects, objects)
+
+        return _factorized_triples(subjects, predicate, objects, term_cache)
+
+    return ColumnRule(_rule, term_cache=term_cache)
+
+
+# characters rdflib.URIRef warns about; percent-encoded in local names
+_INVALID_IRI_CHARACTERS = str.maketrans(
+    {character: f"%{ord(character):02X}" for character in '<>" {}|\\^`'}
+)
+
+
+def _get_local_name(value: Any) -> str:
+    """Get an IRI local name for a field value.
+
+    Integral floats (e.g. from integer columns with missing values) are converted to int
+    and characters that are invalid in IRIs (e.g. spaces) are percent-encoded.
+    """
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+
+    return str(value).translate(_INVALID_IRI_CHARACTERS)
+
+
+def uri_rule(predicate: URIRef,
+             namespace: str,
+             *,
+             cache_size: int = DEFAULT_TERM_CACHE_SIZE) -> ColumnRule:
+    """Get a column rule generating an IRI object per field.
+
+    Generates (subject, predicate, URIRef(namespace + local_name)) triples;
+    namespace may be a str or an rdflib.Namespace.
+    Missing values are skipped; see _get_local_name for the conversion of values to local names.
+    IRIs are cached in a TermCache of cache_size.
+    """
+    namespace = str(namespace)
+
+    def _iri(value: Any) -> URIRef:
+        return URIRef(namespace + _get_local_name(value))
+
+    term_cache = TermCache(_iri, maxsize=cache_size)
+
+    def _rule(subjects: pd.Series,
+              objects: pd.Series,
+              store: MutableMapping) -> Generator[_Triple, None, None]:
+        subjects, objects = _drop_na(subjects, objects)
+
+        return _factorized_triples(subjects, predicate, objects, term_cache)
+
+    return ColumnRule(_rule, term_cache=term_cache)
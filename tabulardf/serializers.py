@@ -0,0 +1,313 @@
+"""High-throughput serializers for TabulaRDF graph converters.
+
+Functionality for serializing (large) graphs to N-Triples and "flat" Turtle,
+i.e. Turtle without the pretty-printing of rdflib's Turtle serializer:
+triples are written in graph order, one triple per line,
+consecutive triples of a subject are joined with ';'
+and prefixes are declared on first use.
+
+Encoded terms are cached, lines are encoded and written in bulk
+and output can be gzip-compressed. The serializers are also registered
+as rdflib serializer plugins "tabulardf-nt" and "tabulardf-ttl",
+so e.g. Graph.serialize(format="tabulardf-ttl") is available.
+"""
+
+import contextlib
+import functools
+import gzip
+import itertools
+import os
+import pathlib
+import re
+
+from typing import (
+    IO,
+    Any,
+    BinaryIO,
+    Callable,
+    Generator,
+    Iterable,
+    Literal as PyLiteral,
+    Optional
+)
+
+from rdflib import Graph, Literal, URIRef
+from rdflib.namespace import RDF
+from rdflib.plugin import register
+from rdflib.serializer import Serializer
+from rdflib.term import Identifier
+
+from tabulardf.sqlite_store import SQLiteStore
+from tabulardf.streaming import (
+    DEFAULT_ENCODING_CACHE_SIZE,
+    _quote_string,
+    get_term_encoder
+)
+from tabulardf.tabulardf_types import _Triple
+
+
+_SerializationFormat = PyLiteral["nt", "ttl"]
+
+SERIALIZATION_FORMATS: dict[str, _SerializationFormat] = {
+    "nt": "nt",
+    "nt11": "nt",
+    "ntriples": "nt",
+    "application/n-triples": "nt",
+    "tabulardf-nt": "nt",
+    "ttl": "ttl",
+    "turtle": "ttl",
+    "text/turtle": "ttl",
+    "tabulardf-ttl": "ttl",
+}
+
+# encoded lines per write call
+DEFAULT_WRITE_BATCH_SIZE = 10_000
+
+# gzip compression level; higher levels are considerably slower for little gain
+DEFAULT_COMPRESSLEVEL = 6
+
+# conservative subsets of Turtle PN_PREFIX and PN_LOCAL
+_PREFIX_LABEL_PATTERN = re.compile(r"(?:[A-Za-z][A-Za-z0-9_-]*)?")
+_LOCAL_NAME_PATTERN = re.compile(r"[A-Za-z0-9_][A-Za-z0-9_-]*")
+
+
+class UnsupportedSerializationFormatError(Exception):  # noqa: D204
+    """Exception type for formats not available for tabulardf serialization."""
+    pass
+
+
+def get_serialization_format(format: str) -> _SerializationFormat:
+    """Normalize a format name to a tabulardf serialization format."""
+    try:
+        return SERIALIZATION_FORMATS[format]
+    except KeyError:
+        raise UnsupportedSerializationFormatError(
+            f"Format '{format}' is not available for tabulardf serialization. "
+            f"Supported formats: {', '.join(SERIALIZATION_FORMATS)}."
+        ) from None
+
+
+def _write_batched(chunks: Iterable[str],
+                   stream: IO[bytes],
+                   encoding: str = "utf-8",
+                   batch_size: int = DEFAULT_WRITE_BATCH_SIZE) -> None:
+    """Join, encode and write text chunks to a binary stream in batches."""
+    chunks = iter(chunks)
+
+    while batch := list(itertools.islice(chunks, batch_size)):
+        stream.write("".join(batch).encode(encoding))
+
+
+def write_ntriples(triples: Iterable[_Triple],
+                   stream: IO[bytes],
+                   cache_size: int = DEFAULT_ENCODING_CACHE_SIZE) -> None:
+    """Write triples to a binary stream as (UTF-8 encoded) N-Triples.
+
+    See tabulardf.streaming.get_term_encoder.
+    Graphs backed by an SQLiteStore are written from the stored encodings.
+    """
+    if isinstance(triples, Graph) and isinstance(triples.store, SQLiteStore):
+        _write_batched(triples.store.ntriples(), stream)
+        return
+
+    encode = get_term_encoder(cache_size)
+
+    _write_batched(
+        (f"{encode(s)} {encode(p)} {encode(o)} .\n" for s, p, o in triples),
+        stream
+    )
+
+
+def _get_turtle_encoder(namespaces: Iterable[tuple[str, Any]],
+                        declarations: list[str],
+                        cache_size: int = DEFAULT_ENCODING_CACHE_SIZE
+                        ) -> Callable[[Identifier], str]:
+    """Get a Turtle term encoder with a bounded LRU cache of IRI and blank node encodings.
+
+    IRIs are abbreviated to prefixed names if the namespace is bound
+    and the local name is safe; literal datatypes are abbreviated likewise.
+    The prefix declaration of a prefix is appended to declarations on first use.
+    """
+    prefixes = {
+        str(namespace): label
+        for label, namespace in namespaces
+        if _PREFIX_LABEL_PATTERN.fullmatch(label)
+    }
+    declared: set[str] = set()
+
+    @functools.lru_cache(maxsize=cache_size)
+    def _encode_node(term: Identifier) -> str:
+        if not isinstance(term, URIRef):
+            return term.n3()
+
+        position = max(term.rfind("#"), term.rfind("/")) + 1
+        namespace = term[:position]
+        label = prefixes.get(namespace)
+
+        if label is not None and _LOCAL_NAME_PATTERN.fullmatch(term, position):
+            if label not in declared:
+                declared.add(label)
+                declarations.append(f"@prefix {label}: <{namespace}> .\n")
+
+            return f"{label}:{term[position:]}"
+
+        return term.n3()
+
+    def _encode(term: Identifier) -> str:
+        if type(term) is Literal:
+            encoded = _quote_string(term)
+
+            if term.language:
+                return f"{encoded}@{term.language}"
+            if term.datatype:
+                return f"{encoded}^^{_encode_node(term.datatype)}"
+
+            return encoded
+
+        return _encode_node(term)
+
+    return _encode
+
+
+def _generate_flat_turtle(triples: Iterable[_Triple],
+                          namespaces: Iterable[tuple[str, Any]],
+                          cache_size: int = DEFAULT_ENCODING_CACHE_SIZE
+                          ) -> Generator[str, None, None]:
+    """Generate flat Turtle statements; consecutive triples of a subject are joined with ';'.
+
+    Prefixes are declared right before the statement that first uses them,
+    so only used prefixes are declared.
+    """
+    declarations: list[str] = []
+    encode = _get_turtle_encoder(namespaces, declarations, cache_size)
+    rdf_type = RDF.type
+    previous = None
+
+    for s, p, o in triples:
+        subject, object_ = encode(s), encode(o)
+        predicate = "a" if p == rdf_type else encode(p)
+
+        if declarations:
+            if previous is not None:
+                yield " .\n"
+                previous = None
+
+            yield "".join(declarations)
+            declarations.clear()
+
+        if s == previous:
+            yield f" ;\n    {predicate} {object_}"
+            continue
+
+        if previous is not None:
+            yield " .\n"
+
+        yield f"{subject} {predicate} {object_}"
+        previous = s
+
+    if previous is not None:
+        yield " .\n"
+
+
+def write_flat_turtle(triples: Iterable[_Triple],
+                      stream: IO[bytes],
+                      namespaces: Iterable[tuple[str, Any]] = (),
+                      encoding: str = "utf-8",
+                      cache_size: int = DEFAULT_ENCODING_CACHE_SIZE) -> None:
+    """Write triples to a binary stream as flat Turtle.
+
+    IRIs in namespaces (e.g. Graph.namespaces()) are abbreviated to prefixed names.
+    """
+    _write_batched(
+        _generate_flat_turtle(triples, namespaces, cache_size),
+        stream,
+        encoding=encoding
+    )
+
+
+@contextlib.contextmanager
+def open_binary_destination(destination: str | os.PathLike | IO[bytes],
+                            compress: Optional[bool] = None
+                            ) -> Generator[IO[bytes], None, None]:
+    """Get a binary stream for a destination, optionally gzip-compressed.
+
+    Path-like destinations are opened (and closed) for writing;
+    if compress is None, paths are compressed if they end with '.gz'.
+    Stream destinations are compressed only if compress is True
+    and are not closed.
+    """
+    if isinstance(destination, (str, os.PathLike)):
+        if compress is None:
+            compress = pathlib.Path(destination).suffix == ".gz"
+
+        opener = (
+            functools.partial(gzip.open, compresslevel=DEFAULT_COMPRESSLEVEL)
+            if compress
+            else open
+        )
+
+        with opener(destination, mode="wb") as f:
+            yield f
+    elif compress:
+        with gzip.GzipFile(fileobj=destination, mode="wb",
+                           compresslevel=DEFAULT_COMPRESSLEVEL) as f:
+            yield f
+    else:
+        yield destination
+
+
+def serialize_graph(graph: Graph,
+                    destination: str | os.PathLike | BinaryIO,
+                    format: str = "nt",
+                    compress: Optional[bool] = None) -> None:
+    """Serialize a graph to N-Triples or flat Turtle, see open_binary_destination."""
+    serialization_format = get_serialization_format(format)
+
+    with open_binary_destination(destination, compress) as stream:
+        if serialization_format == "nt":
+            write_ntriples(graph, stream)
+        else:
+            write_flat_turtle(graph, stream, namespaces=graph.namespaces())
+
+
+class NTriplesSerializer(Serializer):
+    """rdflib serializer plugin for tabulardf N-Triples serialization.
+
+    Output is always UTF-8 encoded; pass compress=True to Graph.serialize for gzip output.
+    """
+
+    def serialize(self,
+                  stream: IO[bytes],
+                  base: Optional[str] = None,
+                  encoding: Optional[str] = None,
+                  compress: bool = False,
+                  **args: Any) -> None:
+        """Serialize the graph to a binary stream."""
+        with open_binary_destination(stream, compress) as destination:
+            write_ntriples(self.store, destination)
+
+
+class FlatTurtleSerializer(Serializer):
+    """rdflib serializer plugin for tabulardf flat Turtle serialization.
+
+    Pass compress=True to Graph.serialize for gzip output.
+    """
+
+    def serialize(self,
+                  stream: IO[bytes],
+                  base: Optional[str] = None,
+                  encoding: Optional[str] = None,
+                  compress: bool = False,
+                  **args: Any) -> None:
+        """Serialize the graph to a binary stream."""
+        with open_binary_destination(stream, compress) as destination:
+            write_flat_turtle(
+                self.store,
+                destination,
+                namespaces=self.store.namespaces(),
+                encoding=encoding or "utf-8"
+            )
+
+
+register("tabulardf-nt", Serializer, "tabulardf.serializers", "NTriplesSerializer")
+register("tabulardf-ttl", Serializer, "tabulardf.serializers", "FlatTurtleSerializer")
@@ -0,0 +1,276 @@
+"""Disk-backed graph storage for TabulaRDF graph converters.
+
+Functionality for backing rdflib.Graph components with an SQLite database,
+so graphs larger than the available memory can be converted and serialized.
+
+    graph = get_sqlite_graph("graph.sqlite")
+    converter = TemplateGraphConverter(dataframe=dataframe, template=template, graph=graph)
+    converter.dump("graph.nt")
+"""
+
+import functools
+import os
+import sqlite3
+
+from typing import Any, Generator, Iterable, Iterator, Optional
+
+from rdflib import BNode, Graph, URIRef
+from rdflib.store import VALID_STORE, Store
+from rdflib.term import Identifier
+from rdflib.util import from_n3
+
+from tabulardf.streaming import get_term_encoder
+
+
+# decoded terms cached per store
+DEFAULT_DECODING_CACHE_SIZE = 2 ** 16
+
+# rows fetched from the database per fetchmany call
+DEFAULT_FETCH_SIZE = 10_000
+
+# triples added with add (e.g. by rdflib parsers) buffered per insert transaction
+DEFAULT_INSERT_BATCH_SIZE = 10_000
+
+_INSERT = "INSERT OR IGNORE INTO triples VALUES (?, ?, ?)"
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS triples (
+        s TEXT NOT NULL,
+        p TEXT NOT NULL,
+        o TEXT NOT NULL,
+        PRIMARY KEY (s, p, o)
+    ) WITHOUT ROWID
+    """,
+    "CREATE INDEX IF NOT EXISTS triples_po ON triples (p, o)",
+    "CREATE INDEX IF NOT EXISTS triples_o ON triples (o)",
+)
+
+# a scratch store: durability is traded for insert throughput
+_PRAGMAS = (
+    "PRAGMA synchronous = OFF",
+    "PRAGMA temp_store = FILE",
+)
+
+
+def _decode_term(encoded: str) -> Identifier:
+    """Get an rdflib term from its N-Triples representation.
+
+    IRIs and blank nodes are decoded directly, literals with rdflib.util.from_n3.
+    """
+    if encoded.startswith("<"):
+        return URIRef(encoded[1:-1])
+    if encoded.startswith("_:"):
+        return BNode(encoded[2:])
+
+    return from_n3(encoded)
+
+
+class SQLiteStore(Store):
+    """Triple store backed by an SQLite database.
+
+    Terms are stored in their N-Triples representation
+    (see tabulardf.streaming.get_term_encoder) and decoded on retrieval,
+    so memory consumption does not grow with the number of triples.
+    Triples added with addN (e.g. by converters, see tabulardf.converters._add_triples)
+    are inserted with a single executemany call and committed per call;
+    triples added with add (e.g. by rdflib parsers through Graph.parse) are buffered
+    and inserted in batches of DEFAULT_INSERT_BATCH_SIZE triples,
+    so both are inserted in batched transactions.
+    Buffered triples are inserted before every read (or remove).
+
+    The store is not context-aware: all triples belong to a single graph.
+    Namespace bindings are kept in memory.
+    """
+
+    context_aware = False
+    formula_aware = False
+    transaction_aware = False
+    graph_aware = False
+
+    def __init__(self,
+                 configuration: Optional[str | os.PathLike] = None,
+                 identifier: Optional[Identifier] = None) -> None:
+        """Initialize an SQLiteStore.
+
+        configuration is the path of the database file;
+        an empty string opens a private temporary database (see open).
+        """
+        self._connection: Optional[sqlite3.Connection] = None
+        self._encode = get_term_encoder()
+        self._decode = functools.lru_cache(maxsize=DEFAULT_DECODING_CACHE_SIZE)(_decode_term)
+        self._namespaces: dict[str, URIRef] = {}
+        self._prefixes: dict[URIRef, str] = {}
+        self._pending: list[tuple[str, str, str]] = []
+
+        super().__init__(identifier=identifier)
+
+        if configuration is not None:
+            self.open(configuration)
+
+    def open(self, configuration: str | os.PathLike, create: bool = True) -> int:
+        """Open (and if create is True, initialize) the database file.
+
+        For an empty string, SQLite creates a private temporary on-disk database
+        that is deleted when the store is closed.
+        """
+        self._connection = sqlite3.connect(configuration)
+
+        for statement in (*_PRAGMAS, *(_SCHEMA if create else ())):
+            self._connection.execute(statement)
+
+        return VALID_STORE
+
+    def close(self, commit_pending_transaction: bool = False) -> None:
+        """Commit pending inserts and close the database connection.
+
+        The store is not transaction-aware, so pending inserts are committed
+        regardless of commit_pending_transaction (which Graph.close passes as False).
+        """
+        if self._connection is None:
+            return
+
+        self._flush()
+        self._connection.commit()
+
+        self._connection.close()
+        self._connection = None
+
+    def commit(self) -> None:
+        """Insert buffered triples and commit pending inserts."""
+        self._flush()
+        self._connection.commit()
+
+    def _flush(self) -> None:
+        """Insert the triples buffered by add in a single transaction."""
+        if not self._pending:
+            return
+
+        with self._connection:
+            self._connection.executemany(_INSERT, self._pending)
+
+        self._pending.clear()
+
+    def add(self, triple: tuple, context: Any = None, quoted: bool = False) -> None:
+        """Add a triple; triples are buffered and inserted in batches."""
+        super().add(triple, context, quoted)
+
+        self._pending.append(tuple(map(self._encode, triple)))
+
+        if len(self._pending) >= DEFAULT_INSERT_BATCH_SIZE:
+            self._flush()
+
+    def addN(self, quads: Iterable[tuple]) -> None:  # noqa: N802
+        """Add triples from quads in a single transaction; contexts are ignored."""
+        encode = self._encode
+        self._flush()
+
+        with self._connection:
+            self._connection.executemany(
+                _INSERT,
+                ((encode(s), encode(p), encode(o)) for s, p, o, _ in quads)
+            )
+
+    def _get_where_clause(self, triple_pattern: tuple) -> tuple[str, list[str]]:
+        """Get an SQL WHERE clause and its parameters for a triple pattern."""
+        conditions, parameters = [], []
+
+        for column, term in zip("spo", triple_pattern):
+            if term is not None:
+                conditions.append(f"{column} = ?")
+                parameters.append(self._encode(term))
+
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        return where, parameters
+
+    def remove(self, triple_pattern: tuple, context: Any = None) -> None:
+        """Remove triples matching a triple pattern."""
+        self._flush()
+        where, parameters = self._get_where_clause(triple_pattern)
+
+        with self._connection:
+            self._connection.execute(f"DELETE FROM triples{where}", parameters)
+
+    def triples(self,
+                triple_pattern: tuple,
+                context: Any = None) -> Generator[tuple[tuple, Iterator], None, None]:
+        """Generate the triples matching a triple pattern.
+
+        Rows are fetched in batches from a dedicated cursor,
+        so iterating a large store does not materialize it.
+        """
+        self._flush()
+        where, parameters = self._get_where_clause(triple_pattern)
+        cursor = self._connection.execute(f"SELECT s, p, o FROM triples{where}", parameters)
+        decode = self._decode
+
+        while rows := cursor.fetchmany(DEFAULT_FETCH_SIZE):
+            for s, p, o in rows:
+                yield (decode(s), decode(p), decode(o)), iter(())
+
+    def ntriples(self) -> Generator[str, None, None]:
+        """Generate N-Triples lines straight from the stored encodings, i.e. without decoding."""
+        self._flush()
+        cursor = self._connection.execute("SELECT s, p, o FROM triples")
+
+        while rows := cursor.fetchmany(DEFAULT_FETCH_SIZE):
+            for s, p, o in rows:
+                yield f"{s} {p} {o} .\n"
+
+    def __len__(self, context: Any = None) -> int:
+        """Get the number of triples in the store."""
+        self._flush()
+        return self._connection.execute("SELECT COUNT(*) FROM triples").fetchone()[0]
+
+    def contexts(self, triple: Any = None) -> Generator[Any, None, None]:
+        """Generate no contexts; the store is not context-aware."""
+        yield from ()
+
+    def bind(self, prefix: str, namespace: URIRef, override: bool = True) -> None:
+        """Bind a prefix to a namespace; see rdflib.plugins.stores.memory.Memory.bind."""
+        bound_namespace = self._namespaces.get(prefix)
+        bound_prefix = self._prefixes.get(namespace)
+
+        if bound_prefix is None and bound_namespace is not None:
+            bound_prefix = self._prefixes.get(bound_namespace)
+
+        if override:
+            if bound_prefix is not None:
+                del self._namespaces[bound_prefix]
+            if bound_namespace is not None:
+                del self._prefixes[bound_namespace]
+
+            self._prefixes[namespace] = prefix
+            self._namespaces[prefix] = namespace
+        else:
+            namespace = bound_namespace if bound_namespace is not None else namespace
+            prefix = bound_prefix if bound_prefix is not None else prefix
+
+            self._prefixes[namespace] = prefix
+            self._namespaces[prefix] = namespace
+
+    def namespace(self, prefix: str) -> Optional[URIRef]:
+        """Get the namespace bound to a prefix."""
+        return self._namespaces.get(prefix)
+
+    def prefix(self, namespace: URIRef) -> Optional[str]:
+        """Get the prefix bound to a namespace."""
+        return self._prefixes.get(namespace)
+
+    def namespaces(self) -> Generator[tuple[str, URIRef], None, None]:
+        """Generate (prefix, namespace) pairs."""
+        yield from self._namespaces.items()
+
+
+def get_sqlite_graph(path: Optional[str | os.PathLike] = None,
+                     identifier: Optional[Identifier] = None) -> Graph:
+    """Get an rdflib.Graph backed by an SQLiteStore.
+
+    If path is None, the graph is backed by a private temporary database
+    that is deleted when the graph is closed (or the process exits).
+    """
+    return Graph(
+        store=SQLiteStore("" if path is None else path),
+        identifier=identifier
+    )
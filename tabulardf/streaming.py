@@ -0,0 +1,159 @@
+"""Streaming serialization for TabulaRDF graph converters.
+
+Functionality for writing triples to line-based RDF formats
+without materializing an rdflib.Graph.
+"""
+
+import contextlib
+import functools
+import os
+
+from typing import Callable, Generator, Iterable, Literal as PyLiteral, Optional, TextIO
+
+from rdflib import Literal, URIRef
+from rdflib.term import Identifier
+
+from tabulardf.tabulardf_types import _Triple
+
+
+_StreamingFormat = PyLiteral["nt", "nq"]
+
+STREAMING_FORMATS: dict[str, _StreamingFormat] = {
+    "nt": "nt",
+    "nt11": "nt",
+    "ntriples": "nt",
+    "application/n-triples": "nt",
+    "nq": "nq",
+    "nquads": "nq",
+    "application/n-quads": "nq",
+}
+
+
+# encoded terms cached per writer
+DEFAULT_ENCODING_CACHE_SIZE = 2 ** 16
+
+
+class UnsupportedStreamingFormatError(Exception):  # noqa: D204
+    """Exception type for formats not available for streaming serialization."""
+    pass
+
+
+def get_streaming_format(format: str) -> _StreamingFormat:
+    """Normalize a format name to a streaming format."""
+    try:
+        return STREAMING_FORMATS[format]
+    except KeyError:
+        raise UnsupportedStreamingFormatError(
+            f"Format '{format}' is not available for streaming serialization. "
+            f"Supported formats: {', '.join(STREAMING_FORMATS)}."
+        ) from None
+
+
+def _quote_string(value: str) -> str:
+    """Get a quoted and escaped N-Triples (and Turtle) string literal."""
+    return '"%s"' % (
+        value
+        .replace("\\", "\\\\")
+        .replace("\n", "\\n")
+        .replace('"', '\\"')
+        .replace("\r", "\\r")
+    )
+
+
+def _quote_literal(literal: Literal) -> str:
+    """Get the N-Triples representation of an rdflib.Literal.
+
+    Mirrors rdflib.plugins.serializers.nt._quoteLiteral.
+    """
+    encoded = _quote_string(literal)
+
+    if literal.language:
+        return f"{encoded}@{literal.language}"
+    if literal.datatype:
+        return f"{encoded}^^<{literal.datatype}>"
+
+    return encoded
+
+
+def _encode_term(term: Identifier) -> str:
+    """Get the N-Triples representation of an rdflib term."""
+    if isinstance(term, Literal):
+        return _quote_literal(term)
+
+    return term.n3()
+
+
+def _encode_node(term: Identifier) -> str:
+    """Get the N-Triples representation of an IRI or blank node."""
+    return term.n3()
+
+
+def get_term_encoder(maxsize: int = DEFAULT_ENCODING_CACHE_SIZE) -> Callable[[Identifier], str]:
+    """Get an N-Triples term encoder with a bounded LRU cache of IRI and blank node encodings.
+
+    IRIs repeat a lot in converter output (e.g. predicates, classes and subjects),
+    so caching saves most of the (IRI validating) encoding work;
+    literals are mostly distinct and cheap to quote, so they are not cached.
+    """
+    encode_node = functools.lru_cache(maxsize=maxsize)(_encode_node)
+
+    def _encode(term: Identifier) -> str:
+        # type check: isinstance checks against rdflib terms are comparatively slow
+        if type(term) is Literal:
+            return _quote_literal(term)
+
+        return encode_node(term)
+
+    return _encode
+
+
+class TripleWriter:
+    """Line-based triple writer for N-Triples and N-Quads.
+
+    Triples are encoded and written immediately,
+    so memory consumption is independent of the number of triples written.
+    Note that duplicate triples are not eliminated.
+
+    For N-Quads, triples are written to the graph named by graph_identifier
+    if it is an IRI, else to the default graph.
+    """
+
+    def __init__(self,
+                 stream: TextIO,
+                 format: str = "nt",
+                 graph_identifier: Optional[Identifier] = None) -> None:
+        """Initialize a TripleWriter."""
+        self._stream = stream
+        self._format = get_streaming_format(format)
+        self._encode = get_term_encoder()
+
+        self._line_end = (
+            f" {graph_identifier.n3()} .\n"
+            if self._format == "nq" and isinstance(graph_identifier, URIRef)
+            else " .\n"
+        )
+
+    def write(self, triples: Iterable[_Triple]) -> None:
+        """Encode and write triples to the stream."""
+        line_end = self._line_end
+        encode = self._encode
+
+        self._stream.writelines(
+            f"{encode(s)} {encode(p)} {encode(o)}{line_end}"
+            for s, p, o in triples
+        )
+
+
+@contextlib.contextmanager
+def open_destination(destination: str | os.PathLike | TextIO
+                     ) -> Generator[TextIO, None, None]:
+    """Get a text stream for a destination.
+
+    Path-like destinations are opened (and closed) for writing,
+    stream destinations are passed through as is.
+    """
+    if isinstance(destination, (str, os.PathLike)):
+        with open(destination, mode="w", encoding="utf-8", newline="\n") as f:
+            yield f
+    else:
+        yield destination
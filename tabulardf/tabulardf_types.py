@@ -1,44 +1,62 @@
-"""Type definitions for TabulaRDF."""
+"""Type definitions for TabulaRDF.
 
+The click types and format options formerly defined here live in tabulardf.cli.cli_types
+and are re-exported lazily (PEP 562), so importing this module does not import click
+or enumerate the rdflib plugins.
+"""
+
+import importlib
 import os
-import pathlib
 
-from collections.abc import Callable, MutableMapping
+from collections.abc import Callable, Iterable, MutableMapping
 from typing import Any, Literal as PyLiteral
 
-import click
-
 from jinja2.environment import Template
 from rdflib import Graph, URIRef, Literal
 
-from rdflib.plugin import plugins
-from rdflib.serializer import Serializer
 
+_TripleObject = URIRef | Literal
+_Triple = tuple[URIRef, URIRef, _TripleObject]
+
+_RuleResult = Graph | _Triple | Iterable[_Triple] | None
 
-_Rule = Callable[[Any, Any, MutableMapping], Graph]
+_Rule = Callable[[Any, Any, MutableMapping], _RuleResult]
 _RulesMapping = MutableMapping[str, _Rule]
 
-_TripleObject = URIRef | Literal
-_Triple = tuple[URIRef, URIRef, _TripleObject]
+_RowRule = Callable[[dict], _RuleResult]
 
 _RenderStrategy = PyLiteral["table", "row"]
 
 _TemplateReference = str | os.PathLike | Template
 
-_ClickPath = click.Path(
-    exists=True,
-    file_okay=True,
-    dir_okay=False,
-    readable=True,
-    resolve_path=True,
-    path_type=pathlib.Path
-)
-
-rdflib_graph_format_options = [
-    plugin.name for plugin
-    in plugins()
-    if plugin.kind == Serializer
-    ]
-
-_GraphFormatOptions = PyLiteral[*rdflib_graph_format_options]
-_GraphFormatOptionsChoice = click.Choice(rdflib_graph_format_options)
+
+def _get_cli_type(name: str) -> Any:
+    """Get an attribute of tabulardf.cli.cli_types."""
+    return getattr(importlib.import_module("tabulardf.cli.cli_types"), name)
+
+
+_lazy_attributes: dict[str, Callable[[], Any]] = {
+    "_ClickPath": lambda: _get_cli_type("_ClickPath"),
+    "_GraphFormatOptionsChoice": lambda: _get_cli_type("_GraphFormatOptionsChoice"),
+    "rdflib_graph_format_options": lambda: _get_cli_type("get_graph_format_options")(),
+    "_GraphFormatOptions": lambda: PyLiteral[*_get_cli_type("get_graph_format_options")()],
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Compute re-exported CLI types on first access."""
+    try:
+        get_value = _lazy_attributes[name]
+    except KeyError:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'") from None
+
+    value = get_value()
+    # cache, so __getattr__ is only called once per name
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module attributes including lazy re-exports."""
+    return sorted([*globals(), *_lazy_attributes])
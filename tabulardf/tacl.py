@@ -1,28 +1,38 @@
-"""CLI for TabulaRDF Template conversions."""
+"""CLI for TabulaRDF Template conversions.
 
+Note: heavy dependencies (pandas, rdflib, jinja2) are imported in the commands,
+so CLI startup (e.g. 'tacl --help') stays fast.
+"""
+
+import functools
+import json
 import pathlib
+import sys
 
-from typing import Any, Callable
+from typing import TYPE_CHECKING, Any, Callable
 
 import click
 
-from tabulardf import TemplateConverter, TemplateGraphConverter
-
-from tabulardf.tabulardf_types import (
+from tabulardf.cli.cli_types import (
     _ClickPath,
-    _GraphFormatOptions,
-    _GraphFormatOptionsChoice
+    _GraphFormatOptionsChoice,
+    _GraphInputFormatOptionsChoice
 )
-
 from tabulardf.cli.click_custom import (
     RequiredIf,
     RequiredMultiOptions,
     DefaultCommandGroup
 )
-from tabulardf.cli.converter_setup import initialize_converter
 from tabulardf.cli.docs import docs
 
 
+if TYPE_CHECKING:
+    from tabulardf import TemplateConverter
+    from tabulardf.cli.table_cache import TableCache
+    from tabulardf.incremental import IncrementalCache
+    from tabulardf.profiling import Profiler
+
+
 _common_options = [
     click.argument("table",
                    type=_ClickPath),
@@ -42,7 +52,58 @@ _common_options = [
     click.option("--context-module",
                  type=_ClickPath,
                  help=docs.context_module,
-                 required=False)
+                 required=False),
+    click.option("--chunksize",
+                 type=click.IntRange(min=1),
+                 default=None,
+                 help=docs.chunksize),
+    click.option("--cache-dir",
+                 type=click.Path(file_okay=False, path_type=pathlib.Path),
+                 default=None,
+                 help=docs.cache_dir),
+    click.option("--cache-max-size",
+                 type=click.IntRange(min=1),
+                 default=1024,
+                 show_default=True,
+                 help=docs.cache_max_size),
+    click.option("--group-by",
+                 type=str,
+                 cls=RequiredIf,
+                 required_if="output",
+                 default=None,
+                 help=docs.group_by),
+    click.option("-o", "--output",
+                 type=str,
+                 cls=RequiredIf,
+                 required_if="group_by",
+                 default=None,
+                 help=docs.output),
+    click.option("--workers",
+                 type=click.IntRange(min=1),
+                 default=None,
+                 help=docs.workers),
+    click.option("--profile",
+                 type=bool,
+                 default=False,
+                 is_flag=True,
+                 help=docs.profile),
+    click.option("--profile-json",
+                 type=click.Path(dir_okay=False, path_type=pathlib.Path),
+                 default=None,
+                 help=docs.profile_json),
+    click.option("--incremental",
+                 type=click.Path(dir_okay=False, path_type=pathlib.Path),
+                 default=None,
+                 help=docs.incremental),
+    click.option("--incremental-key",
+                 type=str,
+                 default=None,
+                 help=docs.incremental_key),
+    click.option("--deduplicate-rows",
+                 type=bool,
+                 default=False,
+                 is_flag=True,
+                 help=docs.deduplicate_rows)
 ]
 
 
@@ -58,6 +119,116 @@ def common_options(f: Callable) -> Callable:
     return f
 
 
+def _get_table_cache(cache_dir: pathlib.Path | None,
+                     cache_max_size: int) -> "TableCache | None":
+    """Get a TableCache for the --cache-dir/--cache-max-size options."""
+    if cache_dir is None:
+        return None
+
+    from tabulardf.cli.table_cache import TableCache
+
+    try:
+        return TableCache(cache_dir, max_size=cache_max_size * 2 ** 20)
+    except ImportError as e:
+        raise click.BadParameter(str(e), param_hint="'--cache-dir'")
+
+
+def _get_profiler(profile: bool,
+                  profile_json: pathlib.Path | None) -> "Profiler":
+    """Get a Profiler for the --profile/--profile-json options.
+
+    If both are inactive, a NullProfiler is returned.
+    """
+    from tabulardf.profiling import NULL_PROFILER, Profiler
+
+    return Profiler() if profile or profile_json else NULL_PROFILER
+
+
+def _report_profile(profiler: "Profiler",
+                    profile: bool,
+                    profile_json: pathlib.Path | None) -> None:
+    """Echo a profile summary to stderr and/or write it to a JSON file."""
+    if profile:
+        click.echo(profiler.report(), err=True)
+
+    if profile_json:
+        profile_json.write_text(json.dumps(profiler.to_dict(), indent=2))
+
+
+def _get_incremental_cache(incremental: pathlib.Path | None,
+                           incremental_key: str | None,
+                           table: pathlib.Path,
+                           column: str | None,
+                           rows: tuple[Any, ...],
+                           chunksize: int | None,
+                           group_by: str | None) -> "IncrementalCache | None":
+    """Get an IncrementalCache for the --incremental/--incremental-key options.
+
+    Cached rows are namespaced by table path and partition.
+    """
+    if incremental is None:
+        if incremental_key:
+            raise click.UsageError("Option '--incremental-key' requires '--incremental'.")
+        return None
+
+    if chunksize or group_by:
+        raise click.UsageError(
+            "Option '--incremental' is mutually exclusive with '--chunksize' and '--group-by'."
+        )
+
+    from tabulardf.incremental import IncrementalCache
+
+    namespace = str(table.resolve())
+
+    if column:
+        namespace = f"{namespace}?{column}={rows!r}"
+
+    return IncrementalCache(incremental, namespace=namespace, key_column=incremental_key)
+
+
+def _check_incremental_key(converter: "TemplateConverter",
+                           incremental_cache: "IncrementalCache | None") -> None:
+    """Check that the --incremental-key column identifies the rows of a converter's table."""
+    if incremental_cache is None:
+        return
+
+    from tabulardf.incremental import IncrementalKeyError, get_row_keys
+
+    try:
+        get_row_keys(converter.dataframe, incremental_cache.key_column)
+    except IncrementalKeyError as e:
+        raise click.BadParameter(str(e), param_hint="'--incremental-key'")
+
+
+def _check_group_options(group_by: str | None,
+                         chunksize: int | None,
+                         workers: int | None,
+                         render_by_row: bool | None = None) -> None:
+    """Check option dependencies of --group-by and --workers.
+
+    render_by_row is None for commands without a --render-by-row option.
+    """
+    if group_by and chunksize:
+        raise click.UsageError("Options '--group-by' and '--chunksize' are mutually exclusive.")
+
+    if workers and not (group_by or render_by_row):
+        if render_by_row is None:
+            raise click.UsageError("Option '--workers' requires '--group-by'.")
+
+        raise click.UsageError("Option '--workers' requires '--group-by' or '--render-by-row'.")
+
+
+def _convert_groups(**kwargs) -> None:
+    """Run a batch conversion and echo the output paths."""
+    from tabulardf.cli.batch import OutputPatternError, convert_groups
+
+    try:
+        for path in convert_groups(**kwargs):
+            click.echo(path)
+    except OutputPatternError as e:
+        raise click.BadParameter(str(e), param_hint="'--output'")
+
+
 @click.group(cls=DefaultCommandGroup)
 def tacl():  # noqa: D403
     """TabulaRDF CLI.
@@ -80,61 +251,281 @@ def noparse(table: pathlib.Path,
             column: str,
             rows: tuple[Any, ...],
             context_module: pathlib.Path | None = None,
+            chunksize: int | None = None,
+            cache_dir: pathlib.Path | None = None,
+            cache_max_size: int = 1024,
+            group_by: str | None = None,
+            output: str | None = None,
+            workers: int | None = None,
+            profile: bool = False,
+            profile_json: pathlib.Path | None = None,
+            incremental: pathlib.Path | None = None,
+            incremental_key: str | None = None,
+            deduplicate_rows: bool = False,
             render_by_row: bool = False):
     """Generate Jinja2 renderings without prior parsing.
 
     \b
-    TABLE: A file holding tabular data, e.g. an Excel or csv file.
+    TABLE: A file holding tabular data, e.g. an Excel, csv or Parquet file.
     TEMPLATE: A Jinja2 template file.
     """
-    # get converter
-    converter = initialize_converter(
-        converter_type=TemplateConverter,
-        table=table,
-        template=template,
-        column=column,
-        rows=rows,
-        context_module=context_module
+    from tabulardf import TemplateConverter
+    from tabulardf.cli.batch import write_rendering
+    from tabulardf.cli.converter_setup import (
+        initialize_chunked_converters,
+        initialize_converter
     )
 
-    # render according to strategy (table or row)
-    if render_by_row:
-        click.echo(converter.render_by_row())
+    if chunksize and not render_by_row:
+        raise click.UsageError("Option '--chunksize' requires '--render-by-row'.")
+
+    if incremental and not render_by_row:
+        raise click.UsageError("Option '--incremental' requires '--render-by-row'.")
+
+    _check_group_options(group_by, chunksize, workers, render_by_row)
+    table_cache = _get_table_cache(cache_dir, cache_max_size)
+    profiler = _get_profiler(profile, profile_json)
+    incremental_cache = _get_incremental_cache(
+        incremental, incremental_key, table, column, rows, chunksize, group_by
+    )
+
+    # write a rendering per group
+    if group_by:
+        _convert_groups(
+            converter_type=TemplateConverter,
+            table=table,
+            template=template,
+            group_by=group_by,
+            output_pattern=output,
+            write_output=functools.partial(write_rendering, render_by_row=render_by_row),
+            column=column,
+            rows=rows,
+            context_module=context_module,
+            table_cache=table_cache,
+            workers=workers,
+            profiler=profiler,
+            deduplicate_rows=deduplicate_rows
+        )
+        _report_profile(profiler, profile, profile_json)
+        return
+
+    # get converter(s)
+    if chunksize:
+        converters = initialize_chunked_converters(
+            converter_type=TemplateConverter,
+            table=table,
+            template=template,
+            chunksize=chunksize,
+            column=column,
+            rows=rows,
+            context_module=context_module,
+            table_cache=table_cache,
+            profiler=profiler,
+            deduplicate_rows=deduplicate_rows
+        )
     else:
-        click.echo(converter.render())
+        converter = initialize_converter(
+            converter_type=TemplateConverter,
+            table=table,
+            template=template,
+            column=column,
+            rows=rows,
+            context_module=context_module,
+            table_cache=table_cache,
+            profiler=profiler,
+            incremental=incremental_cache,
+            deduplicate_rows=deduplicate_rows
+        )
+        _check_incremental_key(converter, incremental_cache)
+        converters = [converter]
+
+    # render according to strategy (table or row)
+    for converter in converters:
+        if render_by_row:
+            for rendering in converter.render_by_row(workers=workers):
+                click.echo(rendering)
+        else:
+            click.echo(converter.render())
+
+    _report_profile(profiler, profile, profile_json)
 
 
 @tacl.command()
 @common_options
 @click.option("-f", "--format",
               type=_GraphFormatOptionsChoice,
+              metavar="FORMAT",
               default="ttl",
               help=docs.format)
+@click.option("--parse-batch-size",
+              type=click.IntRange(min=1),
+              default=1,
+              help=docs.parse_batch_size)
+@click.option("--input-format",
+              type=_GraphInputFormatOptionsChoice,
+              metavar="FORMAT",
+              default=None,
+              help=docs.input_format)
+@click.option("--stream",
+              type=bool,
+              default=False,
+              is_flag=True,
+              help=docs.stream)
+@click.option("--store",
+              type=click.Path(dir_okay=False, path_type=pathlib.Path),
+              default=None,
+              help=docs.store)
 def graph(table: pathlib.Path,
           template: pathlib.Path,
           column: str,
           rows: tuple[Any, ...],
           context_module: pathlib.Path | None = None,
-          # https://mypy.readthedocs.io/en/stable/common_issues.html#variables-vs-type-aliases
-          format: _GraphFormatOptions = "ttl"):
+          chunksize: int | None = None,
+          cache_dir: pathlib.Path | None = None,
+          cache_max_size: int = 1024,
+          group_by: str | None = None,
+          output: str | None = None,
+          workers: int | None = None,
+          profile: bool = False,
+          profile_json: pathlib.Path | None = None,
+          incremental: pathlib.Path | None = None,
+          incremental_key: str | None = None,
+          deduplicate_rows: bool = False,
+          format: str = "ttl",
+          parse_batch_size: int = 1,
+          input_format: str | None = None,
+          stream: bool = False,
+          store: pathlib.Path | None = None):
     """Generate and parse Jinja2 renderings into an rdflib.Graph.
 
     \b
-    TABLE: A file holding tabular data, e.g. an Excel or csv file.
+    TABLE: A file holding tabular data, e.g. an Excel, csv or Parquet file.
     TEMPLATE: A Jinja2 template file.
     """
-    # get converter
-    converter = initialize_converter(
-        converter_type=TemplateGraphConverter,
-        table=table,
-        template=template,
-        column=column,
-        rows=rows,
-        context_module=context_module
+    from rdflib import Graph
+
+    from tabulardf import TemplateGraphConverter
+    from tabulardf.cli.batch import write_graph
+    from tabulardf.cli.converter_setup import (
+        initialize_chunked_converters,
+        initialize_converter
+    )
+    from tabulardf.sqlite_store import get_sqlite_graph
+    from tabulardf.streaming import (
+        UnsupportedStreamingFormatError,
+        get_streaming_format
+    )
+
+    if stream:
+        try:
+            get_streaming_format(format)
+        except UnsupportedStreamingFormatError as e:
+            raise click.BadParameter(str(e), param_hint="'--format'")
+
+    if store and (stream or group_by):
+        raise click.UsageError(
+            "Option '--store' is mutually exclusive with '--stream' and '--group-by'."
+        )
+
+    # the incremental graph is only available after parsing all cached triples
+    if incremental and stream:
+        raise click.UsageError("Options '--incremental' and '--stream' are mutually exclusive.")
+
+    _check_group_options(group_by, chunksize, workers)
+    table_cache = _get_table_cache(cache_dir, cache_max_size)
+    profiler = _get_profiler(profile, profile_json)
+    incremental_cache = _get_incremental_cache(
+        incremental, incremental_key, table, column, rows, chunksize, group_by
     )
 
+    # write a graph per group
+    if group_by:
+        _convert_groups(
+            converter_type=TemplateGraphConverter,
+            table=table,
+            template=template,
+            group_by=group_by,
+            output_pattern=output,
+            write_output=functools.partial(write_graph, format=format, stream=stream),
+            column=column,
+            rows=rows,
+            context_module=context_module,
+            table_cache=table_cache,
+            workers=workers,
+            profiler=profiler,
+            deduplicate_rows=deduplicate_rows,
+            parse_batch_size=parse_batch_size,
+            input_format=input_format
+        )
+        _report_profile(profiler, profile, profile_json)
+        return
+
+    # get converter(s)
+    graph_component = Graph() if store is None else get_sqlite_graph(store)
+
+    if chunksize:
+        # chunk converters share a graph component unless streaming
+        graph_kwargs = {} if stream else {"graph": graph_component}
+
+        converters = initialize_chunked_converters(
+            converter_type=TemplateGraphConverter,
+            table=table,
+            template=template,
+            chunksize=chunksize,
+            column=column,
+            rows=rows,
+            context_module=context_module,
+            table_cache=table_cache,
+            profiler=profiler,
+            deduplicate_rows=deduplicate_rows,
+            parse_batch_size=parse_batch_size,
+            input_format=input_format,
+            **graph_kwargs
+        )
+    else:
+        converter = initialize_converter(
+            converter_type=TemplateGraphConverter,
+            table=table,
+            template=template,
+            column=column,
+            rows=rows,
+            context_module=context_module,
+            table_cache=table_cache,
+            profiler=profiler,
+            incremental=incremental_cache,
+            deduplicate_rows=deduplicate_rows,
+            parse_batch_size=parse_batch_size,
+            input_format=input_format,
+            graph=graph_component
+        )
+        _check_incremental_key(converter, incremental_cache)
+        converters = [converter]
+
+    # stream triples per row or
     # serialize from rdflib.Graph instance according to format
-    click.echo(converter.serialize(format=format))
+    if stream:
+        for converter in converters:
+            converter.serialize_to_stream(
+                sys.stdout,
+                format=format
+            )
+    else:
+        for converter in converters:
+            converter.to_graph()
+
+        with profiler.stage("serialize"):
+            if store is None:
+                click.echo(graph_component.serialize(format=format))
+            else:
+                # serialize straight out of the store
+                graph_component.serialize(
+                    destination=sys.stdout.buffer,
+                    format=format,
+                    encoding="utf-8"
+                )
+                graph_component.close()
+
+    _report_profile(profiler, profile, profile_json)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,151 @@
+"""Static analysis of Jinja templates for TabulaRDF template conversions.
+
+Functionality for determining which table columns a template references.
+"""
+
+from typing import Any, Generator, Optional
+
+from jinja2 import Environment, Template, TemplateNotFound, nodes
+
+
+ROW_DATA = "row_data"
+TABLE_DATA = "table_data"
+
+# nodes that pull in (and pass the context to) other templates
+_EXTERNAL_TEMPLATE_NODES = (
+    nodes.Extends,
+    nodes.Include,
+    nodes.Import,
+    nodes.FromImport,
+)
+
+
+class _DynamicAccess(Exception):  # noqa: D204
+    """Signal for table data access that cannot be resolved statically."""
+    pass
+
+
+def get_template_source(template: Template) -> Optional[str]:
+    """Get the source of a jinja2.Template.
+
+    The source is only available for templates loaded by an Environment loader;
+    for other templates (e.g. instantiated from a string) None is returned.
+    """
+    environment = template.environment
+
+    if environment.loader is None or template.name is None:
+        return None
+
+    try:
+        source, _, _ = environment.loader.get_source(environment, template.name)
+    except TemplateNotFound:
+        return None
+
+    return source
+
+
+def _walk(node: nodes.Node,
+          parent: Optional[nodes.Node] = None,
+          grandparent: Optional[nodes.Node] = None
+          ) -> Generator[tuple[nodes.Node, Optional[nodes.Node], Optional[nodes.Node]], None, None]:
+    """Recursively yield every node of an AST together with its parent and grandparent."""
+    yield node, parent, grandparent
+
+    for child in node.iter_child_nodes():
+        yield from _walk(child, node, parent)
+
+
+def _get_row_aliases(ast: nodes.Template) -> set[str]:
+    """Get the loop variable names of for loops over table_data."""
+    aliases = set()
+
+    for loop in ast.find_all(nodes.For):
+        if isinstance(loop.iter, nodes.Name) and loop.iter.name == TABLE_DATA:
+            if not isinstance(loop.target, nodes.Name):
+                # e.g. tuple unpacking of row dicts
+                raise _DynamicAccess
+            aliases.add(loop.target.name)
+
+    return aliases
+
+
+def _get_key(name: nodes.Name,
+             parent: Optional[nodes.Node],
+             grandparent: Optional[nodes.Node]) -> Any:
+    """Get the key of a static row data access (e.g. row_data['x'] or row_data.x)."""
+    if (isinstance(parent, nodes.Getitem)
+            and parent.node is name
+            and isinstance(parent.arg, nodes.Const)):
+        return parent.arg.value
+
+    if isinstance(parent, nodes.Getattr) and parent.node is name:
+        if isinstance(grandparent, nodes.Call) and grandparent.node is parent:
+            # method call, e.g. row_data.items()
+            raise _DynamicAccess
+        return parent.attr
+
+    raise _DynamicAccess
+
+
+def _get_referenced_keys(ast: nodes.Template) -> set:
+    """Get all row data keys referenced in a template AST.
+
+    Raises _DynamicAccess if row data is accessed in a way
+    that cannot be resolved statically.
+    """
+    if any(True for _ in ast.find_all(_EXTERNAL_TEMPLATE_NODES)):
+        raise _DynamicAccess
+
+    row_names = {ROW_DATA, *_get_row_aliases(ast)}
+    keys = set()
+
+    for node, parent, grandparent in _walk(ast):
+        if not isinstance(node, nodes.Name):
+            continue
+
+        if node.name == TABLE_DATA:
+            # only iteration over table_data is allowed
+            if not (isinstance(parent, nodes.For) and parent.iter is node):
+                raise _DynamicAccess
+            continue
+
+        if node.name not in row_names:
+            continue
+
+        if node.ctx != "load":
+            # loop targets are fine, anything else shadows row data
+            if isinstance(parent, nodes.For) and parent.target is node:
+                continue
+            raise _DynamicAccess
+
+        keys.add(_get_key(node, parent, grandparent))
+
+    return keys
+
+
+def get_referenced_columns(template: Template | str,
+                           environment: Optional[Environment] = None
+                           ) -> Optional[set]:
+    """Get the table columns referenced by a template.
+
+    Collects all static row_data[...]/row_data.x accesses
+    (and accesses on loop variables of for loops over table_data).
+    Returns None if the columns cannot be determined statically,
+    e.g. if the template source is not available,
+    if row data is accessed dynamically (e.g. row_data[key] or row_data.items())
+    or if other templates are included/imported/extended.
+    """
+    if isinstance(template, Template):
+        environment = template.environment
+        source = get_template_source(template)
+    else:
+        environment = environment or Environment()
+        source = template
+
+    if source is None:
+        return None
+
+    try:
+        return _get_referenced_keys(environment.parse(source))
+    except _DynamicAccess:
+        return None
@@ -0,0 +1,98 @@
+"""Shared Jinja environments for TabulaRDF template conversions.
+
+Functionality for a process-wide jinja2.Environment registry
+with an opt-in persistent on-disk bytecode cache.
+"""
+
+import logging
+import os
+import pathlib
+import threading
+
+from typing import Optional
+
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    select_autoescape
+)
+
+from tabulardf.template_triples import TripleExtension
+
+
+logger = logging.getLogger(__name__)
+
+# set to a directory to enable the bytecode cache
+CACHE_DIR_ENV_VAR = "TABULARDF_CACHE_DIR"
+
+_environments: dict[pathlib.Path, Environment] = {}
+_environments_lock = threading.Lock()
+
+
+def get_cache_dir() -> Optional[pathlib.Path]:
+    """Get the TabulaRDF cache directory.
+
+    The directory is taken from the TABULARDF_CACHE_DIR environment variable;
+    caching is opt-in, so if TABULARDF_CACHE_DIR is unset or empty, None is returned.
+    """
+    cache_dir = os.environ.get(CACHE_DIR_ENV_VAR)
+
+    return pathlib.Path(cache_dir) if cache_dir else None
+
+
+def get_bytecode_cache() -> Optional[FileSystemBytecodeCache]:
+    """Get a bytecode cache in the jinja subdirectory of the TabulaRDF cache directory.
+
+    jinja2 keys cached bytecode by template name and file name
+    and invalidates it if the checksum of the template source changes.
+    Returns None if caching is disabled or the directory is not writable.
+    """
+    cache_dir = get_cache_dir()
+
+    if cache_dir is None:
+        return None
+
+    bytecode_cache_dir = cache_dir / "jinja"
+
+    try:
+        bytecode_cache_dir.mkdir(parents=True, exist_ok=True)
+    except OSError as e:
+        logger.warning(f"Unable to create bytecode cache directory '{bytecode_cache_dir}': {e}")
+        return None
+
+    return FileSystemBytecodeCache(str(bytecode_cache_dir))
+
+
+def get_environment(template_folder_path: os.PathLike) -> Environment:
+    """Get the shared jinja2.Environment for a template directory.
+
+    Environments are created once per directory and process
+    and keep compiled templates in memory; with auto_reload,
+    templates are recompiled if the template file mtime changes.
+    If TABULARDF_CACHE_DIR is set, compiled bytecode is additionally cached on disk,
+    see get_bytecode_cache.
+    Environments load the triple tag, see tabulardf.template_triples.TripleExtension.
+    """
+    template_folder_path = pathlib.Path(template_folder_path).absolute()
+
+    with _environments_lock:
+        environment = _environments.get(template_folder_path)
+
+        if environment is None:
+            environment = Environment(
+                loader=FileSystemLoader(template_folder_path),
+                autoescape=select_autoescape(),
+                bytecode_cache=get_bytecode_cache(),
+                auto_reload=True,
+                extensions=[TripleExtension]
+            )
+            _environments[template_folder_path] = environment
+
+    return environment
+
+
+def clear_environments() -> None:
+    """Clear the environment registry."""
+    with _environments_lock:
+        _environments.clear()
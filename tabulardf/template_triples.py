@@ -0,0 +1,140 @@
+"""Direct triple emission for TabulaRDF templates.
+
+Functionality for emitting rdflib triples from jinja templates while they render,
+so TemplateGraphConverter does not need to parse renderings.
+
+Templates emit triples with the triple tag (see TripleExtension)
+
+    {% triple uri(row_data["iri"]), "http://www.w3.org/2000/01/rdf-schema#label", row_data["label"] %}
+
+or the triple function (e.g. '{{ triple(s, p, o) }}');
+both pass terms to a TripleSink provided in the template data context.
+"""
+
+from typing import Any, Optional
+
+import pandas as pd
+
+from jinja2 import nodes
+from jinja2.ext import Extension
+from jinja2.parser import Parser
+from jinja2.runtime import Context
+from rdflib import BNode, Literal, URIRef
+from rdflib.term import Node
+
+from tabulardf.streaming import _encode_term
+from tabulardf.tabulardf_types import _Triple
+
+
+# reserved name of the triple sink in the template data context, used by the triple tag
+TRIPLE_SINK_NAME = "_tabulardf_triple_sink"
+
+# name of the triple function in the template data context (unless defined in the data)
+TRIPLE_FUNCTION_NAME = "triple"
+
+
+def _is_missing(value: Any) -> bool:
+    """Check if a template value is a missing value (e.g. None or NaN)."""
+    if value is None:
+        return True
+
+    if isinstance(value, (str, Node)):
+        return False
+
+    return pd.api.types.is_scalar(value) and pd.isna(value)
+
+
+def get_triple(s: Any, p: Any, o: Any) -> Optional[_Triple]:
+    """Get an rdflib triple from template values.
+
+    rdflib terms are taken as is; otherwise subjects and predicates are taken as IRIs
+    and objects as literals (typed according to their Python type).
+    Returns None if any value is missing (e.g. an empty table field).
+    """
+    if _is_missing(s) or _is_missing(p) or _is_missing(o):
+        return None
+
+    return (
+        s if isinstance(s, Node) else URIRef(s),
+        p if isinstance(p, Node) else URIRef(p),
+        o if isinstance(o, Node) else Literal(o)
+    )
+
+
+class TripleSink:
+    """Collector for triples emitted by templates.
+
+    TripleSink.triple is callable from templates and renders to an empty string,
+    so '{{ triple(s, p, o) }}' does not add text to a rendering.
+    """
+
+    def __init__(self) -> None:
+        """Initialize a TripleSink."""
+        self.triples: list[_Triple] = []
+
+    def triple(self, s: Any, p: Any, o: Any) -> str:
+        """Add a triple, see get_triple."""
+        triple = get_triple(s, p, o)
+
+        if triple is not None:
+            self.triples.append(triple)
+
+        return ""
+
+    def take(self) -> list[_Triple]:
+        """Get and remove all collected triples."""
+        triples, self.triples = self.triples, []
+        return triples
+
+
+class TripleExtension(Extension):
+    """Jinja extension for the triple tag.
+
+    '{% triple s, p, o %}' passes a triple to the triple sink of the data context;
+    without a triple sink (e.g. for TemplateConverter renderings),
+    the triple is rendered as an N-Triples line instead.
+
+    The extension also provides the template globals
+    'uri', 'literal' and 'bnode' (i.e. rdflib.URIRef, rdflib.Literal and rdflib.BNode)
+    for constructing terms. Note that 'bnode()' mints a fresh blank node per call,
+    so a blank node that is used in several triples should be assigned with set.
+    """
+
+    tags = {"triple"}
+
+    def __init__(self, environment) -> None:
+        """Initialize a TripleExtension."""
+        super().__init__(environment)
+        environment.globals.update(uri=URIRef, literal=Literal, bnode=BNode)
+
+    def parse(self, parser: Parser) -> nodes.Output:
+        """Parse a triple tag into a call of _emit_triple."""
+        lineno = next(parser.stream).lineno
+        terms = [parser.parse_expression()]
+
+        for _ in range(2):
+            parser.stream.expect("comma")
+            terms.append(parser.parse_expression())
+
+        call = self.call_method(
+            "_emit_triple",
+            [nodes.ContextReference(), *terms],
+            lineno=lineno
+        )
+
+        return nodes.Output([nodes.MarkSafeIfAutoescape(call)], lineno=lineno)
+
+    @staticmethod
+    def _emit_triple(context: Context, s: Any, p: Any, o: Any) -> str:
+        """Pass a triple to the triple sink or render it as N-Triples."""
+        sink = context.get(TRIPLE_SINK_NAME)
+
+        if sink is not None:
+            return sink(s, p, o)
+
+        triple = get_triple(s, p, o)
+
+        if triple is None:
+            return ""
+
+        return " ".join(_encode_term(term) for term in triple) + " .\n"
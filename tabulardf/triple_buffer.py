@@ -0,0 +1,207 @@
+"""Compact triple buffers for TabulaRDF graph converters.
+
+Functionality for accumulating (large numbers of) triples as integer IDs
+instead of rdflib term objects before they are flushed into a graph or serializer:
+every distinct term is interned once in a term dictionary
+and triples are stored as three parallel arrays of 64-bit term IDs.
+
+    buffer = converter.to_buffer()
+    buffer.deduplicate()
+    buffer.dump("graph.nt")
+"""
+
+import itertools
+import os
+
+from array import array
+from typing import Any, BinaryIO, Generator, Iterable, Optional
+
+import numpy as np
+
+from rdflib import Graph
+from rdflib.term import Identifier
+
+from tabulardf.serializers import (
+    _write_batched,
+    get_serialization_format,
+    open_binary_destination,
+    write_flat_turtle
+)
+from tabulardf.streaming import get_term_encoder
+from tabulardf.tabulardf_types import _Triple
+
+
+# quads per Graph.addN call when flushing into a graph
+DEFAULT_FLUSH_BATCH_SIZE = 10_000
+
+
+class TripleBuffer:
+    """Dictionary-encoded buffer of triples.
+
+    Every distinct term is stored once in a term dictionary and mapped to an integer ID;
+    a triple takes 24 bytes (three int64 IDs in array('q') columns)
+    instead of three references to rdflib terms (and a tuple) per triple.
+
+    Deduplication and sorting operate on the ID columns (see deduplicate and sort).
+    Triples are decoded on iteration and can be flushed into a graph (to_graph)
+    or serialized without building a graph (dump).
+    """
+
+    def __init__(self, triples: Iterable[_Triple] = ()) -> None:
+        """Initialize a TripleBuffer, optionally with triples."""
+        self._ids: dict[Identifier, int] = {}
+        self._terms: list[Identifier] = []
+        self._subjects = array("q")
+        self._predicates = array("q")
+        self._objects = array("q")
+
+        self.extend(triples)
+
+    def __len__(self) -> int:
+        """Get the number of buffered triples (including duplicates)."""
+        return len(self._subjects)
+
+    def __iter__(self) -> Generator[_Triple, None, None]:
+        """Generate the buffered triples in buffer order."""
+        terms = self._terms
+
+        for s, p, o in zip(self._subjects, self._predicates, self._objects):
+            yield terms[s], terms[p], terms[o]
+
+    @property
+    def term_count(self) -> int:
+        """Get the number of distinct terms in the term dictionary."""
+        return len(self._terms)
+
+    def add(self, triple: _Triple) -> None:
+        """Add a single triple."""
+        self.extend((triple,))
+
+    def extend(self, triples: Iterable[_Triple]) -> "TripleBuffer":
+        """Add triples and return the buffer."""
+        ids, terms = self._ids, self._terms
+        get_id = ids.get
+
+        def _intern(term: Identifier) -> int:
+            term_id = ids[term] = len(terms)
+            terms.append(term)
+            return term_id
+
+        append_subject = self._subjects.append
+        append_predicate = self._predicates.append
+        append_object = self._objects.append
+
+        for s, p, o in triples:
+            s_id = get_id(s)
+            append_subject(_intern(s) if s_id is None else s_id)
+            p_id = get_id(p)
+            append_predicate(_intern(p) if p_id is None else p_id)
+            o_id = get_id(o)
+            append_object(_intern(o) if o_id is None else o_id)
+
+        return self
+
+    def clear(self) -> None:
+        """Remove all triples and terms."""
+        self._ids.clear()
+        self._terms.clear()
+
+        for column in (self._subjects, self._predicates, self._objects):
+            del column[:]
+
+    def _get_columns(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Get read-only numpy views of the ID columns."""
+        return tuple(
+            np.frombuffer(column, dtype=np.int64)
+            for column in (self._subjects, self._predicates, self._objects)
+        )
+
+    def _take(self, indices: np.ndarray) -> None:
+        """Replace the ID columns with the rows at indices."""
+        self._subjects, self._predicates, self._objects = (
+            array("q", column[indices].tobytes())
+            for column in self._get_columns()
+        )
+
+    def _get_sort_order(self) -> np.ndarray:
+        """Get the (stable) permutation that sorts triples by subject, predicate and object ID."""
+        subjects, predicates, objects = self._get_columns()
+
+        return np.lexsort((objects, predicates, subjects))
+
+    def sort(self) -> None:
+        """Sort triples by subject, predicate and object ID.
+
+        Terms are numbered in order of first occurrence, so triples are grouped by subject
+        (e.g. for subject runs in flat Turtle, see tabulardf.serializers)
+        in the order subjects were first added.
+        """
+        if len(self):
+            self._take(self._get_sort_order())
+
+    def deduplicate(self) -> int:
+        """Remove duplicate triples, keeping first occurrences in buffer order.
+
+        Returns the number of removed triples.
+        """
+        if not len(self):
+            return 0
+
+        order = self._get_sort_order()
+        sorted_columns = [column[order] for column in self._get_columns()]
+
+        is_first = np.ones(len(order), dtype=bool)
+        is_first[1:] = np.any(
+            [column[1:] != column[:-1] for column in sorted_columns],
+            axis=0
+        )
+        # lexsort is stable, so the first of equal triples is the first occurrence
+        kept = np.sort(order[is_first])
+        removed = len(self) - len(kept)
+
+        if removed:
+            self._take(kept)
+
+        return removed
+
+    def to_graph(self,
+                 graph: Optional[Graph] = None,
+                 batch_size: int = DEFAULT_FLUSH_BATCH_SIZE) -> Graph:
+        """Flush the buffered triples into a graph in batches of Graph.addN calls.
+
+        The buffer is not cleared; see clear.
+        """
+        graph = Graph() if graph is None else graph
+        quads = ((s, p, o, graph) for s, p, o in self)
+
+        while batch := list(itertools.islice(quads, batch_size)):
+            graph.addN(batch)
+
+        return graph
+
+    def _generate_ntriples(self) -> Generator[str, None, None]:
+        """Generate N-Triples lines; every distinct term is encoded only once."""
+        encode = get_term_encoder(maxsize=0)
+        encoded = [encode(term) for term in self._terms]
+
+        for s, p, o in zip(self._subjects, self._predicates, self._objects):
+            yield f"{encoded[s]} {encoded[p]} {encoded[o]} .\n"
+
+    def dump(self,
+             destination: str | os.PathLike | BinaryIO,
+             format: str = "nt",
+             compress: Optional[bool] = None,
+             namespaces: Iterable[tuple[str, Any]] = ()) -> None:
+        """Serialize the buffered triples to N-Triples or flat Turtle without building a graph.
+
+        IRIs in namespaces (e.g. Graph.namespaces()) are abbreviated in Turtle output;
+        sort the buffer first to group Turtle statements by subject.
+        See tabulardf.serializers.serialize_graph.
+        """
+        serialization_format = get_serialization_format(format)
+
+        with open_binary_destination(destination, compress) as stream:
+            if serialization_format == "nt":
+                _write_batched(self._generate_ntriples(), stream)
+            else:
+                write_flat_turtle(self, stream, namespaces=namespaces)
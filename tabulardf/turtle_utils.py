@@ -0,0 +1,73 @@
+"""Turtle utilities for TabulaRDF template conversions."""
+
+import re
+
+from typing import Iterable, Optional
+
+
+_PREFIX_PATTERN = re.compile(
+    r"^[ \t]*(?:@prefix|(?i:PREFIX))[ \t]+(?P<label>[^\s:]*):[ \t]*"
+    r"<(?P<iri>[^>]*)>[ \t]*\.?[ \t]*$",
+    re.MULTILINE
+)
+
+_BASE_PATTERN = re.compile(r"^[ \t]*(?:@base|(?i:BASE))\b", re.MULTILINE)
+
+# prefix declarations not on a line of their own (e.g. several declarations per line)
+_INLINE_PREFIX_PATTERN = re.compile(r"(?:@prefix|(?i:PREFIX))[ \t]+[^\s:]*:")
+
+
+def join_turtle_renderings(renderings: Iterable[str]) -> Optional[tuple[str, dict[str, str]]]:
+    """Join Turtle renderings into a single Turtle document.
+
+    Prefix declarations are deduplicated and hoisted to the top of the document.
+    Returns the joined document and a mapping of the collected prefixes
+    or None if the renderings cannot safely be joined, i.e. if
+
+    - a prefix label is declared with different IRIs,
+    - a base IRI is declared,
+    - a prefix is declared on a line with other content or
+    - blank node labels are used (labels are document-scoped in Turtle).
+    """
+    prefixes: dict[str, str] = {}
+    bodies: list[str] = []
+
+    for rendering in renderings:
+        if "_:" in rendering or _BASE_PATTERN.search(rendering):
+            return None
+
+        for match in _PREFIX_PATTERN.finditer(rendering):
+            label, iri = match.group("label", "iri")
+
+            if prefixes.setdefault(label, iri) != iri:
+                return None
+
+        body = _PREFIX_PATTERN.sub("", rendering)
+
+        if _INLINE_PREFIX_PATTERN.search(body):
+            return None
+
+        bodies.append(body)
+
+    header = "".join(
+        f"@prefix {label}: <{iri}> .\n"
+        for label, iri in prefixes.items()
+    )
+
+    return header + "\n".join(bodies), prefixes
+
+
+def get_prefixes(rendering: str) -> dict[str, str]:
+    """Get a mapping of the prefixes declared in a Turtle rendering.
+
+    If a label is declared more than once, the last declaration wins.
+    """
+    return {
+        match.group("label"): match.group("iri")
+        for match in _PREFIX_PATTERN.finditer(rendering)
+    }
+
+
+def remove_prefix_declarations(rendering: str) -> str:
+    """Remove the prefix declarations from a Turtle rendering."""
+    return _PREFIX_PATTERN.sub("", rendering)
@@ -1,7 +1,13 @@
 """Pytest entry point for the TabulaRDF CLI graph subcommand"""
 
+import importlib.util
+import json
+
+import pytest
+
 from click.testing import CliRunner
 from rdflib import Graph
+from rdflib.compare import isomorphic
 
 from tests.data import templates_path, tables_path
 from tabulardf import tacl
@@ -35,3 +41,318 @@ def test_cli_graph_rem():
 
     graph = Graph().parse(data=result.output)
     assert graph
+
+
+def test_cli_graph_stream():
+    """Test for the tacl CLI with streaming output.
+
+    The following shell command is tested:
+    'tacl graph corpusTable_prep.csv template_cortab_name_acronym.ttl --column id --rows 14 --format nt --stream'.# noqa E501
+    """
+    runner = CliRunner()
+
+    arguments = [
+        "graph",
+        str(table),
+        str(template),
+        "--column", "id",
+        "--rows", 14,
+        "--format", "nt"
+    ]
+
+    result = runner.invoke(tacl.tacl, arguments)
+    stream_result = runner.invoke(tacl.tacl, [*arguments, "--stream"])
+
+    assert stream_result.exit_code == 0
+
+    graph = Graph().parse(data=result.output, format="nt")
+    stream_graph = Graph().parse(data=stream_result.output, format="nt")
+
+    assert isomorphic(graph, stream_graph)
+
+
+def test_cli_graph_input_format_ntriples():
+    """Test for the tacl CLI with N-Triples renderings.
+
+    The following shell command is tested:
+    'tacl graph corpusTable_prep.csv template_cortab_name_acronym.nt --column id --rows 14 --input-format nt --format nt --stream'.# noqa E501
+    """
+    runner = CliRunner()
+    partition = ["--column", "id", "--rows", 14]
+
+    result = runner.invoke(
+        tacl.tacl,
+        ["graph", str(table), str(template), *partition, "--format", "nt"]
+    )
+    ntriples_result = runner.invoke(
+        tacl.tacl,
+        [
+            "graph",
+            str(table),
+            str(templates_path / "template_cortab_name_acronym.nt"),
+            *partition,
+            "--input-format", "nt",
+            "--format", "nt",
+            "--stream"
+        ]
+    )
+
+    assert ntriples_result.exit_code == 0
+
+    graph = Graph().parse(data=result.output, format="nt")
+    ntriples_graph = Graph().parse(data=ntriples_result.output, format="nt")
+
+    assert isomorphic(graph, ntriples_graph)
+
+
+def test_cli_graph_tabulardf_serializer():
+    """Test for the tacl CLI with the tabulardf flat Turtle serializer.
+
+    The following shell command is tested:
+    'tacl graph corpusTable_prep.csv template_cortab_name_acronym.ttl --column id --rows 14 --format tabulardf-ttl'.# noqa E501
+    """
+    runner = CliRunner()
+    arguments = ["graph", str(table), str(template), "--column", "id", "--rows", 14]
+
+    result = runner.invoke(tacl.tacl, arguments)
+    flat_result = runner.invoke(tacl.tacl, [*arguments, "--format", "tabulardf-ttl"])
+
+    assert flat_result.exit_code == 0
+    assert isomorphic(
+        Graph().parse(data=result.output, format="turtle"),
+        Graph().parse(data=flat_result.output, format="turtle")
+    )
+
+
+def test_cli_graph_store(tmp_path):
+    """Test for the tacl CLI with an SQLite-backed graph.
+
+    The following shell command is tested:
+    'tacl graph corpusTable_prep.csv template_cortab_name_acronym.ttl --format nt --chunksize 10 --store graph.sqlite'.# noqa E501
+    """
+    runner = CliRunner()
+    arguments = ["graph", str(table), str(template), "--format", "nt"]
+
+    result = runner.invoke(tacl.tacl, arguments)
+    store_result = runner.invoke(
+        tacl.tacl,
+        [*arguments, "--chunksize", 10, "--store", str(tmp_path / "graph.sqlite")]
+    )
+
+    # the table holds IRIs that are invalid for the N-Triples parser, so compare lines
+    assert store_result.exit_code == 0
+    assert (
+        sorted(filter(None, store_result.output.splitlines()))
+        == sorted(filter(None, result.output.splitlines()))
+    )
+
+
+def test_cli_graph_store_expected_fail(tmp_path):
+    """SQLite-backed graphs are not available for streaming."""
+    runner = CliRunner()
+
+    result = runner.invoke(
+        tacl.tacl,
+        [
+            "graph",
+            str(table),
+            str(template),
+            "--format", "nt",
+            "--stream",
+            "--store", str(tmp_path / "graph.sqlite")
+        ]
+    )
+
+    assert result.exit_code == 2
+    assert "mutually exclusive" in result.output
+
+
+def test_cli_graph_stream_expected_fail():
+    """Streaming is only available for line-based formats."""
+    runner = CliRunner()
+
+    result = runner.invoke(
+        tacl.tacl,
+        [
+            "graph",
+            str(table),
+            str(template),
+            "--format", "ttl",
+            "--stream"
+        ]
+    )
+
+    assert result.exit_code != 0
+
+
+def test_cli_graph_chunksize():
+    """Test for the tacl CLI with chunked table ingestion.
+
+    The following shell command is tested:
+    'tacl graph corpusTable_prep.csv template_cortab_name_acronym.ttl --column id --rows 14 15 --chunksize 10'.# noqa E501
+    """
+    runner = CliRunner()
+
+    arguments = [
+        "graph",
+        str(table),
+        str(template),
+        "--column", "id",
+        "--rows", "14", "15"
+    ]
+
+    result = runner.invoke(tacl.tacl, arguments)
+    chunked_result = runner.invoke(tacl.tacl, [*arguments, "--chunksize", "10"])
+    chunked_stream_result = runner.invoke(
+        tacl.tacl,
+        [*arguments, "--chunksize", "10", "--format", "nt", "--stream"]
+    )
+
+    assert chunked_result.exit_code == 0
+    assert chunked_stream_result.exit_code == 0
+
+    graph = Graph().parse(data=result.output)
+
+    assert isomorphic(graph, Graph().parse(data=chunked_result.output))
+    assert isomorphic(
+        graph,
+        Graph().parse(data=chunked_stream_result.output, format="nt")
+    )
+
+
+@pytest.mark.skipif(
+    importlib.util.find_spec("pyarrow") is None,
+    reason="pyarrow is not installed"
+)
+def test_cli_graph_cache_dir(tmp_path):
+    """Test for the tacl CLI with a table cache.
+
+    The following shell command is tested (twice):
+    'tacl graph corpusTable_prep.xlsx template_cortab_name_acronym.ttl --column id --rows 14 15 --cache-dir <tmp>'.# noqa E501
+    """
+    runner = CliRunner()
+
+    arguments = [
+        "graph",
+        str(tables_path / "corpusTable_prep.xlsx"),
+        str(template),
+        "--column", "id",
+        "--rows", "14", "15"
+    ]
+    cache_arguments = [*arguments, "--cache-dir", str(tmp_path)]
+
+    result = runner.invoke(tacl.tacl, arguments)
+    miss_result = runner.invoke(tacl.tacl, cache_arguments)
+    hit_result = runner.invoke(tacl.tacl, cache_arguments)
+
+    assert miss_result.exit_code == 0
+    assert hit_result.exit_code == 0
+    assert len(list(tmp_path.iterdir())) == 1
+
+    graph = Graph().parse(data=result.output)
+
+    assert isomorphic(graph, Graph().parse(data=miss_result.output))
+    assert isomorphic(graph, Graph().parse(data=hit_result.output))
+
+
+@pytest.mark.parametrize("workers", [None, "2"])
+def test_cli_graph_group_by(tmp_path, workers):
+    """Test for the tacl CLI batch mode.
+
+    The following shell command is tested:
+    'tacl graph corpusTable_prep.csv template_cortab_name_acronym.ttl --column id --rows 14 15 --group-by id --output <tmp>/{column}_{value}.ttl'.# noqa E501
+    """
+    runner = CliRunner()
+
+    arguments = [
+        "graph",
+        str(table),
+        str(template),
+        "--column", "id",
+        "--rows", "14", "15",
+        "--group-by", "id",
+        "--output", str(tmp_path / "{column}_{value}.ttl")
+    ]
+
+    if workers:
+        arguments += ["--workers", workers]
+
+    result = runner.invoke(tacl.tacl, arguments)
+
+    assert result.exit_code == 0
+
+    for row in ("14", "15"):
+        row_result = runner.invoke(
+            tacl.tacl,
+            ["graph", str(table), str(template), "--column", "id", "--rows", row]
+        )
+
+        assert isomorphic(
+            Graph().parse(tmp_path / f"id_{row}.ttl"),
+            Graph().parse(data=row_result.output)
+        )
+
+
+def test_cli_graph_profile(tmp_path):
+    """Test for the tacl CLI with profiling.
+
+    The following shell command is tested:
+    'tacl graph corpusTable_prep.csv template_cortab_name_acronym.ttl --profile --profile-json profile.json'.# noqa E501
+    """
+    runner = CliRunner()
+    profile_json = tmp_path / "profile.json"
+
+    result = runner.invoke(
+        tacl.tacl,
+        [
+            "graph",
+            str(table),
+            str(template),
+            "--profile",
+            "--profile-json", str(profile_json)
+        ]
+    )
+
+    assert result.exit_code == 0
+    assert Graph().parse(data=result.stdout)
+    assert "render" in result.stderr
+
+    profile = json.loads(profile_json.read_text())
+
+    assert {"read", "rows", "render", "parse", "to_graph", "serialize"} <= set(profile)
+    assert profile["render"]["calls"] == profile["parse"]["calls"]
+
+
+def test_cli_graph_incremental(tmp_path):
+    """Test for the tacl CLI with an incremental cache.
+
+    The following shell command is tested (twice):
+    'tacl graph corpusTable_prep.csv template_cortab_name_acronym.ttl --incremental cache.sqlite --incremental-key id'.# noqa E501
+    """
+    runner = CliRunner()
+
+    arguments = [
+        "graph",
+        str(table),
+        str(template),
+        "--incremental", str(tmp_path / "cache.sqlite"),
+        "--incremental-key", "id"
+    ]
+
+    results = [runner.invoke(tacl.tacl, arguments) for _ in range(2)]
+    reference = runner.invoke(tacl.tacl, ["graph", str(table), str(template)])
+
+    assert all(result.exit_code == 0 for result in results)
+    assert all(
+        isomorphic(Graph().parse(data=result.output), Graph().parse(data=reference.output))
+        for result in results
+    )
+
+    result = runner.invoke(tacl.tacl, [*arguments[:-1], "no-column"])
+
+    assert result.exit_code == 2
+
+    result = runner.invoke(tacl.tacl, [*arguments, "--stream", "--format", "nt"])
+
+    assert result.exit_code == 2
+    assert "'--stream'" in result.output
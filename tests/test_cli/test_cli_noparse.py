@@ -43,3 +43,154 @@ def test_cli_noparse_books_row():
     The following shell command is tested:
     'tacl bookstore.csv books_table.j2 --render-by-row'."""
     ...
+
+
+def test_cli_noparse_books_row_chunksize():
+    """Test for the tacl CLI with chunked table ingestion.
+
+    The following shell command is tested:
+    'tacl noparse bookstore.csv books_row.j2 --render-by-row --chunksize 1'.
+    """
+    runner = CliRunner()
+
+    arguments = [
+        "noparse",
+        str(table),
+        str(templates_path / "books_row.j2"),
+        "--render-by-row"
+    ]
+
+    result = runner.invoke(tacl.tacl, arguments)
+    chunked_result = runner.invoke(tacl.tacl, [*arguments, "--chunksize", "1"])
+
+    assert result.exit_code == 0
+    assert chunked_result.exit_code == 0
+    assert result.output.count("<book ") == 2
+    assert chunked_result.output == result.output
+
+
+def test_cli_noparse_books_row_deduplicate_rows():
+    """Test for the tacl CLI with row deduplication.
+
+    The following shell command is tested:
+    'tacl noparse bookstore.csv books_row.j2 --render-by-row --deduplicate-rows'.
+    """
+    runner = CliRunner()
+
+    arguments = [
+        "noparse",
+        str(table),
+        str(templates_path / "books_row.j2"),
+        "--render-by-row"
+    ]
+
+    result = runner.invoke(tacl.tacl, arguments)
+    deduplicated_result = runner.invoke(tacl.tacl, [*arguments, "--deduplicate-rows"])
+
+    assert deduplicated_result.exit_code == 0
+    assert deduplicated_result.output == result.output
+
+
+def test_cli_noparse_books_row_workers():
+    """Test for the tacl CLI with parallel row rendering.
+
+    The following shell command is tested:
+    'tacl noparse bookstore.csv books_row.j2 --render-by-row --workers 2'.
+    """
+    runner = CliRunner()
+
+    arguments = [
+        "noparse",
+        str(table),
+        str(templates_path / "books_row.j2"),
+        "--render-by-row"
+    ]
+
+    result = runner.invoke(tacl.tacl, arguments)
+    parallel_result = runner.invoke(tacl.tacl, [*arguments, "--workers", "2"])
+
+    assert parallel_result.exit_code == 0
+    assert parallel_result.output == result.output
+
+
+def test_cli_noparse_workers_expected_fail():
+    """--workers requires --group-by or --render-by-row."""
+    runner = CliRunner()
+
+    result = runner.invoke(
+        tacl.tacl,
+        [
+            "noparse",
+            str(table),
+            str(template),
+            "--workers", "2"
+        ]
+    )
+
+    assert result.exit_code != 0
+    assert "'--render-by-row'" in result.output
+
+
+def test_cli_noparse_chunksize_expected_fail():
+    """--chunksize requires --render-by-row."""
+    runner = CliRunner()
+
+    result = runner.invoke(
+        tacl.tacl,
+        [
+            "noparse",
+            str(table),
+            str(template),
+            "--chunksize", "1"
+        ]
+    )
+
+    assert result.exit_code != 0
+
+
+def test_cli_noparse_group_by(tmp_path):
+    """Test for the tacl CLI batch mode.
+
+    The following shell command is tested:
+    'tacl noparse bookstore.csv books.j2 --group-by category --output <tmp>/{value}.txt'.
+    """
+    runner = CliRunner()
+
+    result = runner.invoke(
+        tacl.tacl,
+        [
+            "noparse",
+            str(table),
+            str(template),
+            "--group-by", "category",
+            "--output", str(tmp_path / "{value}.txt")
+        ]
+    )
+
+    assert result.exit_code == 0
+    assert result.output.split() == [
+        str(tmp_path / "programming.txt"),
+        str(tmp_path / "web.txt")
+    ]
+
+    programming_content = (tmp_path / "programming.txt").read_text()
+
+    assert "category: programming" in programming_content
+    assert "category: web" not in programming_content
+
+
+def test_cli_noparse_group_by_expected_fail(tmp_path):
+    """Batch mode requires an output pattern with unique paths per group."""
+    runner = CliRunner()
+
+    arguments = ["noparse", str(table), str(template)]
+
+    missing_output = runner.invoke(tacl.tacl, [*arguments, "--group-by", "category"])
+    constant_output = runner.invoke(
+        tacl.tacl,
+        [*arguments, "--group-by", "category", "--output", str(tmp_path / "out.txt")]
+    )
+
+    assert missing_output.exit_code != 0
+    assert constant_output.exit_code != 0
+    assert "maps multiple groups" in constant_output.output
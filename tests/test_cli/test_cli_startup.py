@@ -0,0 +1,105 @@
+"""Pytest entry point for tacl CLI startup tests."""
+
+import subprocess
+import sys
+
+import click
+import pytest
+
+from click.testing import CliRunner
+
+from tabulardf import tacl
+from tabulardf.cli.cli_types import LazyChoice
+from tests.data import templates_path, tables_path
+
+
+HEAVY_MODULES = ("pandas", "rdflib", "jinja2")
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "import tabulardf.tacl",
+        "from tabulardf.tacl import tacl; tacl(['--help'], standalone_mode=False)",
+        "from tabulardf.tacl import tacl; tacl(['graph', '--help'], standalone_mode=False)",
+    ]
+)
+def test_tacl_startup_imports(code):
+    """CLI startup must not import heavy dependencies."""
+    check = (
+        "; import sys; "
+        f"print([module for module in {HEAVY_MODULES!r} if module in sys.modules])"
+    )
+
+    result = subprocess.run(
+        [sys.executable, "-c", code + check],
+        check=True,
+        capture_output=True,
+        text=True
+    )
+
+    assert result.stdout.strip().splitlines()[-1] == "[]"
+
+
+def test_lazy_package_attributes():
+    """Converters must be available from the package namespace."""
+    import tabulardf
+    from tabulardf.converters import TemplateConverter
+
+    assert tabulardf.TemplateConverter is TemplateConverter
+    assert "TemplateGraphConverter" in dir(tabulardf)
+
+    with pytest.raises(AttributeError):
+        tabulardf.NoConverter
+
+
+def test_lazy_types_attributes():
+    """CLI types formerly defined in tabulardf_types must still be importable from there."""
+    from tabulardf import tabulardf_types
+    from tabulardf.cli import cli_types
+
+    assert tabulardf_types._ClickPath is cli_types._ClickPath
+    assert tabulardf_types._GraphFormatOptionsChoice is cli_types._GraphFormatOptionsChoice
+    assert "turtle" in tabulardf_types.rdflib_graph_format_options
+    assert "turtle" in tabulardf_types._GraphFormatOptions.__args__
+    assert "_ClickPath" in dir(tabulardf_types)
+
+    with pytest.raises(AttributeError):
+        tabulardf_types.NoType
+
+
+def test_tacl_graph_format_expected_fail():
+    """Formats must still be checked against the rdflib serializer plugins."""
+    runner = CliRunner()
+
+    result = runner.invoke(
+        tacl.tacl,
+        [
+            "graph",
+            str(tables_path / "corpusTable_prep.csv"),
+            str(templates_path / "template_cortab_name_acronym.ttl"),
+            "--format", "no-format"
+        ]
+    )
+
+    assert result.exit_code == 2
+    assert "turtle" in result.output
+
+
+def test_lazy_choice_attributes():
+    """LazyChoice must compute choices on first use and provide all click.Choice attributes."""
+    calls = []
+
+    def get_choices():
+        calls.append(None)
+        return ["ttl", "nt"]
+
+    lazy_choice = LazyChoice(get_choices, case_sensitive=False)
+
+    assert not calls
+    assert all(
+        getattr(lazy_choice, name) == value
+        for name, value in vars(click.Choice(["ttl", "nt"], case_sensitive=False)).items()
+    )
+    assert lazy_choice.convert("TTL", None, None) == "ttl"
+    assert len(calls) == 1
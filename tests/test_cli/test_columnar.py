@@ -0,0 +1,116 @@
+"""Pytest entry point for cli.columnar tests."""
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from tabulardf.cli.columnar import (  # noqa: E402
+    read_feather,
+    read_feather_chunks,
+    read_parquet,
+    read_parquet_chunks
+)
+from tabulardf.cli.dataframe_utils import (  # noqa: E402
+    get_dataframe_chunks_from_file,
+    get_dataframe_from_file,
+    partition_dataframe
+)
+from tests.data import tables_path  # noqa: E402
+
+
+dataframe = pd.DataFrame({
+    "id": range(20),
+    "name": [f"name {i}" for i in range(20)],
+    "value": [i / 2 for i in range(20)],
+})
+
+
+@pytest.fixture(params=["parquet", "feather"])
+def columnar_file(request, tmp_path):
+    """Write dataframe to a Parquet (with small row groups) or Feather file."""
+    path = tmp_path / f"table.{request.param}"
+
+    if request.param == "parquet":
+        dataframe.to_parquet(path, row_group_size=3)
+    else:
+        dataframe.to_feather(path, chunksize=3)
+
+    return path
+
+
+def test_get_dataframe_from_columnar_file(columnar_file):
+    """Columnar files must be read by extension."""
+    pd.testing.assert_frame_equal(get_dataframe_from_file(columnar_file), dataframe)
+
+
+def test_columnar_usecols(columnar_file):
+    """Only columns satisfying usecols must be read."""
+    result = get_dataframe_from_file(columnar_file, usecols=lambda name: name != "value")
+
+    pd.testing.assert_frame_equal(result, dataframe[["id", "name"]])
+
+
+@pytest.mark.parametrize(
+    "column, rows, ids",
+    [
+        ("id", ("4", "15"), [4, 15]),
+        ("id", (4, "not an int"), None),
+        ("name", ("name 7",), [7]),
+        ("value", ("1.5", "2"), [3, 4]),
+    ]
+)
+def test_columnar_partition(columnar_file, column, rows, ids):
+    """Pushed down partitions must select a superset of partition_dataframe."""
+    read = read_parquet if columnar_file.suffix == ".parquet" else read_feather
+    result = read(columnar_file, partition=(column, rows))
+
+    if ids is not None:
+        # cast values are pushed down
+        assert result["id"].tolist() == ids
+    else:
+        # uncastable values disable the pushdown
+        assert len(result) == len(dataframe)
+
+    partition = partition_dataframe(dataframe, column=column, rows=rows)
+
+    pd.testing.assert_frame_equal(
+        partition_dataframe(result, column=column, rows=rows).reset_index(drop=True),
+        partition.reset_index(drop=True)
+    )
+
+
+@pytest.mark.parametrize("chunksize", [1, 4, 7, 100])
+def test_columnar_chunks(columnar_file, chunksize):
+    """Chunks must hold chunksize rows across row groups/record batches."""
+    read_chunks = (
+        read_parquet_chunks
+        if columnar_file.suffix == ".parquet"
+        else read_feather_chunks
+    )
+    chunks = list(read_chunks(columnar_file, chunksize))
+
+    assert [len(chunk) for chunk in chunks[:-1]] == [chunksize] * (len(chunks) - 1)
+    pd.testing.assert_frame_equal(pd.concat(chunks), dataframe)
+
+    partition_chunks = list(
+        get_dataframe_chunks_from_file(columnar_file, chunksize, partition=("id", ("1", "9", "18")))
+    )
+    assert pd.concat(partition_chunks)["id"].tolist() == [1, 9, 18]
+
+
+def test_columnar_cli_input(tmp_path):
+    """A Parquet table must produce the same partition as the equivalent csv table."""
+    csv_dataframe = get_dataframe_from_file(tables_path / "corpusTable_prep.csv")
+    path = tmp_path / "corpusTable_prep.parquet"
+    csv_dataframe.to_parquet(path, row_group_size=10)
+
+    result = get_dataframe_from_file(path, partition=("id", ("14", "15")))
+    # like pd.read_parquet, missing strings are None
+    object_columns = result.select_dtypes(object).columns
+    result[object_columns] = result[object_columns].where(result[object_columns].notna(), float("nan"))
+
+    pd.testing.assert_frame_equal(
+        partition_dataframe(result, column="id", rows=("14", "15")).reset_index(drop=True),
+        partition_dataframe(csv_dataframe, column="id", rows=("14", "15")).reset_index(drop=True)
+    )
@@ -4,17 +4,15 @@ import itertools
 import pytest
 import uuid
 
-from typing import Callable
-
 import pandas as pd
 
 from tabulardf.cli.dataframe_utils import (
     EXTENSION_READ_METHODS,
     UnknownExtensionError,
+    get_dataframe_chunks_from_file,
     get_dataframe_from_file,
+    group_dataframe,
     partition_dataframe,
-    _get_dataframe_try_hard,
-    _get_pandas_read_methods,
     _get_read_method_by_extension,
     )
 
@@ -50,43 +48,12 @@ def test_get_read_method_by_extension_expected_fail():
             )
 
 
-def test_get_pandas_read_methods():
-    pandas_read_methods = _get_pandas_read_methods()
-
-    # check if read methods are being fetched
-    assert pandas_read_methods
-
-    # check keys
-    assert all(
-        lambda x: isinstance(x, str)
-        for read_method
-        in pandas_read_methods
-        )
-
-    # check values
-    assert all(
-        lambda x: isinstance(x, Callable)
-        for read_method
-        in pandas_read_methods
-        )
-
-
-# todo: this needs changing after df/method refactor!
-def test_get_dataframe_try_hard():
-    """..."""
-    test_csv_path = tables_path / "test.csv"
-
-    dataframe = _get_dataframe_try_hard(test_csv_path)
-
-    assert isinstance(dataframe, pd.DataFrame)
-    assert not dataframe.empty
-
-
 def test_get_dataframe_from_file():
     """Test for get_dataframe_fm_file.
 
     Get a dataframe from both a file with a registered extension
-    and an unknown extension (holding the same data).
+    and an unknown extension (holding the same data);
+    for the unknown extension the format is detected from the content.
     """
     test_csv_path = tables_path / "test.csv"
     test_txt_path = tables_path / "test.txt"
@@ -121,3 +88,94 @@ def test_partition_dataframe():
 
     # partitions should be equal, i.e. the difference should be empty
     assert partition_by_column_1.compare(partition_by_column_2).empty
+
+
+def test_get_dataframe_chunks_from_file():
+    """Test for get_dataframe_chunks_from_file.
+
+    Concatenated chunks must hold the same data as the entire dataframe.
+    """
+    for file_name in ("corpusTable_prep.csv", "corpusTable_prep.xlsx", "test.txt"):
+        path = tables_path / file_name
+        dataframe = get_dataframe_from_file(path)
+
+        # a single chunk
+        pd.testing.assert_frame_equal(
+            pd.concat(get_dataframe_chunks_from_file(path, chunksize=1000)),
+            dataframe
+        )
+
+        # multiple chunks; note that dtypes are inferred per chunk
+        chunks = list(get_dataframe_chunks_from_file(path, chunksize=10))
+        chunks_dataframe = pd.concat(chunks)
+
+        assert all(len(chunk) <= 10 for chunk in chunks)
+        assert chunks_dataframe.columns.equals(dataframe.columns)
+        assert chunks_dataframe.index.equals(dataframe.index)
+
+
+def test_get_dataframe_chunks_from_file_excel(tmp_path):
+    """Excel chunks must be parsed like pd.read_excel.
+
+    Duplicate column names are mangled, blank rows are kept, NA strings are NaN
+    and cells beyond the header get 'Unnamed' columns; dtypes are inferred per chunk.
+    """
+    import openpyxl
+
+    path = tmp_path / "table.xlsx"
+    workbook = openpyxl.Workbook()
+
+    rows = [
+        ["a", "a", None, "b"],
+        [1, 2, None, "x"],
+        [],
+        [1.5, "N/A", None, 3],
+        [None, None, None, None, "extra"]
+    ]
+
+    for row in rows:
+        workbook.active.append(row)
+
+    workbook.save(path)
+    dataframe = pd.read_excel(path)
+
+    pd.testing.assert_frame_equal(
+        pd.concat(get_dataframe_chunks_from_file(path, chunksize=10)),
+        dataframe
+    )
+
+    chunks = list(get_dataframe_chunks_from_file(path, chunksize=2))
+
+    assert list(chunks[0].columns) == ["a", "a.1", "Unnamed: 2", "b"]
+    assert chunks[0]["b"].dtype == object
+    assert chunks[1]["b"].dtype == float
+    pd.testing.assert_frame_equal(pd.concat(chunks), dataframe, check_dtype=False)
+
+
+def test_get_dataframe_from_file_usecols():
+    """Test for get_dataframe_from_file with a usecols predicate."""
+    for file_name in ("corpusTable_prep.csv", "corpusTable_prep.xlsx"):
+        path = tables_path / file_name
+
+        def usecols(name):
+            return name in {"id", "corpusAcronym"}
+
+        dataframe = get_dataframe_from_file(path, usecols=usecols)
+        chunks = get_dataframe_chunks_from_file(path, chunksize=10, usecols=usecols)
+
+        assert list(dataframe.columns) == ["id", "corpusAcronym"]
+        pd.testing.assert_frame_equal(pd.concat(chunks), dataframe, check_dtype=False)
+
+
+def test_group_dataframe():
+    """Every group must equal the partition for its value."""
+    dataframe = get_dataframe_from_file(tables_path / "corpusTable_prep.csv")
+    groups = list(group_dataframe(dataframe, "corpusLanguage"))
+
+    assert [value for value, _ in groups] == list(dataframe["corpusLanguage"].dropna().unique())
+
+    for value, group in groups:
+        pd.testing.assert_frame_equal(
+            group,
+            partition_dataframe(dataframe, column="corpusLanguage", rows=[value])
+        )
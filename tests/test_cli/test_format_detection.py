@@ -0,0 +1,68 @@
+"""Pytest entry point for cli.format_detection tests."""
+
+import importlib.util
+import shutil
+
+import pandas as pd
+import pytest
+
+from tabulardf.cli.dataframe_utils import get_dataframe_from_file
+from tabulardf.cli.format_detection import UnknownTableFormatError, detect_table_format
+from tests.data import tables_path
+
+
+requires_pyarrow = pytest.mark.skipif(
+    importlib.util.find_spec("pyarrow") is None,
+    reason="pyarrow is not installed"
+)
+
+dataframe = pd.DataFrame({"id": [1, 2, 3], "name": ["a", "b, c", "d"]})
+
+
+@pytest.mark.parametrize(
+    "write, format_name",
+    [
+        (lambda path: dataframe.to_csv(path, index=False), "csv"),
+        (lambda path: dataframe.to_csv(path, index=False, sep=";"), "csv"),
+        (lambda path: dataframe.to_csv(path, index=False, sep="\t"), "csv"),
+        (lambda path: dataframe.to_json(path, orient="records"), "json"),
+        (lambda path: dataframe.to_json(path, orient="records", lines=True), "jsonl"),
+        pytest.param(lambda path: dataframe.to_parquet(path), "parquet", marks=requires_pyarrow),
+        pytest.param(lambda path: dataframe.to_feather(path), "feather", marks=requires_pyarrow),
+        (lambda path: dataframe.to_excel(path, index=False, engine="openpyxl"), "xlsx"),
+    ]
+)
+def test_detect_table_format(tmp_path, write, format_name):
+    """Formats must be detected from content and read into the same dataframe."""
+    path = tmp_path / "table.unknown"
+
+    if format_name == "xlsx":
+        # to_excel determines the engine by extension
+        write(tmp_path / "table.xlsx")
+        (tmp_path / "table.xlsx").rename(path)
+    else:
+        write(path)
+
+    assert detect_table_format(path).name == format_name
+    pd.testing.assert_frame_equal(get_dataframe_from_file(path), dataframe)
+
+
+def test_detect_table_format_sample(tmp_path):
+    """Detection must work on workbooks in the test data."""
+    path = tmp_path / "table.bin"
+    shutil.copy(tables_path / "corpusTable_prep.xlsx", path)
+
+    assert detect_table_format(path).name == "xlsx"
+
+
+@pytest.mark.parametrize(
+    "content",
+    [b"", b"\x00\x01\x02binary", b"\xff\xfe\xfd not utf-8"]
+)
+def test_detect_table_format_expected_fail(tmp_path, content):
+    """Empty, binary and non-UTF-8 content is not detected as a table."""
+    path = tmp_path / "table.unknown"
+    path.write_bytes(content)
+
+    with pytest.raises(UnknownTableFormatError):
+        detect_table_format(path)
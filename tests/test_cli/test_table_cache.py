@@ -0,0 +1,140 @@
+"""Pytest entry point for cli.table_cache tests."""
+
+import datetime
+import os
+import shutil
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from tabulardf.cli.dataframe_utils import (  # noqa: E402
+    get_dataframe_chunks_from_file,
+    get_dataframe_from_file
+)
+from tabulardf.cli.table_cache import TableCache  # noqa: E402
+from tests.data import tables_path  # noqa: E402
+
+
+@pytest.fixture
+def table(tmp_path):
+    """Copy a workbook to a temporary directory."""
+    table = tmp_path / "corpusTable_prep.xlsx"
+    shutil.copy(tables_path / "corpusTable_prep.xlsx", table)
+
+    return table
+
+
+@pytest.mark.parametrize("format", ["feather", "parquet"])
+def test_table_cache(tmp_path, table, format):
+    """Cached tables must equal parsed tables and be read without parsing."""
+    table_cache = TableCache(tmp_path / "cache", format=format)
+    dataframe = get_dataframe_from_file(table)
+
+    calls = []
+
+    def read_method():
+        calls.append(table)
+        return get_dataframe_from_file(table)
+
+    miss = table_cache.read(table, read_method)
+    hit = table_cache.read(table, read_method)
+
+    assert len(calls) == 1
+    pd.testing.assert_frame_equal(miss, dataframe)
+    pd.testing.assert_frame_equal(hit, dataframe)
+
+
+def test_table_cache_usecols_chunks(tmp_path, table):
+    """Column selection and chunking must work on cached tables."""
+    table_cache = TableCache(tmp_path / "cache")
+
+    def usecols(name):
+        return name in {"id", "corpusAcronym"}
+
+    dataframe = get_dataframe_from_file(table, usecols=usecols)
+    cached = get_dataframe_from_file(table, usecols=usecols, table_cache=table_cache)
+    chunks = list(
+        get_dataframe_chunks_from_file(table, chunksize=10, usecols=usecols, table_cache=table_cache)
+    )
+
+    pd.testing.assert_frame_equal(cached, dataframe)
+    assert all(len(chunk) <= 10 for chunk in chunks)
+    pd.testing.assert_frame_equal(pd.concat(chunks), dataframe)
+
+
+def test_table_cache_invalidation(tmp_path):
+    """Changed tables must be parsed anew."""
+    table_cache = TableCache(tmp_path / "cache")
+    table = tmp_path / "table.csv"
+
+    table.write_text("x\n1\n")
+    assert get_dataframe_from_file(table, table_cache=table_cache)["x"].tolist() == [1]
+
+    table.write_text("x\n2\n")
+    assert get_dataframe_from_file(table, table_cache=table_cache)["x"].tolist() == [2]
+
+
+def test_table_cache_eviction(tmp_path):
+    """Least recently used entries must be evicted beyond max_size."""
+    table_cache = TableCache(tmp_path / "cache", max_size=1)
+    tables = [tmp_path / f"table_{i}.csv" for i in range(3)]
+
+    for i, table in enumerate(tables):
+        table.write_text(f"x\n{i}\n")
+        get_dataframe_from_file(table, table_cache=table_cache)
+
+    entries = list((tmp_path / "cache").iterdir())
+
+    # only the most recent entry is kept
+    assert entries == [table_cache.get_path(table_cache.get_key(tables[-1]))]
+
+
+def test_table_cache_mixed_types(tmp_path):
+    """Columns of mixed types must be restored as is."""
+    table_cache = TableCache(tmp_path / "cache")
+    table = tmp_path / "table.csv"
+    table.touch()
+
+    values = [1, "a", float("nan"), 1.5, True, datetime.datetime(2020, 1, 2, 3, 4), datetime.time(5, 6)]
+    dataframe = pd.DataFrame({"x": values, "y": ["a", None, "b"] + 4 * ["c"]})
+
+    table_cache.read(table, lambda: dataframe)
+    result = table_cache.read(table, lambda: dataframe)
+    restored = result["x"].tolist()
+
+    assert restored[:2] + restored[3:] == values[:2] + values[3:]
+    assert [type(value) for value in restored] == [type(value) for value in values]
+    assert result["x"].isna().tolist() == [False, False, True, False, False, False, False]
+    # missing values are NaN like with the pandas read methods
+    assert result["y"].tolist()[:3:2] == ["a", "b"]
+    assert pd.isna(result["y"][1]) and result["y"][1] is not None
+
+
+def test_table_cache_uncacheable(tmp_path):
+    """Dataframes that cannot be converted to Arrow are returned uncached."""
+    table_cache = TableCache(tmp_path / "cache")
+    table = tmp_path / "table.csv"
+    table.touch()
+
+    dataframe = pd.DataFrame({"x": [1, lambda: None], "y": [1, 2]})
+    result = table_cache.read(table, lambda: dataframe, usecols=lambda name: name == "y")
+
+    pd.testing.assert_frame_equal(result, dataframe[["y"]])
+    assert not os.listdir(tmp_path / "cache")
+
+
+def test_table_cache_non_string_column_names(tmp_path):
+    """Dataframes with non-string column names are returned uncached with their names intact."""
+    table_cache = TableCache(tmp_path / "cache")
+    table = tmp_path / "table.csv"
+    table.touch()
+
+    dataframe = pd.DataFrame({1: ["a", "b"], "y": [1, 2]})
+
+    for _ in range(2):
+        result = table_cache.read(table, lambda: dataframe)
+        assert result.columns.tolist() == [1, "y"]
+
+    assert not os.listdir(tmp_path / "cache")
@@ -0,0 +1,42 @@
+"""Pytest entry point for tabulardf.bnodes tests."""
+
+from rdflib import BNode, Literal, URIRef
+
+from tabulardf.bnodes import BNodeRenamer
+from tabulardf.parallel import imap_ordered
+
+
+renamer = BNodeRenamer()
+
+triples = [
+    (BNode("x"), URIRef("http://example.org/p"), BNode("y")),
+    (BNode("y"), URIRef("http://example.org/p"), Literal("z")),
+]
+
+
+def _rename(_) -> list:
+    """Rename triples with the module level renamer (e.g. in a worker process)."""
+    return list(renamer.rename(triples))
+
+
+def test_bnode_renamer_scopes():
+    """Blank nodes must be renamed consistently per call and distinctly across calls."""
+    first, second = _rename(None), _rename(None)
+
+    assert first[0][2] == first[1][0]
+    assert first[0][0] != first[0][2]
+    assert {first[0][0], first[0][2]}.isdisjoint({second[0][0], second[0][2]})
+    assert first[1][2] == Literal("z")
+
+
+def test_bnode_renamer_processes():
+    """Renamers copied to worker processes must not produce colliding blank nodes."""
+    renamed = [_rename(None), *imap_ordered(_rename, range(4), workers=2)]
+
+    bnodes = [
+        term for subgraph in renamed
+        for triple in subgraph for term in triple
+        if isinstance(term, BNode)
+    ]
+
+    assert len(set(bnodes)) == 2 * len(renamed)
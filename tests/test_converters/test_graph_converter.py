@@ -0,0 +1,17 @@
+"""Pytest entry point for tabulardf.converters._GraphConverter tests."""
+
+import pytest
+
+from rdflib import Graph
+
+from tabulardf.converters import _GraphConverter
+
+
+def test_graph_converter_subclass_abstract_methods():
+    """_GraphConverter subclasses must implement _generate_triples."""
+    class IncompleteGraphConverter(_GraphConverter):
+        def to_graph(self):
+            return Graph()
+
+    with pytest.raises(TypeError, match="_generate_triples"):
+        IncompleteGraphConverter()
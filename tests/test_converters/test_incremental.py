@@ -0,0 +1,103 @@
+"""Pytest entry point for tabulardf.incremental tests."""
+
+import io
+
+import pandas as pd
+import pytest
+
+from jinja2 import Template
+from rdflib import Graph, URIRef
+from rdflib.compare import isomorphic
+
+from tabulardf import TemplateConverter, TemplateGraphConverter
+from tabulardf.incremental import IncrementalCache, IncrementalKeyError
+
+
+template = Template(
+    "@prefix ex: <http://example.org/> .\n"
+    "ex:{{ row_data['id'] }} ex:value {{ row_data['value'] }} ."
+)
+
+dataframe = pd.DataFrame({"id": ["a", "b", "c"], "value": [1, 2, 3]})
+changed_dataframe = pd.DataFrame({"id": ["a", "c", "d"], "value": [1, 30, 4]})
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Get an IncrementalCache keyed by the id column."""
+    return IncrementalCache(tmp_path / "incremental.sqlite", key_column="id")
+
+
+def _stats(converter):
+    stats = converter.incremental_stats
+    return stats.unchanged, stats.changed, stats.added, stats.deleted
+
+
+def test_incremental_render_by_row(cache):
+    """Only new and changed rows must be rendered; renderings must equal a full conversion."""
+    converter = TemplateConverter(dataframe=dataframe, template=template, incremental=cache)
+    assert list(converter.render_by_row()) == list(
+        TemplateConverter(dataframe=dataframe, template=template).render_by_row()
+    )
+    assert _stats(converter) == (0, 0, 3, 0)
+
+    converter = TemplateConverter(dataframe=dataframe, template=template, incremental=cache)
+    list(converter.render_by_row())
+    assert _stats(converter) == (3, 0, 0, 0)
+
+    converter = TemplateConverter(dataframe=changed_dataframe, template=template, incremental=cache)
+    assert list(converter.render_by_row()) == list(
+        TemplateConverter(dataframe=changed_dataframe, template=template).render_by_row()
+    )
+    assert _stats(converter) == (1, 1, 1, 1)
+
+
+def test_incremental_template_change(cache):
+    """Changing the template must invalidate all cached rows."""
+    TemplateConverter(dataframe=dataframe, template=template, incremental=cache).render_by_row()
+
+    other_template = Template("{{ row_data['id'] }}")
+    converter = TemplateConverter(dataframe=dataframe, template=other_template, incremental=cache)
+
+    assert list(converter.render_by_row()) == ["a", "b", "c"]
+    assert _stats(converter) == (0, 3, 0, 0)
+
+
+def test_incremental_to_graph(cache):
+    """Graphs must be isomorphic to a full conversion and triples of deleted rows retracted."""
+    graph = TemplateGraphConverter(
+        dataframe=dataframe, template=template, incremental=cache
+    ).to_graph()
+
+    converter = TemplateGraphConverter(
+        dataframe=changed_dataframe, template=template, incremental=cache, graph=graph
+    )
+    converter.to_graph()
+
+    assert _stats(converter) == (1, 1, 1, 1)
+    assert isomorphic(
+        converter.graph,
+        TemplateGraphConverter(dataframe=changed_dataframe, template=template).to_graph()
+    )
+    assert (URIRef("http://example.org/b"), None, None) not in converter.graph
+    assert ("ex", URIRef("http://example.org/")) in set(converter.graph.namespaces())
+
+    stream = io.StringIO()
+    TemplateGraphConverter(
+        dataframe=changed_dataframe, template=template, incremental=cache
+    ).serialize_to_stream(stream)
+
+    stream_graph = Graph().parse(data=stream.getvalue(), format="nt")
+    assert isomorphic(stream_graph, converter.graph)
+
+
+def test_incremental_key_error(cache):
+    """Keys must identify rows uniquely."""
+    converter = TemplateConverter(
+        dataframe=pd.DataFrame({"id": ["a", "a"], "value": [1, 2]}),
+        template=template,
+        incremental=cache
+    )
+
+    with pytest.raises(IncrementalKeyError):
+        converter.render_by_row()
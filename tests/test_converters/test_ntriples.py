@@ -0,0 +1,56 @@
+"""Pytest entry point for tabulardf.ntriples tests."""
+
+import pytest
+
+from rdflib import Graph
+from rdflib.compare import isomorphic
+
+from tabulardf.ntriples import NTriplesParseError, is_ntriples_format, parse_ntriples
+
+
+data = r"""
+# comment
+<http://example.org/s> <http://example.org/p> "a\"b\né\U0001F600" .
+<http://example.org/s> <http://example.org/p> "x"@en-US .
+<http://example.org/s>	<http://example.org/p> "1"^^<http://www.w3.org/2001/XMLSchema#integer>.
+_:b1 <http://example.org/p> _:b2 . # trailing comment
+_:b2 <http://example.org/p> <http://example.org/é> .
+"""
+
+
+def test_parse_ntriples():
+    """Parsed triples must equal the triples of rdflib's N-Triples parser."""
+    graph = Graph()
+
+    for triple in parse_ntriples(data):
+        graph.add(triple)
+
+    assert isomorphic(graph, Graph().parse(data=data, format="nt"))
+
+
+def test_parse_ntriples_bnode_scope():
+    """Blank nodes must be scoped to a document."""
+    document = "_:b <http://example.org/p> <http://example.org/o> ."
+
+    assert parse_ntriples(document)[0][0] != parse_ntriples(document)[0][0]
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        "<s> <p> <o> .",
+        '<http://example.org/s> <http://example.org/p> "o"',
+        r'<http://example.org/s> <http://example.org/p> "\q" .',
+        "<http://example.org/s> a <http://example.org/o> ."
+    ]
+)
+def test_parse_ntriples_expected_fail(line):
+    """Invalid lines must raise an NTriplesParseError."""
+    with pytest.raises(NTriplesParseError):
+        parse_ntriples(line)
+
+
+def test_is_ntriples_format():
+    """N-Triples format names must be recognized."""
+    assert is_ntriples_format("nt") and is_ntriples_format("application/n-triples")
+    assert not is_ntriples_format("ttl") and not is_ntriples_format("nquads")
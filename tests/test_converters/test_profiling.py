@@ -0,0 +1,118 @@
+"""Pytest entry point for tabulardf.profiling tests."""
+
+import pandas as pd
+
+from jinja2 import Template
+from rdflib import Graph, Literal, Namespace, URIRef
+from rdflib.namespace import RDF, RDFS
+
+from tabulardf import FieldGraphConverter, RowGraphConverter, TemplateGraphConverter
+from tabulardf.converters import _add_triples, _GraphConverter
+from tabulardf.profiling import NULL_PROFILER, Profiler
+
+
+EX = Namespace("http://example.org/")
+
+dataframe = pd.DataFrame({"id": ["a", "b", "c"], "value": [1, 2, 3]})
+
+
+def test_profiler_records_calls():
+    """Stages must record call counts, wall times and the slowest calls."""
+    profiler = Profiler(slowest=2)
+
+    timed = profiler.timed("double", lambda x: x * 2)
+    assert [timed(x) for x in range(4)] == [0, 2, 4, 6]
+    assert list(profiler.iterate("items", "abc")) == ["a", "b", "c"]
+
+    with profiler.stage("block"):
+        pass
+
+    assert {stage: stats.calls for stage, stats in profiler.stages.items()} == {
+        "double": 4, "items": 3, "block": 1
+    }
+
+    slowest = profiler.stages["double"].get_slowest()
+    assert len(slowest) == 2
+    assert slowest[0][0] >= slowest[1][0]
+    assert {call for _, call in slowest} <= set(range(4))
+
+    assert profiler.to_dict()["double"]["calls"] == 4
+    assert "double" in profiler.report()
+
+
+def test_null_profiler_passthrough():
+    """A NullProfiler must not wrap callables or iterables and record nothing."""
+    function = str.upper
+    iterable = [1, 2]
+
+    assert NULL_PROFILER.timed("stage", function) is function
+    assert NULL_PROFILER.iterate("stage", iterable) is iterable
+
+    with NULL_PROFILER.stage("stage"):
+        pass
+
+    assert NULL_PROFILER.stages == {}
+
+
+def test_template_graph_converter_profiling():
+    """Rows, renderings and parses must be profiled per row."""
+    profiler = Profiler()
+    template = Template(
+        "<http://example.org/{{ row_data['id'] }}> "
+        "<http://example.org/value> {{ row_data['value'] }} ."
+    )
+
+    converter = TemplateGraphConverter(
+        dataframe=dataframe,
+        template=template,
+        profiler=profiler
+    )
+    converter.serialize(format="nt")
+
+    calls = {stage: stats.calls for stage, stats in profiler.stages.items()}
+    assert calls == {"rows": 3, "render": 3, "parse": 3, "to_graph": 1, "serialize": 1}
+
+
+def test_callable_converters_profiling():
+    """Rules and merging must be profiled for RowGraphConverter and FieldGraphConverter."""
+    row_profiler, field_profiler = Profiler(), Profiler()
+
+    row_graph = RowGraphConverter(
+        dataframe,
+        row_rule=lambda row: (EX[row["id"]], EX.value, Literal(row["value"])),
+        profiler=row_profiler
+    ).to_graph()
+
+    field_graph = FieldGraphConverter(
+        dataframe,
+        subject_column="id",
+        subject_rule=EX,
+        column_rules={"value": lambda s, o, store: (s, EX.value, Literal(o))},
+        profiler=field_profiler
+    ).to_graph()
+
+    assert len(row_graph) == len(field_graph) == 3
+    assert row_profiler.stages["rule"].calls == 3
+    assert field_profiler.stages["rule"].calls == 3
+    assert {"rows", "merge", "to_graph"} <= set(row_profiler.stages)
+    assert {"rows", "subjects", "merge", "to_graph"} <= set(field_profiler.stages)
+
+
+def test_graph_converter_subclass_default_profiler():
+    """_GraphConverter subclasses that do not set a profiler must use NULL_PROFILER."""
+    class ListGraphConverter(_GraphConverter):
+        def __init__(self, triples):
+            self._triples = triples
+            self._graph = Graph()
+
+        def _generate_triples(self):
+            yield from self._triples
+
+        def to_graph(self):
+            return _add_triples(self._graph, self._generate_triples())
+
+    triple = (URIRef("https://example.org/s"), RDF.type, RDFS.Resource)
+    converter = ListGraphConverter([triple])
+
+    assert converter._profiler is NULL_PROFILER
+    assert triple in Graph().parse(data=converter.serialize(format="nt"), format="nt")
@@ -0,0 +1,50 @@
+"""Pytest entry point for tabulardf.rows tests."""
+
+import pandas as pd
+import pytest
+
+from tabulardf.rows import iter_batches, iter_row_batches, iter_row_dicts
+from tests.data import tables
+
+
+def test_iter_row_dicts_iterrows_equivalence():
+    """Row dicts must equal the dicts obtained via DataFrame.iterrows."""
+    dataframe = tables.bookstore_df
+
+    iterrows_dicts = [row.to_dict() for _, row in dataframe.iterrows()]
+
+    assert list(iter_row_dicts(dataframe)) == iterrows_dicts
+    assert list(iter_row_dicts(dataframe, batch_size=1)) == iterrows_dicts
+
+
+def test_iter_row_dicts_preserves_dtypes():
+    """Integer columns must not be coerced to float in mixed dataframes."""
+    dataframe = pd.DataFrame({"int": [1, 2], "float": [0.5, 1.5]})
+
+    row = next(iter_row_dicts(dataframe))
+
+    assert isinstance(row["int"], int)
+    assert isinstance(row["float"], float)
+
+
+def test_iter_row_batches():
+    """Batches hold at most batch_size rows and cover the whole dataframe."""
+    dataframe = pd.DataFrame({"x": range(5)})
+
+    batches = list(iter_row_batches(dataframe, batch_size=2))
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert [row["x"] for batch in batches for row in batch] == list(range(5))
+
+
+def test_iter_row_dicts_no_columns():
+    """A dataframe without columns yields one empty dict per row."""
+    dataframe = pd.DataFrame(index=range(3))
+
+    assert list(iter_row_dicts(dataframe)) == [{}, {}, {}]
+
+
+def test_iter_batches_expected_fail():
+    """Non-positive batch sizes are rejected."""
+    with pytest.raises(ValueError):
+        list(iter_batches(pd.DataFrame(), batch_size=0))
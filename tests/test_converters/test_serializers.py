@@ -0,0 +1,100 @@
+"""Pytest entry point for tabulardf.serializers tests."""
+
+import gzip
+import io
+
+import pytest
+
+from rdflib import BNode, Graph, Literal, Namespace, URIRef
+from rdflib.compare import isomorphic
+from rdflib.namespace import RDF, XSD
+
+from tabulardf import TemplateGraphConverter
+from tabulardf.serializers import (
+    UnsupportedSerializationFormatError,
+    serialize_graph,
+    write_flat_turtle
+)
+from tests.data import tables, templates_path
+
+
+EX = Namespace("http://example.org/")
+
+
+def get_graph() -> Graph:
+    """Get a graph with literals, blank nodes and IRIs that cannot be abbreviated."""
+    graph = Graph()
+    graph.bind("ex", EX)
+    bnode = BNode()
+
+    for triple in [
+            (EX.s, RDF.type, EX.C),
+            (EX.s, EX.p, Literal('a "quoted"\nmulti-line \\ literal é')),
+            (EX.s, EX.p, Literal("x", lang="en-US")),
+            (EX.s, EX.p, Literal(1)),
+            (EX["a.b"], EX.p, bnode),
+            (bnode, EX.p, Literal("2020-01-01", datatype=XSD.date)),
+            (URIRef("http://example.org/x/"), EX["1a"], Literal("", datatype=EX["dt-1"]))
+    ]:
+        graph.add(triple)
+
+    return graph
+
+
+@pytest.mark.parametrize(
+    "format, parse_format",
+    [("tabulardf-nt", "nt"), ("tabulardf-ttl", "turtle")]
+)
+def test_serializer_plugins(format, parse_format):
+    """Serializations must produce the same triples as the graph."""
+    graph = get_graph()
+    serialization = graph.serialize(format=format)
+
+    assert isomorphic(graph, Graph().parse(data=serialization, format=parse_format))
+
+
+def test_flat_turtle_prefixes():
+    """Only used prefixes must be declared, subjects must be grouped."""
+    graph = get_graph()
+    stream = io.BytesIO()
+
+    write_flat_turtle(graph, stream, namespaces=graph.namespaces())
+    serialization = stream.getvalue().decode("utf-8")
+
+    assert "@prefix ex: <http://example.org/> ." in serialization
+    assert "@prefix owl:" not in serialization
+
+
+@pytest.mark.parametrize("format", ["nt", "ttl"])
+def test_serialize_graph_gzip(tmp_path, format):
+    """Paths ending with '.gz' must be gzip-compressed."""
+    graph = get_graph()
+    path = tmp_path / f"graph.{format}.gz"
+
+    serialize_graph(graph, path, format=format)
+
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        parsed = Graph().parse(data=f.read(), format="nt" if format == "nt" else "turtle")
+
+    assert isomorphic(graph, parsed)
+
+
+def test_serialize_graph_expected_fail():
+    """Only N-Triples and Turtle are available."""
+    with pytest.raises(UnsupportedSerializationFormatError):
+        serialize_graph(get_graph(), io.BytesIO(), format="xml")
+
+
+def test_converter_dump(tmp_path):
+    """Test for _GraphConverter.dump."""
+    converter = TemplateGraphConverter(
+        dataframe=tables.cortab_partial_df,
+        template=templates_path / "template_cortab_name_acronym.ttl"
+    )
+
+    converter.dump(tmp_path / "graph.ttl", format="ttl")
+
+    assert isomorphic(
+        converter.graph,
+        Graph().parse(tmp_path / "graph.ttl", format="turtle")
+    )
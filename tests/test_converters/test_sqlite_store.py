@@ -0,0 +1,98 @@
+"""Pytest entry point for tabulardf.sqlite_store tests."""
+
+import io
+
+from rdflib import BNode, Graph, Literal, Namespace
+from rdflib.compare import isomorphic
+from rdflib.namespace import RDF, XSD
+
+from tabulardf import TemplateGraphConverter
+from tabulardf.sqlite_store import get_sqlite_graph
+from tests.data import tables, templates_path
+
+
+EX = Namespace("http://example.org/")
+
+
+def get_triples() -> list:
+    """Get triples with IRIs, blank nodes and escaped, tagged and typed literals."""
+    bnode = BNode()
+
+    return [
+        (EX.s, RDF.type, EX.C),
+        (EX.s, EX.p, Literal('a "quoted"\nmulti-line \\ literal é')),
+        (EX.s, EX.p, Literal("x", lang="en-US")),
+        (EX.s, EX.p, Literal(1)),
+        (EX.s, EX.p, bnode),
+        (bnode, EX.p, Literal("2020-01-01", datatype=XSD.date)),
+    ]
+
+
+def test_sqlite_graph_round_trip():
+    """Triples must be retrieved from the store as they were added."""
+    graph, target_graph = get_sqlite_graph(), Graph()
+
+    for triple in get_triples():
+        graph.add(triple)
+        target_graph.add(triple)
+
+    assert len(graph) == len(target_graph)
+    assert set(graph) == set(target_graph)
+    assert (EX.s, EX.p, Literal(1)) in graph
+    assert set(graph.objects(EX.s, EX.p)) == set(target_graph.objects(EX.s, EX.p))
+
+
+def test_sqlite_graph_remove():
+    """Triples matching a pattern must be removed; duplicates must be ignored."""
+    graph = get_sqlite_graph()
+    graph.addN((*triple, graph) for triple in get_triples() * 2)
+
+    graph.remove((EX.s, EX.p, None))
+
+    assert len(graph) == 2
+
+
+def test_sqlite_graph_persistence(tmp_path):
+    """Triples must persist in the database file across graphs."""
+    graph = get_sqlite_graph(tmp_path / "graph.sqlite")
+
+    for triple in get_triples():
+        graph.add(triple)
+
+    graph.close()
+
+    assert len(get_sqlite_graph(tmp_path / "graph.sqlite")) == len(get_triples())
+
+
+def test_sqlite_graph_converter():
+    """Converters must produce the same graph with an SQLite-backed graph component."""
+    kwargs = {
+        "dataframe": tables.cortab_partial_df,
+        "template": templates_path / "template_cortab_name_acronym.ttl"
+    }
+    converter = TemplateGraphConverter(**kwargs, graph=get_sqlite_graph())
+    target_graph = TemplateGraphConverter(**kwargs).to_graph()
+
+    assert isomorphic(converter.to_graph(), target_graph)
+
+    stream = io.BytesIO()
+    converter.dump(stream, format="nt")
+
+    assert isomorphic(Graph().parse(data=stream.getvalue(), format="nt"), target_graph)
+
+
+def test_sqlite_graph_batched_add(monkeypatch):
+    """Triples added one by one (e.g. by rdflib parsers) must be inserted in batches."""
+    monkeypatch.setattr("tabulardf.sqlite_store.DEFAULT_INSERT_BATCH_SIZE", 4)
+    graph = get_sqlite_graph()
+    data = Graph()
+
+    for triple in get_triples():
+        data.add(triple)
+
+    graph.parse(data=data.serialize(format="nt"), format="nt")
+
+    # one full batch inserted, the rest buffered until the next read
+    assert len(graph.store._pending) == 2
+    assert len(graph) == len(get_triples())
+    assert not graph.store._pending
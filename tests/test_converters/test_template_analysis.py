@@ -0,0 +1,67 @@
+"""Pytest entry point for tabulardf.template_analysis tests."""
+
+import pytest
+
+from jinja2 import Template
+
+from tabulardf import TemplateConverter
+from tabulardf.template_analysis import get_referenced_columns
+from tests.data import tables, templates_path
+
+
+@pytest.mark.parametrize(
+    "template_name, columns",
+    [
+        ("books.j2", {"category", "title", "author", "year", "price"}),
+        ("books_row.j2", {"category", "title", "author", "year", "price"}),
+        ("template_cortab_name_acronym.ttl", {"corpusAcronym", "corpusName"}),
+    ]
+)
+def test_get_referenced_columns(template_name, columns):
+    """Referenced columns of file templates (table and row strategy)."""
+    template = TemplateConverter._get_jinja_template_from_path(
+        templates_path / template_name
+    )
+
+    assert get_referenced_columns(template) == columns
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        "{{ row_data[key] }}",
+        "{{ row_data.items() }}",
+        "{{ row_data.get('x') }}",
+        "{{ utils.f(row_data) }}",
+        "{{ table_data | list }}",
+        "{% for a, b in table_data %}{{ a }}{% endfor %}",
+        "{% set row_data = {} %}",
+        "{% include 'other.j2' %}",
+    ]
+)
+def test_get_referenced_columns_dynamic(source):
+    """Dynamic row data access must fall back to all columns."""
+    assert get_referenced_columns(source) is None
+
+
+def test_get_referenced_columns_no_source():
+    """Templates without an available source must fall back to all columns."""
+    assert get_referenced_columns(Template("{{ row_data['x'] }}")) is None
+
+
+def test_template_converter_projection():
+    """TemplateConverter must only convert referenced columns to row data."""
+    dataframe = tables.bookstore_df.assign(unused=range(len(tables.bookstore_df)))
+
+    converter = TemplateConverter(
+        dataframe=dataframe,
+        template=templates_path / "books_row.j2"
+    )
+    unprojected_converter = TemplateConverter(
+        dataframe=dataframe,
+        template=templates_path / "books_row.j2",
+        project_columns=False
+    )
+
+    assert "unused" not in converter._project_dataframe(dataframe).columns
+    assert list(converter.render_by_row()) == list(unprojected_converter.render_by_row())
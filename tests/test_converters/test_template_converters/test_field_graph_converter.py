@@ -1,10 +1,16 @@
 """Pytest entry point for FieldGraphConverter tests."""
 
+from itertools import count
+
+import pandas as pd
+import pytest
+
 from tabulardf import FieldGraphConverter
+from tabulardf.rules import TermCache, column_rule, literal_rule, uri_rule
 
-from rdflib import Graph, Literal, URIRef, Namespace
+from rdflib import BNode, Dataset, Graph, Literal, URIRef, Namespace
 from rdflib.compare import isomorphic
-from rdflib.namespace import RDF
+from rdflib.namespace import RDF, RDFS, XSD
 
 from tests.data import (
     tables,
@@ -111,3 +117,347 @@ def test_row_graph_converter():
     target_graph = Graph().parse(targets_graphs_path / "cortab_name_acronym.ttl")
 
     assert isomorphic(generated_graph, target_graph)
+
+
+def test_field_graph_converter_serialize_to_stream(tmp_path):
+    """Test for FieldGraphConverter.serialize_to_stream.
+
+    Stream N-Quads into a named graph and check for graph isomorphism against a target graph.
+    """
+    graph_name = URIRef("https://clscor.io/graph/cortab")
+
+    converter = FieldGraphConverter(
+        dataframe=tables.cortab_partial_df,
+        subject_column="corpusAcronym",
+        column_rules={
+            "corpusName": corpus_name_rule
+        },
+        graph=Graph(identifier=graph_name)
+    )
+
+    output_path = tmp_path / "cortab.nq"
+    converter.serialize_to_stream(output_path, format="nquads")
+
+    dataset = Dataset().parse(output_path, format="nquads")
+    target_graph = Graph().parse(targets_graphs_path / "cortab_name_acronym.ttl")
+
+    assert isomorphic(dataset.graph(graph_name), target_graph)
+
+
+def test_field_graph_converter_triple_rules():
+    """Test for the FieldGraphConverter class with triple rules.
+
+    Rules return a single triple, a list of triples or None.
+    """
+    def acronym_rule(subject_field, object_field, store):
+        return (
+            URIRef(f"https://{subject_field.lower()}.clscor.io/entity/appellation/2"),
+            RDF.value,
+            Literal(object_field)
+        )
+
+    def name_rule(subject_field, object_field, store):
+        return list(corpus_name_rule(subject_field, object_field, store))
+
+    converter = FieldGraphConverter(
+        dataframe=tables.cortab_partial_df.assign(missing=None),
+        subject_column="corpusAcronym",
+        column_rules={
+            "corpusAcronym": acronym_rule,
+            "corpusName": name_rule,
+            "missing": lambda subject_field, object_field, store: None
+        }
+    )
+
+    generated_graph = converter.to_graph()
+    target_graph = Graph().parse(targets_graphs_path / "cortab_name_acronym.ttl")
+
+    assert isomorphic(generated_graph, target_graph)
+
+
+def test_field_graph_converter_column_rules():
+    """Test for the FieldGraphConverter class with vectorized column rules.
+
+    Vectorized rules must produce the same graph as equivalent per-field rules;
+    missing values are skipped.
+    """
+    dataframe = pd.DataFrame(
+        data={
+            "id": ["a", "b", "c"],
+            "year": [2022, None, 2003],
+            "category": ["web", "web", None]
+        }
+    )
+
+    ex = Namespace("https://example.org/")
+
+    def year_rule(subject_field, object_field, store):
+        if not pd.isna(object_field):
+            return (subject_field, ex.year, Literal(object_field, datatype=XSD.decimal))
+
+    def category_rule(subject_field, object_field, store):
+        if not pd.isna(object_field):
+            return (subject_field, ex.category, ex[f"category/{object_field}"])
+
+    field_converter = FieldGraphConverter(
+        dataframe=dataframe,
+        subject_column="id",
+        subject_rule=ex,
+        column_rules={
+            "year": year_rule,
+            "category": category_rule
+        }
+    )
+
+    column_converter = FieldGraphConverter(
+        dataframe=dataframe,
+        subject_column="id",
+        subject_rule=ex,
+        column_rules={
+            "year": literal_rule(ex.year, datatype=XSD.decimal),
+            "category": uri_rule(ex.category, ex["category/"])
+        }
+    )
+
+    field_graph = field_converter.to_graph()
+    column_graph = column_converter.to_graph()
+
+    assert len(column_graph) == 4
+    assert isomorphic(field_graph, column_graph)
+
+
+def test_uri_rule_local_names():
+    """Test for rules.uri_rule.
+
+    Missing values are skipped, integral floats are converted to int
+    and invalid IRI characters are percent-encoded.
+    """
+    dataframe = pd.DataFrame(
+        data={
+            "id": ["a", "b", "c", "d"],
+            "number": [1, None, 2.5, 3],
+            "category": ["web site", "<web>", None, "web"]
+        }
+    )
+
+    ex = Namespace("https://example.org/")
+
+    converter = FieldGraphConverter(
+        dataframe=dataframe,
+        subject_column="id",
+        subject_rule=ex,
+        column_rules={
+            "number": uri_rule(ex.number, ex),
+            "category": uri_rule(ex.category, ex)
+        }
+    )
+
+    graph = converter.to_graph()
+
+    assert set(graph.objects(predicate=ex.number)) == {ex["1"], ex["2.5"], ex["3"]}
+    assert set(graph.objects(predicate=ex.category)) == {ex["web%20site"], ex["%3Cweb%3E"], ex.web}
+
+
+def test_field_graph_converter_custom_column_rule():
+    """Test for the FieldGraphConverter class with a custom column rule."""
+    @column_rule
+    def name_rule(subjects, objects, store):
+        for subject, _object in zip(subjects, objects.str.upper()):
+            yield (URIRef(f"https://{subject}.clscor.io"), RDF.value, Literal(_object))
+
+    converter = FieldGraphConverter(
+        dataframe=tables.cortab_partial_df,
+        subject_column="corpusAcronym",
+        subject_rule=str.lower,
+        column_rules={
+            "corpusName": name_rule
+        }
+    )
+
+    graph = converter.to_graph()
+
+    assert (
+        URIRef("https://rem.clscor.io"),
+        RDF.value,
+        Literal("REFERENCE CORPUS MIDDLE HIGH GERMAN")
+    ) in graph
+
+
+def test_field_graph_converter_cache_info():
+    """Test for FieldGraphConverter.cache_info.
+
+    Repeated subject and object values must be served from the caches.
+    """
+    dataframe = pd.DataFrame(
+        data={
+            "id": ["a", "b", "a", "b"],
+            "category": ["web", "web", "web", "print"]
+        }
+    )
+
+    ex = Namespace("https://example.org/")
+
+    converter = FieldGraphConverter(
+        dataframe=dataframe,
+        subject_column="id",
+        subject_rule=ex,
+        column_rules={
+            "category": literal_rule(ex.category)
+        },
+        subject_cache_size=2 ** 16
+    )
+
+    graph = converter.to_graph()
+    cache_info = converter.cache_info()
+
+    assert len(graph) == 3
+    assert (cache_info["subjects"].hits, cache_info["subjects"].misses) == (2, 2)
+    assert cache_info["category"].misses == 2
+
+
+def test_field_graph_converter_defined_namespace_subject_rule():
+    """DefinedNamespaces (which are callable classes) must be subscripted as subject_rule."""
+    dataframe = pd.DataFrame(data={"id": ["type", "value"], "label": ["a", "b"]})
+
+    for subject_cache_size in (0, 2 ** 16):
+        converter = FieldGraphConverter(
+            dataframe=dataframe,
+            subject_column="id",
+            subject_rule=RDF,
+            column_rules={"label": literal_rule(RDFS.label)},
+            subject_cache_size=subject_cache_size
+        )
+
+        assert set(converter.to_graph().subjects()) == {RDF.type, RDF.value}
+
+
+def test_field_graph_converter_impure_subject_rule():
+    """Subject rules must be called per row by default, e.g. for minting blank nodes."""
+    converter = FieldGraphConverter(
+        dataframe=pd.DataFrame(data={"id": ["a", "a"], "value": [1, 2]}),
+        subject_column="id",
+        subject_rule=lambda value: BNode(),
+        column_rules={
+            "value": lambda subject, _object, store: (subject, RDF.value, Literal(_object))
+        }
+    )
+
+    assert len(set(converter.to_graph().subjects())) == 2
+
+
+def test_field_graph_converter_invalid_rule_result():
+    """Rule results other than graphs, triples, iterables of triples or None must raise a TypeError."""
+    converter = FieldGraphConverter(
+        dataframe=pd.DataFrame(data={"id": ["a"], "value": [1]}),
+        subject_column="id",
+        column_rules={"value": lambda subject, _object, store: "oops"}
+    )
+
+    with pytest.raises(TypeError, match="Rule for column 'value' must return"):
+        converter.to_graph()
+
+
+def test_term_cache_factory_error():
+    """Errors raised by the factory must surface after a single call."""
+    calls = []
+
+    def factory(value):
+        calls.append(value)
+        raise TypeError("factory error")
+
+    with pytest.raises(TypeError, match="factory error"):
+        TermCache(factory)("a")
+
+    assert calls == ["a"]
+    assert TermCache(len)(["unhashable"]) == 1
+
+
+def test_field_graph_converter_no_subject_cache():
+    """Subject caching can be disabled for stateful subject rules."""
+    counter = count()
+
+    converter = FieldGraphConverter(
+        dataframe=pd.DataFrame(data={"id": ["a", "a"], "value": [1, 2]}),
+        subject_column="id",
+        subject_rule=lambda value: URIRef(f"https://example.org/{value}/{next(counter)}"),
+        column_rules={
+            "value": lambda subject, _object, store: (subject, RDF.value, Literal(_object))
+        },
+        subject_cache_size=0
+    )
+
+    assert len(set(converter.to_graph().subjects())) == 2
+    assert converter.cache_info()["subjects"] is None
+
+
+def test_field_graph_converter_bnode_safe():
+    """Test for the FieldGraphConverter class with BNode-safe merging.
+
+    A blank node label shared by all field graphs must yield a blank node per field.
+    """
+    def bnode_rule(subject_field, object_field, store):
+        appellation = BNode("appellation")
+        yield (URIRef(f"https://{subject_field.lower()}.clscor.io"), CRM["P1_is_identified_by"], appellation)
+        yield (appellation, RDF.value, Literal(object_field))
+
+    converter = FieldGraphConverter(
+        dataframe=tables.cortab_partial_df,
+        subject_column="corpusAcronym",
+        column_rules={"corpusAcronym": bnode_rule, "corpusName": bnode_rule},
+        bnode_safe=True
+    )
+
+    graph = converter.to_graph()
+    fields = 2 * len(tables.cortab_partial_df)
+
+    assert len(set(graph.objects(predicate=CRM["P1_is_identified_by"]))) == fields
+    assert len(graph) == 2 * fields
+
+
+def test_field_graph_converter_bnode_safe_repeated_subjects():
+    """Field rules and ColumnRules must share the renamed subject of a row, also for repeated subjects."""
+    dataframe = pd.DataFrame(data={"id": ["a", "a"], "name": ["A", "B"], "label": ["x", "y"]})
+
+    converter = FieldGraphConverter(
+        dataframe=dataframe,
+        subject_column="id",
+        subject_rule=lambda value: BNode(value),
+        column_rules={
+            "name": lambda subject, _object, store: (subject, RDFS.label, Literal(_object)),
+            "label": literal_rule(RDFS.comment)
+        },
+        bnode_safe=True
+    )
+
+    graph = converter.to_graph()
+
+    assert {
+        (graph.value(subject, RDFS.label), graph.value(subject, RDFS.comment))
+        for subject in graph.subjects(unique=True)
+    } == {(Literal("A"), Literal("x")), (Literal("B"), Literal("y"))}
+
+
+def test_field_graph_converter_bnode_safe_subjects():
+    """Blank node subjects must be renamed once per row and shared by all fields of the row."""
+    dataframe = pd.DataFrame(data={"id": ["a", "b"], "name": ["A", "B"], "label": ["x", "y"]})
+
+    converter = FieldGraphConverter(
+        dataframe=dataframe,
+        subject_column="id",
+        subject_rule=lambda value: BNode(value),
+        column_rules={
+            "name": lambda subject, _object, store: (subject, RDFS.label, Literal(_object)),
+            "label": literal_rule(RDFS.comment)
+        },
+        bnode_safe=True
+    )
+
+    graph = converter.to_graph()
+    subjects = set(graph.subjects())
+
+    assert len(subjects) == 2
+    assert all(isinstance(subject, BNode) for subject in subjects)
+    assert all(
+        len(set(graph.predicates(subject))) == 2
+        for subject in subjects
+    )
@@ -1,8 +1,12 @@
 """Pytest entry point for RowGraphConverter tests."""
 
+import io
+
+import pytest
+
 from tabulardf import RowGraphConverter
 
-from rdflib import Graph, Literal, URIRef, Namespace
+from rdflib import BNode, Graph, Literal, URIRef, Namespace
 from rdflib.compare import isomorphic
 from rdflib.namespace import RDF
 
@@ -116,3 +120,82 @@ def test_row_graph_converter():
     target_graph = Graph().parse(targets_graphs_path / "cortab_name_acronym.ttl")
 
     assert isomorphic(generated_graph, target_graph)
+
+
+def test_row_graph_converter_serialize_to_stream():
+    """Test for RowGraphConverter.serialize_to_stream.
+
+    Stream N-Triples and check for graph isomorphism against a target graph.
+    """
+    converter = RowGraphConverter(
+        dataframe=tables.cortab_partial_df,
+        row_rule=row_raph_converter_rule
+    )
+
+    stream = io.StringIO()
+    converter.serialize_to_stream(stream, format="nt")
+
+    streamed_graph = Graph().parse(data=stream.getvalue(), format="nt")
+    target_graph = Graph().parse(targets_graphs_path / "cortab_name_acronym.ttl")
+
+    assert isomorphic(streamed_graph, target_graph)
+    # the graph component is not materialized
+    assert not converter.graph
+
+
+def test_row_graph_converter_triples_rule():
+    """Test for the RowGraphConverter class with a triple-yielding row_rule.
+
+    The row_rule yields bare triples instead of returning a graph.
+    """
+    def triples_row_rule(row_dict: dict):
+        yield from row_raph_converter_rule(row_dict)
+
+    converter = RowGraphConverter(
+        dataframe=tables.cortab_partial_df,
+        row_rule=triples_row_rule
+    )
+
+    generated_graph = converter.to_graph()
+    target_graph = Graph().parse(targets_graphs_path / "cortab_name_acronym.ttl")
+
+    assert isomorphic(generated_graph, target_graph)
+
+
+def test_row_graph_converter_bnode_safe():
+    """Test for the RowGraphConverter class with BNode-safe merging.
+
+    A blank node label shared by all row graphs must yield a blank node per row.
+    """
+    def bnode_row_rule(row_dict: dict):
+        appellation = BNode("appellation")
+        yield (appellation, RDF.type, CRM["E41_Appellation"])
+        yield (appellation, RDF.value, Literal(row_dict["corpusAcronym"]))
+
+    unsafe_graph = RowGraphConverter(
+        dataframe=tables.cortab_partial_df,
+        row_rule=bnode_row_rule
+    ).to_graph()
+
+    safe_graph = RowGraphConverter(
+        dataframe=tables.cortab_partial_df,
+        row_rule=bnode_row_rule,
+        bnode_safe=True
+    ).to_graph()
+
+    rows = len(tables.cortab_partial_df)
+
+    assert len(set(unsafe_graph.subjects())) == 1
+    assert len(set(safe_graph.subjects())) == rows
+    assert len(safe_graph) == 2 * rows
+
+
+def test_row_graph_converter_invalid_rule_result():
+    """Rule results other than graphs, triples, iterables of triples or None must raise a TypeError."""
+    converter = RowGraphConverter(
+        dataframe=tables.cortab_partial_df,
+        row_rule=lambda row_dict: Literal(row_dict["corpusAcronym"])
+    )
+
+    with pytest.raises(TypeError, match="row_rule must return"):
+        converter.to_graph()
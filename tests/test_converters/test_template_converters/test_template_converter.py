@@ -123,3 +123,56 @@ def test_get_jinja_template():
     assert isinstance(converter._get_jinja_template(input_str), Template)
     assert isinstance(converter._get_jinja_template(input_pathlike), Template)
     assert isinstance(converter._get_jinja_template(input_template), Template)
+
+
+def test_render_by_row_workers():
+    """Test for TemplateConverter.render_by_row with a process pool.
+
+    Parallel renderings must equal serial renderings in row order.
+    """
+    converter = TemplateConverter(
+        dataframe=tables.bookstore_df,
+        template=templates_path / "books_row.j2"
+    )
+
+    serial_renderings = list(converter.render_by_row())
+    parallel_renderings = list(converter.render_by_row(workers=2, chunksize=1))
+
+    assert parallel_renderings == serial_renderings
+
+
+def test_render_to_file_workers(tmp_path):
+    """Test for TemplateConverter.render_to_file with a process pool."""
+    converter = TemplateConverter(
+        dataframe=tables.bookstore_df,
+        template=templates_path / "books_row.j2"
+    )
+
+    output_path = tmp_path / "books.xml"
+    converter.render_to_file(output_path, render_strategy="row", workers=2)
+
+    assert output_path.read_text() == "".join(converter.render_by_row())
+
+
+def test_render_by_row_deduplicate_rows():
+    """Test for TemplateConverter.render_by_row with row deduplication.
+
+    Renderings must equal renderings without deduplication;
+    duplicate rows must be rendered only once.
+    """
+    dataframe = pd.concat([tables.bookstore_df] * 3, ignore_index=True)
+    template = templates_path / "books_row.j2"
+
+    converter = TemplateConverter(
+        dataframe=dataframe,
+        template=template,
+        deduplicate_rows=True
+    )
+
+    assert list(converter.render_by_row()) == list(
+        TemplateConverter(dataframe=dataframe, template=template).render_by_row()
+    )
+
+    stats = converter.deduplication_stats
+    assert (stats.rows, stats.renders) == (len(dataframe), len(tables.bookstore_df))
+    assert stats.saved == 2 * len(tables.bookstore_df)
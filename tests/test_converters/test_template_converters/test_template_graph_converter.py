@@ -1,8 +1,14 @@
 from itertools import count
-from rdflib import Graph
+
+import pandas as pd
+import pytest
+
+from jinja2 import Template
+from rdflib import Graph, URIRef
 from rdflib.compare import isomorphic
 
-from tabulardf import TemplateGraphConverter
+from tabulardf import TemplateGraphConverter, RenderingParseError
+from tabulardf.turtle_utils import join_turtle_renderings
 from tests.data import (
     tables,
     templates_path,
@@ -32,3 +38,153 @@ def test_cortab_name_acronym():
     target_graph = Graph().parse(source=targets_graphs_path / "cortab_name_acronym.ttl")
 
     assert isomorphic(converted_graph, target_graph)
+
+
+def test_cortab_name_acronym_batched():
+    """Test for the TemplateGraphConverter class with batched parsing.
+
+    Joined batch parsing must produce the same graph as per-row parsing.
+    """
+    converter = TemplateGraphConverter(
+        dataframe=tables.cortab_partial_df,
+        template=templates_path / "template_cortab_name_acronym.ttl",
+        parse_batch_size=10
+    )
+
+    converted_graph = converter.to_graph()
+    target_graph = Graph().parse(source=targets_graphs_path / "cortab_name_acronym.ttl")
+
+    assert isomorphic(converted_graph, target_graph)
+    assert dict(converted_graph.namespaces())["crm"] == URIRef(
+        "http://www.cidoc-crm.org/cidoc-crm/"
+    )
+
+
+def test_batched_parse_error_names_row():
+    """A failing batch is parsed per row and the error names the bad row."""
+    dataframe = pd.DataFrame(
+        data={"value": ["good", "bad", "good"]},
+        index=["a", "b", "c"]
+    )
+    template = Template(
+        "@prefix ex: <http://example.org/> .\n"
+        "{% if row_data['value'] == 'good' %}ex:s ex:p ex:o .{% else %}ex:s ex:p{% endif %}"
+    )
+
+    converter = TemplateGraphConverter(
+        dataframe=dataframe,
+        template=template,
+        parse_batch_size=3
+    )
+
+    with pytest.raises(RenderingParseError, match="row 'b'"):
+        converter.to_graph()
+
+
+def test_join_turtle_renderings():
+    """Test for turtle_utils.join_turtle_renderings."""
+    renderings = [
+        "@prefix ex: <http://example.org/> .\nex:a ex:p ex:o .",
+        "PREFIX ex: <http://example.org/>\nex:b ex:p ex:o ."
+    ]
+
+    data, prefixes = join_turtle_renderings(renderings)
+
+    assert prefixes == {"ex": "http://example.org/"}
+    assert data.count("prefix") == 1
+    assert len(Graph().parse(data=data, format="turtle")) == 2
+
+    # conflicting prefixes and blank node labels cannot be joined
+    assert join_turtle_renderings(
+        ["@prefix ex: <http://example.org/> .", "@prefix ex: <http://example.com/> ."]
+    ) is None
+    assert join_turtle_renderings(["_:b1 <http://example.org/p> 1 ."]) is None
+
+    # prefix declarations sharing a line are not hoisted, so they cannot be joined
+    assert join_turtle_renderings(
+        ["@prefix ex: <http://example.org/> . @prefix ex2: <http://example.com/> .\nex:a ex:p ex2:o ."]
+    ) is None
+    assert join_turtle_renderings(
+        ["@prefix ex: <http://example.org/> .\nex:a ex:p ex:o . PREFIX ex: <http://example.com/>"]
+    ) is None
+
+
+def test_cortab_name_acronym_deduplicate_rows():
+    """Test for the TemplateGraphConverter class with row deduplication.
+
+    Renderings of duplicate rows are not parsed,
+    the graph must equal the graph of the distinct rows.
+    """
+    converter = TemplateGraphConverter(
+        dataframe=pd.concat([tables.cortab_partial_df] * 2, ignore_index=True),
+        template=templates_path / "template_cortab_name_acronym.ttl",
+        data={"utils": {"counter": counter}},
+        deduplicate_rows=True
+    )
+
+    converted_graph = converter.to_graph()
+    target_graph = Graph().parse(source=targets_graphs_path / "cortab_name_acronym.ttl")
+
+    assert isomorphic(converted_graph, target_graph)
+    assert converter.deduplication_stats.saved == len(tables.cortab_partial_df)
+
+
+def test_cortab_name_acronym_ntriples():
+    """Test for the TemplateGraphConverter class with N-Triples renderings.
+
+    N-Triples renderings are parsed with the line parser,
+    the graph must equal the graph of the equivalent Turtle template.
+    """
+    converter = TemplateGraphConverter(
+        dataframe=tables.cortab_partial_df,
+        template=templates_path / "template_cortab_name_acronym.nt",
+        input_format="nt",
+        parse_batch_size=10
+    )
+
+    converted_graph = converter.to_graph()
+    target_graph = Graph().parse(source=targets_graphs_path / "cortab_name_acronym.ttl")
+
+    assert isomorphic(converted_graph, target_graph)
+
+
+def test_ntriples_passthrough(tmp_path):
+    """N-Triples renderings must be passed through verbatim by serialize_to_stream.
+
+    Blank node labels are scoped to a row also for passed through renderings.
+    """
+    template = Template(
+        "<https://example.org/{{ row_data['id'] }}> <https://example.org/p> _:b .\n"
+        "_:b <https://example.org/q> \"{{ row_data['id'] }}\" ."
+    )
+    dataframe = pd.DataFrame(data={"id": ["a", "b"]})
+    converter = TemplateGraphConverter(dataframe=dataframe, template=template, input_format="nt")
+
+    converter.serialize_to_stream(tmp_path / "out.nt")
+    graph = Graph().parse(tmp_path / "out.nt", format="nt")
+
+    assert len(graph) == 4
+    assert len(set(graph.objects(None, URIRef("https://example.org/p")))) == 2
+
+    converter = TemplateGraphConverter(
+        dataframe=tables.cortab_partial_df,
+        template=templates_path / "template_cortab_name_acronym.nt",
+        input_format="nt"
+    )
+    converter.serialize_to_stream(tmp_path / "cortab.nt")
+
+    assert "\n".join(converter.render_by_row()).split() == (
+        (tmp_path / "cortab.nt").read_text().split()
+    )
+
+
+def test_ntriples_parse_error():
+    """Invalid N-Triples renderings must raise a RenderingParseError naming the row."""
+    converter = TemplateGraphConverter(
+        dataframe=pd.DataFrame(data={"id": ["a", "b c"]}),
+        template=Template("<https://example.org/{{ row_data['id'] }}> a <https://example.org/C> ."),
+        input_format="nt"
+    )
+
+    with pytest.raises(RenderingParseError, match="position 0"):
+        converter.to_graph()
@@ -0,0 +1,75 @@
+"""Pytest entry point for tabulardf.template_environment tests."""
+
+import os
+
+import pytest
+
+from tabulardf import TemplateConverter
+from tabulardf.template_environment import (
+    CACHE_DIR_ENV_VAR,
+    clear_environments,
+    get_bytecode_cache,
+    get_environment
+)
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    """Point the TabulaRDF cache to a temporary directory and reset the registry."""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv(CACHE_DIR_ENV_VAR, str(cache_dir))
+
+    clear_environments()
+    yield cache_dir
+    clear_environments()
+
+
+@pytest.fixture
+def template_path(tmp_path):
+    """Write a template file."""
+    template_path = tmp_path / "templates" / "template.j2"
+    template_path.parent.mkdir()
+    template_path.write_text("{{ row_data['x'] }}")
+
+    return template_path
+
+
+def test_shared_environment(cache_dir, template_path):
+    """Templates from the same directory must share an environment."""
+    template_1 = TemplateConverter._get_jinja_template_from_path(template_path)
+    template_2 = TemplateConverter._get_jinja_template_from_path(template_path)
+
+    assert template_1.environment is template_2.environment
+    assert template_1.environment is get_environment(template_path.parent)
+    # compiled templates are reused
+    assert template_1 is template_2
+
+
+def test_bytecode_cache(cache_dir, template_path):
+    """Compiled templates must be cached on disk and recompiled on change."""
+    TemplateConverter._get_jinja_template_from_path(template_path)
+
+    cache_files = list((cache_dir / "jinja").iterdir())
+    assert len(cache_files) == 1
+
+    # a new process (i.e. an empty registry) loads the bytecode from disk
+    clear_environments()
+    template = TemplateConverter._get_jinja_template_from_path(template_path)
+    assert template.render(row_data={"x": 1}) == "1"
+
+    # changed source invalidates the cached bytecode
+    template_path.write_text("{{ row_data['x'] + 1 }}")
+    stat = template_path.stat()
+    os.utime(template_path, (stat.st_atime, stat.st_mtime + 1))
+
+    template = TemplateConverter._get_jinja_template_from_path(template_path)
+    assert template.render(row_data={"x": 1}) == "2"
+
+
+def test_bytecode_cache_disabled(monkeypatch):
+    """The bytecode cache is opt-in; an unset or empty cache directory setting disables it."""
+    monkeypatch.delenv(CACHE_DIR_ENV_VAR, raising=False)
+    assert get_bytecode_cache() is None
+
+    monkeypatch.setenv(CACHE_DIR_ENV_VAR, "")
+    assert get_bytecode_cache() is None
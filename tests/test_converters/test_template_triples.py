@@ -0,0 +1,155 @@
+"""Pytest entry point for tabulardf.template_triples tests."""
+
+import pandas as pd
+import pytest
+
+from jinja2 import Template
+from rdflib import BNode, Graph, Literal, URIRef
+from rdflib.compare import isomorphic
+from rdflib.namespace import RDF, RDFS
+
+from tabulardf import TemplateConverter, TemplateGraphConverter
+from tabulardf.incremental import IncrementalCache
+from tabulardf.template_triples import (
+    TRIPLE_SINK_NAME,
+    TripleExtension,
+    TripleSink,
+    get_triple
+)
+
+
+dataframe = pd.DataFrame(
+    data=[
+        {"id": "rem", "title": "Reference corpus Middle High German"},
+        {"id": "swedracor", "title": None},
+    ]
+)
+
+turtle_template = Template(
+    """
+    @prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+    <https://example.org/{{ row_data['id'] }}> a rdfs:Resource .
+    {% if row_data['title'] %}
+    <https://example.org/{{ row_data['id'] }}> rdfs:label "{{ row_data['title'] }}" .
+    {% endif %}
+    """
+)
+
+triple_template = Template(
+    """
+    {% set subject = uri("https://example.org/" ~ row_data['id']) %}
+    {% triple subject, rdf.type, rdfs.Resource %}
+    {% triple subject, rdfs.label, row_data['title'] %}
+    """,
+    extensions=[TripleExtension]
+)
+
+data = {"rdf": RDF, "rdfs": RDFS}
+
+
+def test_get_triple():
+    """Non-term values must be coerced to IRIs or literals; missing values skip triples."""
+    assert get_triple("https://example.org/s", str(RDFS.label), 1) == (
+        URIRef("https://example.org/s"), RDFS.label, Literal(1)
+    )
+    assert get_triple(URIRef("https://example.org/s"), RDF.type, float("nan")) is None
+    assert get_triple(None, RDF.type, RDFS.Resource) is None
+
+
+def test_triple_tag_graph_converter():
+    """Triples emitted by the triple tag must equal parsed Turtle renderings."""
+    converter = TemplateGraphConverter(
+        dataframe=dataframe,
+        template=triple_template,
+        data=dict(data),
+        parse_batch_size=10
+    )
+    target_converter = TemplateGraphConverter(dataframe=dataframe, template=turtle_template)
+
+    assert isomorphic(converter.to_graph(), target_converter.to_graph())
+    assert "triple" not in converter.data
+
+
+def test_triple_tag_user_data():
+    """A 'triple' defined in the data context must be kept; the triple tag must still emit triples."""
+    converter = TemplateGraphConverter(
+        dataframe=dataframe,
+        template=triple_template,
+        data={**data, "triple": "user value"}
+    )
+    target_converter = TemplateGraphConverter(dataframe=dataframe, template=turtle_template)
+
+    assert isomorphic(converter.to_graph(), target_converter.to_graph())
+    assert converter.data["triple"] == "user value"
+
+    with pytest.raises(ValueError):
+        TemplateGraphConverter(
+            dataframe=dataframe,
+            template=triple_template,
+            data={TRIPLE_SINK_NAME: None}
+        ).to_graph()
+
+
+def test_triple_function_mixed_rendering():
+    """The triple function must work without the extension and alongside rendering text."""
+    template = Template(
+        """
+        @prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+        <https://example.org/{{ row_data['id'] }}> a rdfs:Resource .
+        {{ triple("https://example.org/" ~ row_data['id'], rdfs.label, row_data['title']) }}
+        """
+    )
+    converter = TemplateGraphConverter(dataframe=dataframe, template=template, data=dict(data))
+    target_converter = TemplateGraphConverter(dataframe=dataframe, template=turtle_template)
+
+    assert isomorphic(converter.to_graph(), target_converter.to_graph())
+
+
+def test_triple_tag_bnodes():
+    """Blank nodes minted with bnode must be distinct per row."""
+    template = Template(
+        "{% set node = bnode() %}"
+        "{% triple uri('https://example.org/' ~ row_data['id']), rdfs.seeAlso, node %}"
+        "{% triple node, rdfs.label, row_data['id'] %}",
+        extensions=[TripleExtension]
+    )
+    graph = TemplateGraphConverter(dataframe=dataframe, template=template, data=dict(data)).to_graph()
+
+    assert len(set(graph.objects(None, RDFS.seeAlso))) == 2
+    assert all(isinstance(node, BNode) for node in graph.objects(None, RDFS.seeAlso))
+
+
+def test_triple_tag_ntriples_rendering():
+    """Without a triple sink, the triple tag must render N-Triples lines."""
+    converter = TemplateConverter(dataframe=dataframe, template=triple_template, data=dict(data))
+    graph = Graph().parse(data="".join(converter.render_by_row()), format="nt")
+    target_graph = TemplateGraphConverter(dataframe=dataframe, template=turtle_template).to_graph()
+
+    assert isomorphic(graph, target_graph)
+
+
+def test_triple_tag_incremental(tmp_path):
+    """Directly emitted triples must be cached and reloaded in incremental mode."""
+    cache = IncrementalCache(tmp_path / "cache.sqlite", key_column="id")
+    target_graph = TemplateGraphConverter(dataframe=dataframe, template=turtle_template).to_graph()
+
+    for _ in range(2):
+        converter = TemplateGraphConverter(
+            dataframe=dataframe,
+            template=triple_template,
+            data=dict(data),
+            incremental=cache
+        )
+
+        assert isomorphic(converter.to_graph(), target_graph)
+
+    assert converter.incremental_stats.unchanged == 2
+
+
+def test_triple_sink():
+    """TripleSink.take must return and clear collected triples."""
+    sink = TripleSink()
+
+    assert sink.triple("https://example.org/s", RDF.type, RDFS.Resource) == ""
+    assert len(sink.take()) == 1
+    assert sink.take() == []
@@ -0,0 +1,103 @@
+"""Pytest entry point for tabulardf.triple_buffer tests."""
+
+import io
+
+import pandas as pd
+
+from rdflib import BNode, Graph, Literal, Namespace
+from rdflib.compare import isomorphic
+from rdflib.namespace import RDF
+
+from tabulardf import FieldGraphConverter, RowGraphConverter, TemplateGraphConverter
+from tabulardf.triple_buffer import TripleBuffer
+from tests.data import tables, templates_path
+
+
+EX = Namespace("http://example.org/")
+
+bnode = BNode()
+
+triples = [
+    (EX.b, EX.p, Literal(1)),
+    (EX.a, RDF.type, EX.C),
+    (EX.b, EX.p, Literal(1)),
+    (EX.a, EX.p, bnode),
+    (bnode, EX.p, Literal("x", lang="en")),
+    (EX.a, RDF.type, EX.C),
+]
+
+
+def test_triple_buffer_interning():
+    """Distinct terms must be stored once; triples must be decoded in buffer order."""
+    buffer = TripleBuffer(triples)
+
+    assert len(buffer) == len(triples)
+    assert buffer.term_count == 8
+    assert list(buffer) == triples
+
+
+def test_triple_buffer_deduplicate():
+    """Duplicates must be removed, keeping first occurrences in buffer order."""
+    buffer = TripleBuffer(triples)
+
+    assert buffer.deduplicate() == 2
+    assert list(buffer) == [triples[0], triples[1], triples[3], triples[4]]
+    assert buffer.deduplicate() == 0
+
+
+def test_triple_buffer_sort():
+    """Sorting must group triples by subject in order of first occurrence."""
+    buffer = TripleBuffer(triples)
+    buffer.sort()
+
+    assert [s for s, _, _ in buffer] == [EX.b, EX.b, EX.a, EX.a, EX.a, bnode]
+
+
+def test_triple_buffer_flush():
+    """Graphs and serializations of a buffer must equal a graph of its triples."""
+    buffer = TripleBuffer(triples)
+    target_graph = Graph()
+
+    for triple in triples:
+        target_graph.add(triple)
+
+    assert isomorphic(buffer.to_graph(), target_graph)
+
+    for format, parse_format in [("nt", "nt"), ("ttl", "turtle")]:
+        stream = io.BytesIO()
+        buffer.dump(stream, format=format, namespaces=[("ex", EX)])
+
+        assert isomorphic(Graph().parse(data=stream.getvalue(), format=parse_format), target_graph)
+
+
+def test_converters_to_buffer():
+    """Converters must accumulate the triples of to_graph into a shared buffer."""
+    dataframe = pd.DataFrame({"id": ["a", "b"], "label": ["A", "B"]})
+    template_kwargs = {
+        "dataframe": tables.cortab_partial_df,
+        "template": templates_path / "template_cortab_name_acronym.ttl"
+    }
+    converters = [
+        lambda: TemplateGraphConverter(**template_kwargs),
+        lambda: RowGraphConverter(
+            dataframe,
+            row_rule=lambda row: (EX[row["id"]], RDF.type, EX.C)
+        ),
+        lambda: FieldGraphConverter(
+            dataframe,
+            subject_column="id",
+            subject_rule=EX,
+            column_rules={"label": lambda s, o, store: (s, EX.label, Literal(o))}
+        )
+    ]
+
+    buffer, target_graph = TripleBuffer(), Graph()
+
+    for get_converter in converters:
+        converter = get_converter()
+        converter.to_buffer(buffer)
+        target_graph += get_converter().to_graph()
+
+        assert not converter.graph
+
+    assert isomorphic(buffer.to_graph(), target_graph)